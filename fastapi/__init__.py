@@ -2,24 +2,70 @@
 
 __version__ = "0.116.1"
 
+from typing import TYPE_CHECKING, Any, List
+
 from starlette import status as status
 
-from .applications import FastAPI as FastAPI
-from .background import BackgroundTasks as BackgroundTasks
-from .datastructures import UploadFile as UploadFile
-from .exceptions import HTTPException as HTTPException
-from .exceptions import WebSocketException as WebSocketException
-from .param_functions import Body as Body
-from .param_functions import Cookie as Cookie
-from .param_functions import Depends as Depends
-from .param_functions import File as File
-from .param_functions import Form as Form
-from .param_functions import Header as Header
-from .param_functions import Path as Path
-from .param_functions import Query as Query
-from .param_functions import Security as Security
-from .requests import Request as Request
-from .responses import Response as Response
-from .routing import APIRouter as APIRouter
-from .websockets import WebSocket as WebSocket
-from .websockets import WebSocketDisconnect as WebSocketDisconnect
+if TYPE_CHECKING:
+    from .applications import FastAPI as FastAPI
+    from .background import BackgroundTasks as BackgroundTasks
+    from .datastructures import UploadFile as UploadFile
+    from .exceptions import HTTPException as HTTPException
+    from .exceptions import WebSocketException as WebSocketException
+    from .param_functions import Body as Body
+    from .param_functions import Cookie as Cookie
+    from .param_functions import Depends as Depends
+    from .param_functions import File as File
+    from .param_functions import Form as Form
+    from .param_functions import Header as Header
+    from .param_functions import Path as Path
+    from .param_functions import Query as Query
+    from .param_functions import Security as Security
+    from .requests import Request as Request
+    from .responses import Response as Response
+    from .routing import APIRouter as APIRouter
+    from .websockets import WebSocket as WebSocket
+    from .websockets import WebSocketDisconnect as WebSocketDisconnect
+
+# The module of each name, only imported when the name is first used, so that
+# importing a single module, e.g. fastapi.encoders, doesn't import the
+# applications, the routing, the OpenAPI models, etc.
+_lazy_imports = {
+    "FastAPI": "applications",
+    "BackgroundTasks": "background",
+    "UploadFile": "datastructures",
+    "HTTPException": "exceptions",
+    "WebSocketException": "exceptions",
+    "Body": "param_functions",
+    "Cookie": "param_functions",
+    "Depends": "param_functions",
+    "File": "param_functions",
+    "Form": "param_functions",
+    "Header": "param_functions",
+    "Path": "param_functions",
+    "Query": "param_functions",
+    "Security": "param_functions",
+    "Request": "requests",
+    "Response": "responses",
+    "APIRouter": "routing",
+    "WebSocket": "websockets",
+    "WebSocketDisconnect": "websockets",
+}
+
+__all__ = ["status", *_lazy_imports]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # With __import__(), as the import statement, and not importlib, so that it
+    # shows up with python -X importtime
+    module = __import__(module_name, globals(), level=1, fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_imports})
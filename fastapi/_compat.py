@@ -1,4 +1,5 @@
-from collections import deque
+import threading
+from collections import OrderedDict, deque
 from copy import copy
 from dataclasses import dataclass, is_dataclass
 from enum import Enum
@@ -9,8 +10,10 @@ from typing import (
     Deque,
     Dict,
     FrozenSet,
+    Hashable,
     List,
     Mapping,
+    Optional,
     Sequence,
     Set,
     Tuple,
@@ -24,7 +27,7 @@ from fastapi.types import IncEx, ModelNameMap, UnionType
 from pydantic import BaseModel, create_model
 from pydantic.version import VERSION as PYDANTIC_VERSION
 from starlette.datastructures import UploadFile
-from typing_extensions import Annotated, Literal, get_args, get_origin
+from typing_extensions import Annotated, Literal, TypedDict, get_args, get_origin
 
 PYDANTIC_VERSION_MINOR_TUPLE = tuple(int(x) for x in PYDANTIC_VERSION.split(".")[:2])
 PYDANTIC_V2 = PYDANTIC_VERSION_MINOR_TUPLE[0] == 2
@@ -85,6 +88,123 @@ if PYDANTIC_V2:
     class ErrorWrapper(Exception):
         pass
 
+    # FieldInfo attributes only used to build the fields of models, they don't
+    # change the TypeAdapter
+    _TYPE_ADAPTER_KEY_ATTRIBUTES = tuple(
+        name
+        for name in FieldInfo.__slots__
+        if name not in {"_original_assignment", "_original_annotation"}
+    )
+    _SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+    def _freeze(value: Any) -> Hashable:
+        # An equivalent hashable value, with the types, so that e.g. 1 and True, or
+        # Union[int, str] and Union[str, int], are different keys. It raises
+        # TypeError for unhashable values
+        value_type = type(value)
+        if value_type in _SCALAR_TYPES or isinstance(value, type):
+            return (value_type, value)
+        if isinstance(value, dict):
+            return (
+                value_type,
+                tuple((_freeze(key), _freeze(item)) for key, item in value.items()),
+            )
+        if isinstance(value, (list, tuple)):
+            return (value_type, tuple(_freeze(item) for item in value))
+        if isinstance(value, (set, frozenset)):
+            return (value_type, frozenset(_freeze(item) for item in value))
+        origin = get_origin(value)
+        if origin is not None:
+            return (origin, tuple(_freeze(arg) for arg in get_args(value)))
+        hash(value)
+        return (value_type, value)
+
+    def _get_type_adapter_key(field_info: FieldInfo) -> Optional[Hashable]:
+        try:
+            return (
+                type(field_info),
+                tuple(
+                    _freeze(getattr(field_info, name, None))
+                    for name in _TYPE_ADAPTER_KEY_ATTRIBUTES
+                ),
+                # Attributes of FastAPI's subclasses, like Query.include_in_schema
+                tuple(
+                    (name, _freeze(value))
+                    for name, value in getattr(field_info, "__dict__", {}).items()
+                ),
+            )
+        except TypeError:
+            return None
+
+    @dataclass(frozen=True)
+    class TypeAdapterCacheStats:
+        hits: int
+        misses: int
+        evictions: int
+        size: int
+        # Fields that could not use the cache, e.g. with an unhashable default
+        uncacheable: int
+
+    class TypeAdapterCache:
+        """
+        The TypeAdapters of the ModelFields, shared by the fields with the same
+        annotation and an equivalent FieldInfo, like the same query parameter or
+        body model in many path operations, to build their core schema, validator
+        and serializer only once.
+
+        It keeps up to `max_size` TypeAdapters, the least recently used are
+        evicted first.
+        """
+
+        def __init__(self, *, max_size: int = 4096) -> None:
+            self.max_size = max_size
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.uncacheable = 0
+            self._adapters: OrderedDict[Hashable, TypeAdapter[Any]] = OrderedDict()
+            self._lock = threading.Lock()
+
+        @property
+        def stats(self) -> TypeAdapterCacheStats:
+            return TypeAdapterCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._adapters),
+                uncacheable=self.uncacheable,
+            )
+
+        def clear(self) -> None:
+            with self._lock:
+                self._adapters.clear()
+
+        def get(self, field_info: FieldInfo) -> TypeAdapter[Any]:
+            key = _get_type_adapter_key(field_info)
+            if key is None:
+                with self._lock:
+                    self.uncacheable += 1
+                return TypeAdapter(Annotated[field_info.annotation, field_info])
+            with self._lock:
+                adapter = self._adapters.get(key)
+                if adapter is not None:
+                    self._adapters.move_to_end(key)
+                    self.hits += 1
+                    return adapter
+                self.misses += 1
+            # Built without the lock, it can take a while, if another thread built
+            # the same one in the meantime, that one is used
+            adapter = TypeAdapter(Annotated[field_info.annotation, field_info])
+            with self._lock:
+                adapter = self._adapters.setdefault(key, adapter)
+                self._adapters.move_to_end(key)
+                while len(self._adapters) > self.max_size:
+                    self._adapters.popitem(last=False)
+                    self.evictions += 1
+            return adapter
+
+    type_adapter_cache = TypeAdapterCache()
+
     @dataclass
     class ModelField:
         field_info: FieldInfo
@@ -109,8 +229,8 @@ if PYDANTIC_V2:
             return self.field_info.annotation
 
         def __post_init__(self) -> None:
-            self._type_adapter: TypeAdapter[Any] = TypeAdapter(
-                Annotated[self.field_info.annotation, self.field_info]
+            self._type_adapter: TypeAdapter[Any] = type_adapter_cache.get(
+                self.field_info
             )
 
         def get_default(self) -> Any:
@@ -135,6 +255,19 @@ if PYDANTIC_V2:
                     errors=exc.errors(include_url=False), loc_prefix=loc
                 )
 
+        def validate_json(
+            self,
+            value: Union[str, bytes],
+            *,
+            loc: Tuple[Union[int, str], ...] = (),
+        ) -> Tuple[Any, Union[List[Dict[str, Any]], None]]:
+            try:
+                return self._type_adapter.validate_json(value), None
+            except ValidationError as exc:
+                return None, _regenerate_error_with_loc(
+                    errors=exc.errors(include_url=False), loc_prefix=loc
+                )
+
         def serialize(
             self,
             value: Any,
@@ -146,9 +279,11 @@ if PYDANTIC_V2:
             exclude_unset: bool = False,
             exclude_defaults: bool = False,
             exclude_none: bool = False,
+            warnings: bool = True,
         ) -> Any:
             # What calls this code passes a value that already called
-            # self._type_adapter.validate_python(value)
+            # self._type_adapter.validate_python(value), unless response
+            # validation was skipped, then warnings is False
             return self._type_adapter.dump_python(
                 value,
                 mode=mode,
@@ -158,6 +293,31 @@ if PYDANTIC_V2:
                 exclude_unset=exclude_unset,
                 exclude_defaults=exclude_defaults,
                 exclude_none=exclude_none,
+                warnings=warnings,
+            )
+
+        def serialize_json(
+            self,
+            value: Any,
+            *,
+            include: Union[IncEx, None] = None,
+            exclude: Union[IncEx, None] = None,
+            by_alias: bool = True,
+            exclude_unset: bool = False,
+            exclude_defaults: bool = False,
+            exclude_none: bool = False,
+            warnings: bool = True,
+        ) -> bytes:
+            # The same as serialize(), but directly to JSON bytes
+            return self._type_adapter.dump_json(
+                value,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                warnings=warnings,
             )
 
         def __hash__(self) -> int:
@@ -292,6 +452,40 @@ if PYDANTIC_V2:
             for name, field_info in model.model_fields.items()
         ]
 
+    def create_params_type_adapter(*, fields: Sequence[ModelField], name: str) -> Any:
+        # A TypedDict with a key per field name, validating each value exactly as
+        # the field's own TypeAdapter. Missing values, defaults, and aliases are
+        # handled before, so they are removed from the copied FieldInfo
+        field_types: Dict[str, Any] = {}
+        for field in fields:
+            field_info = copy(field.field_info)
+            field_info.default = PydanticUndefined
+            field_info.default_factory = None
+            field_info.alias = None
+            field_info.validation_alias = None
+            field_info.serialization_alias = None
+            field_types[field.name] = Annotated[field.field_info.annotation, field_info]
+        return TypeAdapter(TypedDict(name, field_types, total=False))  # type: ignore[operator]
+
+    def can_validate_json(field: ModelField) -> bool:
+        # Validating the JSON bytes gives the same result as validating the parsed
+        # data, unless something is strict (it accepts JSON strings for e.g.
+        # datetimes and UUIDs, but not Python strings) or a validator receives the
+        # info, with the validation mode, that could depend on it
+        pending: List[Any] = [field._type_adapter.core_schema]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                if value.get("strict") is True:
+                    return False
+                function = value.get("function")
+                if isinstance(function, dict) and function.get("type") == "with-info":
+                    return False
+                pending.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                pending.extend(value)
+        return True
+
 else:
     from fastapi.openapi.constants import REF_PREFIX as REF_PREFIX
     from pydantic import AnyUrl as Url  # noqa: F401
@@ -530,6 +724,13 @@ else:
     def get_model_fields(model: Type[BaseModel]) -> List[ModelField]:
         return list(model.__fields__.values())  # type: ignore[attr-defined]
 
+    def create_params_type_adapter(*, fields: Sequence[ModelField], name: str) -> Any:
+        # Not supported, each field is validated separately
+        return None
+
+    def can_validate_json(field: ModelField) -> bool:
+        return False
+
 
 def _regenerate_error_with_loc(
     *, errors: Sequence[Any], loc_prefix: Tuple[Union[str, int], ...]
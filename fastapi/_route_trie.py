@@ -0,0 +1,107 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starlette.convertors import (
+    FloatConvertor,
+    IntegerConvertor,
+    StringConvertor,
+    UUIDConvertor,
+)
+from starlette.routing import BaseRoute
+
+# Convertors whose regex can never match a "/", so a parameter using them is
+# always contained in a single path segment. Anything else (e.g. `path` or custom
+# convertors) could span several segments.
+_SEGMENT_CONVERTORS = (StringConvertor, IntegerConvertor, FloatConvertor, UUIDConvertor)
+
+_PARAM_NAME_RE = re.compile(r"{([^}]+)}")
+
+
+class _Node:
+    __slots__ = ("static", "dynamic", "catch_all", "leaf")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, _Node] = {}
+        self.dynamic: Optional[_Node] = None
+        # Indexes of routes that match anything below this node
+        self.catch_all: List[int] = []
+        # Indexes of routes whose path ends exactly at this node
+        self.leaf: List[int] = []
+
+
+class RouteTrie:
+    """
+    A segment trie over the routes of a router, built from each route's
+    `path_format` and `param_convertors`.
+
+    The trie is only used to narrow down the routes that *could* match a path, in
+    O(path depth). The candidates are returned in the same order as in `routes`,
+    and the router still calls `route.matches()` on each of them, so precedence,
+    path convertors, 405 (partial) matches and `Mount`s behave exactly as with a
+    linear scan over all the routes.
+
+    Routes that can't be indexed by path (e.g. `Host` routes or custom routes
+    without a `path_format`) are returned as candidates for every path.
+    """
+
+    def __init__(self, routes: Sequence[BaseRoute]) -> None:
+        self.routes = routes
+        self.size = len(routes)
+        self._root = _Node()
+        self._fallback: List[int] = []
+        for index, route in enumerate(routes):
+            self._insert(index, route)
+
+    def is_stale(self, routes: Sequence[BaseRoute]) -> bool:
+        return routes is not self.routes or len(routes) != self.size
+
+    def _insert(self, index: int, route: BaseRoute) -> None:
+        path_format = getattr(route, "path_format", None)
+        convertors = getattr(route, "param_convertors", None)
+        if (
+            not isinstance(path_format, str)
+            or not path_format.startswith("/")
+            or not isinstance(convertors, dict)
+        ):
+            self._fallback.append(index)
+            return
+        node = self._root
+        for segment in path_format[1:].split("/"):
+            param_names = _PARAM_NAME_RE.findall(segment)
+            if not param_names:
+                node = node.static.setdefault(segment, _Node())
+                continue
+            if not all(
+                isinstance(convertors.get(name), _SEGMENT_CONVERTORS)
+                for name in param_names
+            ):
+                node.catch_all.append(index)
+                return
+            if node.dynamic is None:
+                node.dynamic = _Node()
+            node = node.dynamic
+        node.leaf.append(index)
+
+    def get_candidates(self, route_path: str) -> List[BaseRoute]:
+        # A regex "$" also matches before a trailing newline, don't try to replicate
+        # that, check all the routes instead
+        if not route_path.startswith("/") or route_path.endswith("\n"):
+            return list(self.routes)
+        segments = route_path[1:].split("/")
+        depth_limit = len(segments)
+        found = list(self._fallback)
+        stack: List[Tuple[_Node, int]] = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            found.extend(node.catch_all)
+            if depth == depth_limit:
+                found.extend(node.leaf)
+                continue
+            static_child = node.static.get(segments[depth])
+            if static_child is not None:
+                stack.append((static_child, depth + 1))
+            if node.dynamic is not None:
+                stack.append((node.dynamic, depth + 1))
+        found.sort()
+        routes = self.routes
+        return [routes[index] for index in found]
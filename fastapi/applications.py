@@ -1,10 +1,15 @@
+import gc
+import threading
+from contextlib import asynccontextmanager, nullcontext
 from enum import Enum
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -15,6 +20,7 @@ from typing import (
 
 from fastapi import routing
 from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.dependencies.utils import AppDependencyCache, build_params_validators
 from fastapi.exception_handlers import (
     http_exception_handler,
     request_validation_exception_handler,
@@ -29,6 +35,9 @@ from fastapi.openapi.docs import (
 )
 from fastapi.openapi.utils import get_openapi
 from fastapi.params import Depends
+from fastapi.response_cache import ResponseCache
+from fastapi.response_validation import ResponseValidation
+from fastapi.startup_profile import StartupProfile
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import generate_unique_id
 from starlette.applications import Starlette
@@ -38,13 +47,21 @@ from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
-from starlette.routing import BaseRoute
+from starlette.routing import BaseRoute, Host, Mount
 from starlette.types import ASGIApp, Lifespan, Receive, Scope, Send
 from typing_extensions import Annotated, Doc, deprecated
 
 AppType = TypeVar("AppType", bound="FastAPI")
 
 
+def _iter_routes(routes: Sequence[BaseRoute]) -> Iterator[BaseRoute]:
+    # The routes, and the routes of the apps and routers mounted, recursively
+    for route in routes:
+        yield route
+        if isinstance(route, (Mount, Host)):
+            yield from _iter_routes(route.routes)
+
+
 class FastAPI(Starlette):
     """
     `FastAPI` app class, the main entrypoint to use FastAPI.
@@ -810,6 +827,139 @@ class FastAPI(Starlette):
                 """
             ),
         ] = True,
+        route_trie: Annotated[
+            bool,
+            Doc(
+                """
+                Dispatch requests using a segment trie built from the routes,
+                instead of checking every route in order until one matches.
+
+                The precedence of routes, `405 Method Not Allowed` responses,
+                mounted apps and redirects of slashes work the same way, but the
+                cost of finding a route depends on the depth of the path instead of
+                the number of routes. This is useful for apps with many routes.
+                """
+            ),
+        ] = False,
+        lazy_routes: Annotated[
+            bool,
+            Doc(
+                """
+                Defer building the dependencies, the request body and the response
+                models of each *path operation* until it's first used, by a
+                request or to generate the OpenAPI schema, instead of doing it when
+                it's declared. This makes startup faster for apps with many routes,
+                e.g. for serverless deployments.
+
+                The *path operations* included from an `APIRouter` are deferred
+                too, create the router with `lazy_routes=True` to also defer the
+                ones declared in it.
+
+                Errors in the declaration of a *path operation* are then only
+                raised when it's first used, call `app.warmup()` to build all of
+                them ahead of time.
+                """
+            ),
+        ] = False,
+        startup_profile: Annotated[
+            Union[bool, StartupProfile],
+            Doc(
+                """
+                Record the time and memory spent building each *path operation*:
+                its dependencies (`get_dependant`), its response fields
+                (`create_model_field` and `create_cloned_field`), its request body
+                (`get_body_field`) and the rest, and generating the OpenAPI schema.
+
+                The `StartupProfile` is available in `app.startup_profile`, use
+                `app.startup_profile.format_table()` or
+                `app.startup_profile.to_json()` to get a report of the slowest
+                ones. Pass a `StartupProfile` to configure it, or to share it with
+                the routers.
+
+                The memory is traced with `tracemalloc`, that makes the app slower,
+                call `app.startup_profile.stop()` once the app has started.
+                """
+            ),
+        ] = False,
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of the *path operations*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only
+                depend on other `async def` functions, run at the same time in a
+                task group. The dependency cache of the request is kept, a cached
+                dependency is still called only once.
+
+                Context variables set by the dependencies that run concurrently, in
+                the task group, are not kept: they are not set for the *path
+                operation function* nor for the other dependencies.
+
+                It can be overridden in each router and *path operation*.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response models of the *path operations* directly to
+                JSON bytes with Pydantic, instead of converting them to
+                JSON-compatible Python data first and then rendering them with
+                `json.dumps()`.
+
+                It's only used with Pydantic v2, when there's a `response_model` and
+                the response class renders JSON as `JSONResponse` does.
+
+                It can be overridden in each router and *path operation*.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operations* against
+                their `response_model`: `"always"`, `"type-check-only"`,
+                `sampled(rate)` (from `fastapi.response_validation`), or `"never"`.
+
+                Skipping the validation saves a full validation pass per response
+                made of instances of the `response_model`. Other data, e.g. dicts,
+                is still validated, as the `response_model` can't filter it
+                otherwise.
+
+                It can be overridden in each router and *path operation*.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the
+                rendered responses of the *path operations* and send them again for
+                the same requests.
+
+                It can be overridden in each router and *path operation*.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses of the *path operations* and
+                send `304 Not Modified` responses to requests with a matching
+                `If-None-Match` header. `True` to hash the rendered body, or
+                `Depends(get_version)` to use the version returned by a dependency.
+
+                It can be overridden in each router and *path operation*.
+                """
+            ),
+        ] = Default(False),
         **extra: Annotated[
             Any,
             Doc(
@@ -929,6 +1079,12 @@ class FastAPI(Starlette):
                 """
             ),
         ] = {}
+        if isinstance(startup_profile, StartupProfile):
+            self.startup_profile: Optional[StartupProfile] = startup_profile
+        elif startup_profile:
+            self.startup_profile = StartupProfile()
+        else:
+            self.startup_profile = None
         self.router: routing.APIRouter = routing.APIRouter(
             routes=routes,
             redirect_slashes=redirect_slashes,
@@ -943,6 +1099,18 @@ class FastAPI(Starlette):
             include_in_schema=include_in_schema,
             responses=responses,
             generate_unique_id_function=generate_unique_id_function,
+            route_trie=route_trie,
+            lazy_routes=lazy_routes,
+            startup_profile=self.startup_profile,
+            concurrent_dependencies=concurrent_dependencies,
+            response_model_dump_json=response_model_dump_json,
+            response_validation=response_validation,
+            cache=cache,
+            etag=etag,
+        )
+        self.app_dependency_cache = AppDependencyCache()
+        self.router.lifespan_context = routing._merge_lifespan_context(
+            self._app_dependency_cache_lifespan, self.router.lifespan_context
         )
         self.exception_handlers: Dict[
             Any, Callable[[Request, Any], Union[Response, Awaitable[Response]]]
@@ -978,23 +1146,113 @@ class FastAPI(Starlette):
         [FastAPI docs for OpenAPI](https://fastapi.tiangolo.com/how-to/extending-openapi/).
         """
         if not self.openapi_schema:
-            self.openapi_schema = get_openapi(
-                title=self.title,
-                version=self.version,
-                openapi_version=self.openapi_version,
-                summary=self.summary,
-                description=self.description,
-                terms_of_service=self.terms_of_service,
-                contact=self.contact,
-                license_info=self.license_info,
-                routes=self.routes,
-                webhooks=self.webhooks.routes,
-                tags=self.openapi_tags,
-                servers=self.servers,
-                separate_input_output_schemas=self.separate_input_output_schemas,
-            )
+            # The routes built while generating it (with lazy_routes=True) are
+            # measured on their own
+            profile = self.startup_profile
+            with nullcontext() if profile is None else profile.measure("", "openapi"):
+                self.openapi_schema = get_openapi(
+                    title=self.title,
+                    version=self.version,
+                    openapi_version=self.openapi_version,
+                    summary=self.summary,
+                    description=self.description,
+                    terms_of_service=self.terms_of_service,
+                    contact=self.contact,
+                    license_info=self.license_info,
+                    routes=self.routes,
+                    webhooks=self.webhooks.routes,
+                    tags=self.openapi_tags,
+                    servers=self.servers,
+                    separate_input_output_schemas=self.separate_input_output_schemas,
+                )
         return self.openapi_schema
 
+    def warmup(
+        self,
+        *,
+        background: Annotated[
+            bool,
+            Doc(
+                """
+                Build the *path operations* in a daemon thread, and return it right
+                away, instead of building them before returning.
+
+                The requests received in the meantime build the *path operations*
+                they use, if they were not built yet.
+                """
+            ),
+        ] = False,
+    ) -> Optional[threading.Thread]:
+        """
+        Build the dependencies, the request body and the response models of all the
+        *path operations*, when the app was created with `lazy_routes=True`.
+
+        Call it after including all the routers, to build them ahead of time, e.g.
+        once the server is ready to receive requests. Errors in the declaration of
+        the *path operations* are raised here (or in the thread with
+        `background=True`).
+        """
+        if background:
+            thread = threading.Thread(
+                target=self._compile_routes, name="fastapi-warmup", daemon=True
+            )
+            thread.start()
+            return thread
+        self._compile_routes()
+        return None
+
+    def prepare_for_fork(self) -> None:
+        """
+        Build everything the app would otherwise build on the first requests, then
+        move all the objects alive to the permanent generation of the garbage
+        collector, with `gc.freeze()`.
+
+        Call it once the app is created and before forking the worker processes,
+        e.g. at the end of the module imported by Gunicorn with `--preload`. The
+        *path operations*, the middleware stack, the route trie and the OpenAPI
+        schema are then built once, in memory shared by all the workers, and the
+        garbage collector of each worker doesn't write to the pages of those
+        objects, that would copy them in each worker.
+
+        The same is done for the apps mounted in it, except for their OpenAPI
+        schema, that includes the path they are mounted at, only known once they
+        receive a request.
+
+        No middleware can be added to the app after calling it.
+        """
+        self._compile_routes()
+        if self.openapi_url:
+            self.openapi()
+        apps = [self]
+        for route in _iter_routes(self.routes):
+            if isinstance(route, Mount) and isinstance(route.app, FastAPI):
+                apps.append(route.app)
+        for app in apps:
+            if app.middleware_stack is None:
+                app.middleware_stack = app.build_middleware_stack()
+            if app.router.route_trie:
+                app.router._get_route_trie()
+        gc.collect()
+        gc.freeze()
+
+    def _compile_routes(self) -> None:
+        for route in _iter_routes([*self.routes, *self.webhooks.routes]):
+            if isinstance(route, routing.APIRoute):
+                route.compile()
+                build_params_validators(route.request_handler_plan.execution_plan)
+            elif isinstance(route, routing.APIWebSocketRoute):
+                build_params_validators(route.execution_plan)
+
+    @asynccontextmanager
+    async def _app_dependency_cache_lifespan(
+        self, app: "FastAPI"
+    ) -> AsyncIterator[None]:
+        # Run the exit code of the app-scoped dependencies with `yield` on shutdown
+        try:
+            yield
+        finally:
+            await self.app_dependency_cache.aclose()
+
     def setup(self) -> None:
         if self.openapi_url:
             urls = (server_data.get("url") for server_data in self.servers)
@@ -1084,6 +1342,13 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        response_model_dump_json: Union[bool, DefaultPlaceholder] = Default(False),
+        response_validation: Union[ResponseValidation, DefaultPlaceholder] = Default(
+            "always"
+        ),
+        cache: Union[ResponseCache, None, DefaultPlaceholder] = Default(None),
+        etag: Union[bool, Depends, DefaultPlaceholder] = Default(False),
     ) -> None:
         self.router.add_api_route(
             path,
@@ -1110,6 +1375,11 @@ class FastAPI(Starlette):
             name=name,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def api_route(
@@ -1140,6 +1410,13 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        response_model_dump_json: Union[bool, DefaultPlaceholder] = Default(False),
+        response_validation: Union[ResponseValidation, DefaultPlaceholder] = Default(
+            "always"
+        ),
+        cache: Union[ResponseCache, None, DefaultPlaceholder] = Default(None),
+        etag: Union[bool, Depends, DefaultPlaceholder] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.router.add_api_route(
@@ -1167,6 +1444,11 @@ class FastAPI(Starlette):
                 name=name,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                etag=etag,
+                cache=cache,
+                response_validation=response_validation,
+                response_model_dump_json=response_model_dump_json,
+                concurrent_dependencies=concurrent_dependencies,
             )
             return func
 
@@ -1788,6 +2070,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1828,6 +2197,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def put(
@@ -2161,6 +2535,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2206,6 +2667,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def post(
@@ -2539,6 +3005,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2584,6 +3137,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def delete(
@@ -2917,6 +3475,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2957,6 +3602,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def options(
@@ -3290,6 +3940,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3330,6 +4067,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def head(
@@ -3663,6 +4405,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3703,6 +4532,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def patch(
@@ -4036,6 +4870,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4081,6 +5002,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def trace(
@@ -4414,6 +5340,93 @@ class FastAPI(Starlette):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4454,6 +5467,11 @@ class FastAPI(Starlette):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def websocket_route(
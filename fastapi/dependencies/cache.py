@@ -0,0 +1,108 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import anyio
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class DependencyCache:
+    """
+    A cache for the results of a dependency shared by all the requests, used with
+    `Depends(dependency, cache=DependencyCache(...))`.
+
+    The results are cached by the values the dependency is called with (its
+    parameters and sub-dependencies), when they are all hashable and none of them
+    is the `Request`, `WebSocket`, `Response`, `BackgroundTasks` or
+    `SecurityScopes` of the request. Otherwise the dependency is just called. It's
+    also just called when it reads the request body, or when one of its
+    sub-dependencies (recursively) reads it or has `yield` (e.g. a database
+    session), as those values only belong to one request. An override of the
+    dependency, in `app.dependency_overrides`, is not cached either.
+
+    While a dependency is being called for some values, other requests needing it
+    with the same values wait for that result instead of calling it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = 1024,
+    ) -> None:
+        # Seconds a result is kept, None to keep it until it's evicted
+        self.ttl = ttl
+        # Maximum number of results, the least recently used are evicted first
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._pending: Dict[Hashable, anyio.Event] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._results),
+        )
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        item = self._results.get(key)
+        if item is None:
+            return False, None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._results[key]
+            return False, None
+        self._results.move_to_end(key)
+        return True, value
+
+    def _set(self, key: Hashable, value: Any) -> None:
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._results[key] = (expires_at, value)
+        self._results.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    async def get_or_call(
+        self, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            hash(key)
+        except TypeError:
+            return await call()
+        while True:
+            found, value = self._get(key)
+            if found:
+                self.hits += 1
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            # If that call fails, the next waiting request calls it again
+            await pending.wait()
+        self.misses += 1
+        event = self._pending[key] = anyio.Event()
+        try:
+            value = await call()
+            self._set(key, value)
+        finally:
+            del self._pending[key]
+            event.set()
+        return value
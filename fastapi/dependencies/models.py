@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi._compat import ModelField
+from fastapi.dependencies.cache import DependencyCache
 from fastapi.security.base import SecurityBase
+from typing_extensions import Literal
 
 
 @dataclass
@@ -30,8 +32,74 @@ class Dependant:
     security_scopes_param_name: Optional[str] = None
     security_scopes: Optional[List[str]] = None
     use_cache: bool = True
+    scope: Literal["request", "app"] = "request"
+    cache: Optional[DependencyCache] = None
     path: Optional[str] = None
     cache_key: Tuple[Optional[Callable[..., Any]], Tuple[str, ...]] = field(init=False)
+    # The validators of all the parameters of each location at once, created the
+    # first time they are needed
+    params_validators: Dict[str, Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # The kind of the call, set the first time a plan is built with the dependant
+    call_kind: Optional["CallKind"] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.cache_key = (self.call, tuple(sorted(set(self.security_scopes or []))))
+
+
+CallKind = Literal["generator", "async_generator", "coroutine", "sync"]
+
+
+@dataclass
+class ExecutionStep:
+    dependant: Dependant
+    call_kind: CallKind
+    # The name of the parameter and the index of the step for each sub-dependency
+    sub_steps: List[Tuple[Optional[str], int]] = field(default_factory=list)
+    # If it and all its sub-dependencies are `async def` functions, so that it can
+    # be solved concurrently with its siblings
+    concurrent: bool = False
+    # If it reads the request body, or any of its sub-dependencies (recursively) has
+    # `yield` or reads the body, its values only belong to the current request and
+    # it's not stored in its `DependencyCache`
+    uses_request_values: bool = False
+    # For an app-scoped dependency, the plan to solve its own sub-dependencies, the
+    # first time it's needed, instead of having them as steps of each request
+    app_scope_plan: Optional["ExecutionPlan"] = None
+    # For an app-scoped dependency, its value in AppDependencyCache is stored by
+    # the calls of all its sub-dependencies, with the overrides applied
+    app_scope_key: Optional[Tuple[Any, ...]] = None
+
+
+@dataclass
+class ExecutionPlan:
+    dependant: Dependant
+    steps: List[ExecutionStep] = field(default_factory=list)
+    # The dependency overrides last applied to this plan, and the resulting plan
+    overridden: Optional[Tuple[Dict[Any, Any], "ExecutionPlan"]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Computed once from the steps, used on each request
+    has_yield_dependencies: bool = field(init=False, repr=False)
+    has_app_scoped_steps: bool = field(init=False, repr=False)
+    has_concurrent_steps: bool = field(init=False, repr=False)
+    uses_background_tasks: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.has_yield_dependencies = any(
+            step.call_kind in ("generator", "async_generator")
+            for step in self.steps
+            if step.dependant is not self.dependant and step.app_scope_plan is None
+        )
+        self.has_app_scoped_steps = any(
+            step.app_scope_plan is not None for step in self.steps
+        )
+        self.has_concurrent_steps = any(
+            sum(self.steps[sub_index].concurrent for _, sub_index in step.sub_steps) > 1
+            for step in self.steps
+        )
+        self.uses_background_tasks = any(
+            step.dependant.background_tasks_param_name for step in self.steps
+        )
@@ -2,6 +2,7 @@ import inspect
 from contextlib import AsyncExitStack, contextmanager
 from copy import copy, deepcopy
 from dataclasses import dataclass
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -26,9 +27,11 @@ from fastapi._compat import (
     ModelField,
     RequiredParam,
     Undefined,
+    ValidationError,
     _regenerate_error_with_loc,
     copy_field_info,
     create_body_model,
+    create_params_type_adapter,
     evaluate_forwardref,
     field_annotation_is_scalar,
     get_annotation_from_field_info,
@@ -51,7 +54,15 @@ from fastapi.concurrency import (
     asynccontextmanager,
     contextmanager_in_threadpool,
 )
-from fastapi.dependencies.models import Dependant, SecurityRequirement
+from fastapi.dependencies.cache import DependencyCache
+from fastapi.dependencies.models import (
+    CallKind,
+    Dependant,
+    ExecutionPlan,
+    ExecutionStep,
+    SecurityRequirement,
+)
+from fastapi.exceptions import FastAPIError
 from fastapi.logger import logger
 from fastapi.security.base import SecurityBase
 from fastapi.security.oauth2 import OAuth2, SecurityScopes
@@ -71,7 +82,7 @@ from starlette.datastructures import (
 from starlette.requests import HTTPConnection, Request
 from starlette.responses import Response
 from starlette.websockets import WebSocket
-from typing_extensions import Annotated, get_args, get_origin
+from typing_extensions import Annotated, Literal, get_args, get_origin
 
 multipart_not_installed_error = (
     'Form data requires "python-multipart" to be installed. \n'
@@ -165,6 +176,8 @@ def get_sub_dependant(
         name=name,
         security_scopes=security_scopes,
         use_cache=depends.use_cache,
+        scope=depends.scope,
+        cache=depends.cache,
     )
     if security_requirement:
         sub_dependant.security_requirements.append(security_requirement)
@@ -269,6 +282,8 @@ def get_dependant(
     name: Optional[str] = None,
     security_scopes: Optional[List[str]] = None,
     use_cache: bool = True,
+    scope: Literal["request", "app"] = "request",
+    cache: Optional[DependencyCache] = None,
 ) -> Dependant:
     path_param_names = get_path_param_names(path)
     endpoint_signature = get_typed_signature(call)
@@ -279,6 +294,8 @@ def get_dependant(
         path=path,
         security_scopes=security_scopes,
         use_cache=use_cache,
+        scope=scope,
+        cache=cache,
     )
     for param_name, param in signature_params.items():
         is_path_param = param_name in path_param_names
@@ -311,9 +328,60 @@ def get_dependant(
             dependant.body_params.append(param_details.field)
         else:
             add_param_to_fields(field=param_details.field, dependant=dependant)
+    if scope == "app":
+        check_app_scoped_dependant(dependant)
+    if cache is not None and (
+        scope == "app" or is_gen_callable(call) or is_async_gen_callable(call)
+    ):
+        raise FastAPIError(
+            f"The dependency {call!r} can't use a cache, it's only supported for "
+            "request-scoped dependencies without yield"
+        )
     return dependant
 
 
+def check_app_scoped_dependant(dependant: Dependant) -> None:
+    """
+    Check that an app-scoped dependency, including its sub-dependencies, doesn't
+    need anything from a request, as it's solved only once for all the requests.
+    """
+    flat_dependant = get_flat_dependant(dependant)
+    request_params = [
+        field.alias
+        for field in flat_dependant.path_params
+        + flat_dependant.query_params
+        + flat_dependant.header_params
+        + flat_dependant.cookie_params
+        + flat_dependant.body_params
+    ]
+    stack = [dependant]
+    while stack:
+        current = stack.pop()
+        stack.extend(current.dependencies)
+        request_params.extend(
+            param_name
+            for param_name in (
+                current.request_param_name,
+                current.websocket_param_name,
+                current.http_connection_param_name,
+                current.response_param_name,
+                current.background_tasks_param_name,
+                current.security_scopes_param_name,
+            )
+            if param_name is not None
+        )
+        if current.security_requirements:
+            request_params.append(
+                current.security_requirements[0].security_scheme.scheme_name
+            )
+    if request_params:
+        raise FastAPIError(
+            f"The dependency {dependant.call!r} has scope='app', it's solved once "
+            "for all the requests, so it can't depend on request data, but it "
+            f"declares: {', '.join(request_params)}"
+        )
+
+
 def add_non_field_param_to_dependency(
     *, param_name: str, type_annotation: Any, dependant: Dependant
 ) -> Optional[bool]:
@@ -560,6 +628,16 @@ async def solve_generator(
     return await stack.enter_async_context(cm)
 
 
+@dataclass
+class ValidatedBody:
+    """
+    The value of the single, not embedded, body field of a path operation, already
+    validated from the JSON bytes of the request body.
+    """
+
+    value: Any
+
+
 @dataclass
 class SolvedDependency:
     values: Dict[str, Any]
@@ -642,23 +720,60 @@ async def solve_dependencies(
             values[sub_dependant.name] = solved
         if sub_dependant.cache_key not in dependency_cache:
             dependency_cache[sub_dependant.cache_key] = solved
+    param_errors, background_tasks = await _solve_dependant_params(
+        request=request,
+        dependant=dependant,
+        values=values,
+        body=body,
+        background_tasks=background_tasks,
+        response=response,
+        embed_body_fields=embed_body_fields,
+    )
+    errors.extend(param_errors)
+    return SolvedDependency(
+        values=values,
+        errors=errors,
+        background_tasks=background_tasks,
+        response=response,
+        dependency_cache=dependency_cache,
+    )
+
+
+async def _solve_dependant_params(
+    *,
+    request: Union[Request, WebSocket],
+    dependant: Dependant,
+    values: Dict[str, Any],
+    body: Optional[Union[Dict[str, Any], FormData, ValidatedBody]],
+    background_tasks: Optional[StarletteBackgroundTasks],
+    response: Response,
+    embed_body_fields: bool,
+) -> Tuple[List[Any], Optional[StarletteBackgroundTasks]]:
     path_values, path_errors = request_params_to_args(
-        dependant.path_params, request.path_params
+        dependant.path_params,
+        request.path_params,
+        params_validator=get_params_validator(dependant, params.ParamTypes.path),
     )
     query_values, query_errors = request_params_to_args(
-        dependant.query_params, request.query_params
+        dependant.query_params,
+        request.query_params,
+        params_validator=get_params_validator(dependant, params.ParamTypes.query),
     )
     header_values, header_errors = request_params_to_args(
-        dependant.header_params, request.headers
+        dependant.header_params,
+        request.headers,
+        params_validator=get_params_validator(dependant, params.ParamTypes.header),
     )
     cookie_values, cookie_errors = request_params_to_args(
-        dependant.cookie_params, request.cookies
+        dependant.cookie_params,
+        request.cookies,
+        params_validator=get_params_validator(dependant, params.ParamTypes.cookie),
     )
     values.update(path_values)
     values.update(query_values)
     values.update(header_values)
     values.update(cookie_values)
-    errors += path_errors + query_errors + header_errors + cookie_errors
+    errors = path_errors + query_errors + header_errors + cookie_errors
     if dependant.body_params:
         (
             body_values,
@@ -686,6 +801,508 @@ async def solve_dependencies(
         values[dependant.security_scopes_param_name] = SecurityScopes(
             scopes=dependant.security_scopes
         )
+    return errors, background_tasks
+
+
+def get_call_kind(call: Callable[..., Any]) -> CallKind:
+    if is_gen_callable(call):
+        return "generator"
+    if is_async_gen_callable(call):
+        return "async_generator"
+    if is_coroutine_callable(call):
+        return "coroutine"
+    return "sync"
+
+
+def _get_step_call_kind(dependant: Dependant) -> CallKind:
+    # Kept in the dependant, the same dependants are in the plans of many routes,
+    # e.g. the ones included with include_router()
+    if dependant.call_kind is None:
+        call = dependant.call
+        dependant.call_kind = "sync" if call is None else get_call_kind(call)
+    return dependant.call_kind
+
+
+def get_execution_plan(dependant: Dependant) -> ExecutionPlan:
+    """
+    Flatten a `Dependant` tree into the list of steps `solve_execution_plan()` runs
+    in order, each dependency after all its own sub-dependencies, and the root
+    `dependant` (e.g. the path operation function) last.
+
+    A dependency used several times in the tree is still a step each time, as with
+    `solve_dependencies()`, the request dependency cache decides if it is called
+    again.
+
+    An app-scoped dependency is a single step, its sub-dependencies are in its own
+    `app_scope_plan`, solved only the first time by `AppDependencyCache`.
+    """
+    steps: List[ExecutionStep] = []
+
+    def is_request_value(step: ExecutionStep) -> bool:
+        # The resource of a request-scoped dependency with `yield` is closed after
+        # the request
+        return step.uses_request_values or (
+            step.app_scope_plan is None
+            and step.call_kind in ("generator", "async_generator")
+        )
+
+    def add_request_scoped_step(
+        current: Dependant, sub_steps: List[Tuple[Optional[str], int]]
+    ) -> int:
+        call_kind = _get_step_call_kind(current)
+        steps.append(
+            ExecutionStep(
+                dependant=current,
+                call_kind=call_kind,
+                sub_steps=sub_steps,
+                concurrent=call_kind == "coroutine"
+                and all(steps[sub_index].concurrent for _, sub_index in sub_steps),
+                uses_request_values=bool(current.body_params)
+                or any(
+                    is_request_value(steps[sub_index]) for _, sub_index in sub_steps
+                ),
+            )
+        )
+        return len(steps) - 1
+
+    def add_app_scoped_step(current: Dependant) -> int:
+        app_scope_plan = get_execution_plan(current)
+        steps.append(
+            ExecutionStep(
+                dependant=current,
+                call_kind=_get_step_call_kind(current),
+                app_scope_plan=app_scope_plan,
+                app_scope_key=(
+                    current.cache_key[1],
+                    *(step.dependant.call for step in app_scope_plan.steps),
+                ),
+            )
+        )
+        return len(steps) - 1
+
+    def add_step(current: Dependant) -> int:
+        sub_steps = [
+            (
+                sub_dependant.name,
+                add_app_scoped_step(sub_dependant)
+                if sub_dependant.scope == "app"
+                else add_step(sub_dependant),
+            )
+            for sub_dependant in current.dependencies
+        ]
+        return add_request_scoped_step(current, sub_steps)
+
+    add_step(dependant)
+    return ExecutionPlan(dependant=dependant, steps=steps)
+
+
+def get_overridden_execution_plan(
+    plan: ExecutionPlan, dependency_overrides: Dict[Any, Any]
+) -> ExecutionPlan:
+    """
+    Get the execution plan of `plan.dependant` with the `dependency_overrides`
+    applied, as `solve_dependencies()` would apply them.
+
+    The overridden plan is kept in `plan` and reused for as long as the overrides
+    don't change, so that the `Dependant` trees of the overrides are not built on
+    every request.
+    """
+    overridden = plan.overridden
+    if overridden is not None and overridden[0] == dependency_overrides:
+        return overridden[1]
+    overrides = dict(dependency_overrides)
+
+    def apply_overrides(dependant: Dependant) -> Dependant:
+        dependencies: List[Dependant] = []
+        for sub_dependant in dependant.dependencies:
+            original_call = sub_dependant.call
+            call = overrides.get(original_call, original_call)
+            use_sub_dependant = sub_dependant
+            if call is not original_call:
+                use_sub_dependant = get_dependant(
+                    path=cast(str, sub_dependant.path),
+                    call=call,
+                    name=sub_dependant.name,
+                    security_scopes=sub_dependant.security_scopes,
+                    scope=sub_dependant.scope,
+                )
+                # Cached as the original dependency in each request, as with
+                # solve_dependencies(), but not in its DependencyCache, that has the
+                # results of the original
+                use_sub_dependant.use_cache = sub_dependant.use_cache
+                use_sub_dependant.cache_key = sub_dependant.cache_key
+            dependencies.append(apply_overrides(use_sub_dependant))
+        if all(
+            new is original
+            for new, original in zip(dependencies, dependant.dependencies)
+        ):
+            return dependant
+        dependant = copy(dependant)
+        dependant.dependencies = dependencies
+        return dependant
+
+    overridden_plan = get_execution_plan(apply_overrides(plan.dependant))
+    plan.overridden = (overrides, overridden_plan)
+    return overridden_plan
+
+
+# Values of a single request, a dependency called with them is not cached across
+# requests, as its key would only be used once and keep the request alive
+_REQUEST_VALUE_TYPES = (
+    HTTPConnection,
+    Response,
+    StarletteBackgroundTasks,
+    SecurityScopes,
+)
+
+
+async def _call_step(
+    *,
+    step: ExecutionStep,
+    values: Dict[str, Any],
+    async_exit_stack: AsyncExitStack,
+) -> Any:
+    cache = step.dependant.cache
+    if (
+        cache is not None
+        and not step.uses_request_values
+        and not any(
+            isinstance(value, _REQUEST_VALUE_TYPES) for value in values.values()
+        )
+    ):
+        return await cache.get_or_call(
+            (step.dependant.cache_key, tuple(values.items())),
+            partial(
+                _call_uncached_step,
+                step=step,
+                values=values,
+                async_exit_stack=async_exit_stack,
+            ),
+        )
+    return await _call_uncached_step(
+        step=step, values=values, async_exit_stack=async_exit_stack
+    )
+
+
+async def _call_uncached_step(
+    *,
+    step: ExecutionStep,
+    values: Dict[str, Any],
+    async_exit_stack: AsyncExitStack,
+) -> Any:
+    call = cast(Callable[..., Any], step.dependant.call)
+    if step.call_kind == "generator":
+        return await async_exit_stack.enter_async_context(
+            contextmanager_in_threadpool(contextmanager(call)(**values))
+        )
+    elif step.call_kind == "async_generator":
+        return await async_exit_stack.enter_async_context(
+            asynccontextmanager(call)(**values)
+        )
+    elif step.call_kind == "coroutine":
+        return await call(**values)
+    return await run_in_threadpool(call, **values)
+
+
+class AppDependencyCache:
+    """
+    The values of the dependencies declared with `Depends(scope="app")`, solved the
+    first time they are needed and kept until `aclose()` is called, when the app
+    shuts down.
+    """
+
+    def __init__(self) -> None:
+        self.values: Dict[Tuple[Any, ...], Any] = {}
+        self.async_exit_stack = AsyncExitStack()
+        self._locks: Dict[Tuple[Any, ...], anyio.Lock] = {}
+
+    async def get_value(
+        self, *, step: ExecutionStep, request: Union[Request, WebSocket]
+    ) -> Any:
+        assert step.app_scope_plan is not None
+        assert step.app_scope_key is not None
+        # The calls and not the cache key, that stays the same with overrides, a
+        # dependency or any of its sub-dependencies overridden later has its own
+        # value
+        key = step.app_scope_key
+        if key in self.values:
+            return self.values[key]
+        async with self._locks.setdefault(key, anyio.Lock()):
+            if key in self.values:
+                return self.values[key]
+            solved_result = await solve_execution_plan(
+                request=request,
+                plan=step.app_scope_plan,
+                async_exit_stack=self.async_exit_stack,
+                embed_body_fields=False,
+                app_dependency_cache=self,
+            )
+            value = await _call_step(
+                step=step,
+                values=solved_result.values,
+                async_exit_stack=self.async_exit_stack,
+            )
+            self.values[key] = value
+        return value
+
+    async def aclose(self) -> None:
+        async_exit_stack = self.async_exit_stack
+        self.values = {}
+        self.async_exit_stack = AsyncExitStack()
+        self._locks = {}
+        await async_exit_stack.aclose()
+
+
+def _get_app_dependency_cache(
+    dependency_overrides_provider: Optional[Any],
+) -> AppDependencyCache:
+    app_dependency_cache = getattr(
+        dependency_overrides_provider, "app_dependency_cache", None
+    )
+    if not isinstance(app_dependency_cache, AppDependencyCache):
+        raise FastAPIError(
+            "Dependencies with scope='app' can only be used in a FastAPI app"
+        )
+    return app_dependency_cache
+
+
+async def solve_execution_plan(
+    *,
+    request: Union[Request, WebSocket],
+    plan: ExecutionPlan,
+    body: Optional[Union[Dict[str, Any], FormData, ValidatedBody]] = None,
+    dependency_overrides_provider: Optional[Any] = None,
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+    concurrent: bool = False,
+    app_dependency_cache: Optional[AppDependencyCache] = None,
+) -> SolvedDependency:
+    """
+    Solve the dependencies of `plan.dependant`, with the same results as
+    `solve_dependencies()`, but running the precomputed steps in a loop instead of
+    recursing through the `Dependant` tree.
+
+    With `concurrent=True`, the sub-dependencies of each dependant that are only
+    made of `async def` functions are solved concurrently, see
+    `_solve_execution_plan_concurrently()`.
+
+    App-scoped dependencies are taken from `app_dependency_cache`, by default the
+    one of the app (the `dependency_overrides_provider`).
+    """
+    if (
+        dependency_overrides_provider
+        and dependency_overrides_provider.dependency_overrides
+    ):
+        plan = get_overridden_execution_plan(
+            plan, dependency_overrides_provider.dependency_overrides
+        )
+    if app_dependency_cache is None and plan.has_app_scoped_steps:
+        app_dependency_cache = _get_app_dependency_cache(dependency_overrides_provider)
+    if concurrent and plan.has_concurrent_steps:
+        return await _solve_execution_plan_concurrently(
+            request=request,
+            plan=plan,
+            body=body,
+            async_exit_stack=async_exit_stack,
+            embed_body_fields=embed_body_fields,
+            app_dependency_cache=app_dependency_cache,
+        )
+    response = Response()
+    del response.headers["content-length"]
+    response.status_code = None  # type: ignore
+    background_tasks: Optional[StarletteBackgroundTasks] = None
+    dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any] = {}
+    errors: List[Any] = []
+    steps = plan.steps
+    results: List[Any] = [None] * len(steps)
+    failed = [False] * len(steps)
+    values: Dict[str, Any] = {}
+    last_index = len(steps) - 1
+    for index, step in enumerate(steps):
+        if step.app_scope_plan is not None:
+            assert app_dependency_cache is not None
+            results[index] = await app_dependency_cache.get_value(
+                step=step, request=request
+            )
+            continue
+        values = {}
+        step_failed = False
+        for name, sub_index in step.sub_steps:
+            if failed[sub_index]:
+                step_failed = True
+            elif name is not None:
+                values[name] = results[sub_index]
+        param_errors, background_tasks = await _solve_dependant_params(
+            request=request,
+            dependant=step.dependant,
+            values=values,
+            body=body,
+            background_tasks=background_tasks,
+            response=response,
+            embed_body_fields=embed_body_fields,
+        )
+        if param_errors:
+            errors.extend(param_errors)
+            step_failed = True
+        if index == last_index:
+            # The root dependant, its values are the result
+            break
+        if step_failed:
+            failed[index] = True
+            continue
+        cache_key = cast(
+            Tuple[Callable[..., Any], Tuple[str]], step.dependant.cache_key
+        )
+        if step.dependant.use_cache and cache_key in dependency_cache:
+            solved = dependency_cache[cache_key]
+        else:
+            solved = await _call_step(
+                step=step, values=values, async_exit_stack=async_exit_stack
+            )
+        results[index] = solved
+        if cache_key not in dependency_cache:
+            dependency_cache[cache_key] = solved
+    return SolvedDependency(
+        values=values,
+        errors=errors,
+        background_tasks=background_tasks,
+        response=response,
+        dependency_cache=dependency_cache,
+    )
+
+
+async def _solve_execution_plan_concurrently(
+    *,
+    request: Union[Request, WebSocket],
+    plan: ExecutionPlan,
+    body: Optional[Union[Dict[str, Any], FormData, ValidatedBody]],
+    async_exit_stack: AsyncExitStack,
+    embed_body_fields: bool,
+    app_dependency_cache: Optional[AppDependencyCache],
+) -> SolvedDependency:
+    """
+    Solve the plan from the root dependant down, running the sub-steps of each
+    step marked as `concurrent` in a task group, and the rest one after the other,
+    in order, in the current task, after the task group has finished.
+
+    Context variables set by the steps in a task group are not kept, they are set
+    in the context of their own task.
+
+    Concurrent steps only contain `async def` functions, so the order in which
+    dependencies with `yield` are entered (and exited) is the same as when solving
+    sequentially. A cached dependency being called is tracked, so that another step
+    with the same cache key waits for its result instead of calling it again.
+
+    Errors are collected per step and returned in the order of the plan. If a
+    dependency raises an exception, the other running steps are cancelled and that
+    exception is raised: the first exception to happen wins, not the one of the
+    first step in the plan order, as that step could have been cancelled before
+    raising its own.
+    """
+    response = Response()
+    del response.headers["content-length"]
+    response.status_code = None  # type: ignore
+    # Created beforehand so that concurrent steps share it
+    background_tasks: Optional[StarletteBackgroundTasks] = (
+        BackgroundTasks() if plan.uses_background_tasks else None
+    )
+    dependency_cache: Dict[Tuple[Callable[..., Any], Tuple[str]], Any] = {}
+    pending_calls: Dict[Tuple[Callable[..., Any], Tuple[str]], anyio.Event] = {}
+    steps = plan.steps
+    step_errors: List[List[Any]] = [[] for _ in steps]
+    results: List[Any] = [None] * len(steps)
+    failed = [False] * len(steps)
+    last_index = len(steps) - 1
+
+    async def solve_sub_steps(step: ExecutionStep) -> None:
+        concurrent_indexes = [
+            sub_index for _, sub_index in step.sub_steps if steps[sub_index].concurrent
+        ]
+        if len(concurrent_indexes) < 2:
+            for _, sub_index in step.sub_steps:
+                await solve_step(sub_index)
+            return
+        exceptions: List[Exception] = []
+
+        async def solve_step_in_group(sub_index: int) -> None:
+            try:
+                await solve_step(sub_index)
+            except Exception as e:
+                exceptions.append(e)
+                task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for sub_index in concurrent_indexes:
+                task_group.start_soon(solve_step_in_group, sub_index)
+        if exceptions:
+            raise exceptions[0]
+        # The rest after the group, not while it runs, in this task
+        for _, sub_index in step.sub_steps:
+            if sub_index not in concurrent_indexes:
+                await solve_step(sub_index)
+
+    async def solve_step(index: int) -> Dict[str, Any]:
+        step = steps[index]
+        if step.app_scope_plan is not None:
+            assert app_dependency_cache is not None
+            results[index] = await app_dependency_cache.get_value(
+                step=step, request=request
+            )
+            return {}
+        await solve_sub_steps(step)
+        values: Dict[str, Any] = {}
+        step_failed = False
+        for name, sub_index in step.sub_steps:
+            if failed[sub_index]:
+                step_failed = True
+            elif name is not None:
+                values[name] = results[sub_index]
+        param_errors, _ = await _solve_dependant_params(
+            request=request,
+            dependant=step.dependant,
+            values=values,
+            body=body,
+            background_tasks=background_tasks,
+            response=response,
+            embed_body_fields=embed_body_fields,
+        )
+        if param_errors:
+            step_errors[index] = param_errors
+            step_failed = True
+        if index == last_index:
+            return values
+        if step_failed:
+            failed[index] = True
+            return values
+        cache_key = cast(
+            Tuple[Callable[..., Any], Tuple[str]], step.dependant.cache_key
+        )
+        use_cache = step.dependant.use_cache
+        pending_call = pending_calls.get(cache_key)
+        if use_cache and pending_call is not None:
+            await pending_call.wait()
+        if use_cache and cache_key in dependency_cache:
+            solved = dependency_cache[cache_key]
+        elif cache_key in dependency_cache or cache_key in pending_calls:
+            solved = await _call_step(
+                step=step, values=values, async_exit_stack=async_exit_stack
+            )
+        else:
+            pending_calls[cache_key] = anyio.Event()
+            try:
+                solved = await _call_step(
+                    step=step, values=values, async_exit_stack=async_exit_stack
+                )
+                dependency_cache[cache_key] = solved
+            finally:
+                pending_calls.pop(cache_key).set()
+        results[index] = solved
+        if cache_key not in dependency_cache:
+            dependency_cache[cache_key] = solved
+        return values
+
+    values = await solve_step(last_index)
+    errors = [error for errors_ in step_errors for error in errors_]
     return SolvedDependency(
         values=values,
         errors=errors,
@@ -714,10 +1331,15 @@ def _validate_value_with_model_field(
 
 
 def _get_multidict_value(
-    field: ModelField, values: Mapping[str, Any], alias: Union[str, None] = None
+    field: ModelField,
+    values: Mapping[str, Any],
+    alias: Union[str, None] = None,
+    is_sequence: Union[bool, None] = None,
 ) -> Any:
     alias = alias or field.alias
-    if is_sequence_field(field) and isinstance(values, (ImmutableMultiDict, Headers)):
+    if is_sequence is None:
+        is_sequence = is_sequence_field(field)
+    if is_sequence and isinstance(values, (ImmutableMultiDict, Headers)):
         value = values.getlist(alias)
     else:
         value = values.get(alias, None)
@@ -728,7 +1350,7 @@ def _get_multidict_value(
             and isinstance(value, str)  # For type checks
             and value == ""
         )
-        or (is_sequence_field(field) and len(value) == 0)
+        or (is_sequence and len(value) == 0)
     ):
         if field.required:
             return
@@ -737,9 +1359,52 @@ def _get_multidict_value(
     return value
 
 
+def get_params_validator(
+    dependant: Dependant, location: params.ParamTypes
+) -> Optional["ParamsValidator"]:
+    """
+    Get a `ParamsValidator` to validate all the parameters of `dependant` in
+    `location` (e.g. all the query parameters) with a single call, or `None` if
+    they are validated one by one, when there's a single parameter or with
+    Pydantic v1.
+    """
+    validators = dependant.params_validators
+    validator: Optional[ParamsValidator] = validators.get(location.value)
+    if validator is not None or location.value in validators:
+        return validator
+    fields = getattr(dependant, f"{location.value}_params")
+    if len(fields) > 1:
+        type_adapter = create_params_type_adapter(
+            fields=fields, name=f"{location.value.capitalize()}Params"
+        )
+        if type_adapter is not None:
+            validator = ParamsValidator(
+                fields=fields,
+                type_adapter=type_adapter,
+                sequence_fields=[is_sequence_field(field) for field in fields],
+            )
+    validators[location.value] = validator
+    return validator
+
+
+def build_params_validators(plan: ExecutionPlan) -> None:
+    """
+    Create the `ParamsValidator` of each location of the dependant of each step of
+    `plan`, and of the plans of its app-scoped dependencies, instead of the first
+    time they are needed, e.g. before forking the worker processes.
+    """
+    for step in plan.steps:
+        for location in params.ParamTypes:
+            get_params_validator(step.dependant, location)
+        if step.app_scope_plan is not None:
+            build_params_validators(step.app_scope_plan)
+
+
 def request_params_to_args(
     fields: Sequence[ModelField],
     received_params: Union[Mapping[str, Any], QueryParams, Headers],
+    *,
+    params_validator: Optional["ParamsValidator"] = None,
 ) -> Tuple[Dict[str, Any], List[Any]]:
     values: Dict[str, Any] = {}
     errors: List[Dict[str, Any]] = []
@@ -747,6 +1412,9 @@ def request_params_to_args(
     if not fields:
         return values, errors
 
+    if params_validator is not None:
+        return params_validator.validate(received_params)
+
     first_field = fields[0]
     fields_to_extract = fields
     single_not_embedded_field = False
@@ -816,6 +1484,76 @@ def request_params_to_args(
     return values, errors
 
 
+@dataclass
+class ParamsValidator:
+    fields: Sequence[ModelField]
+    # Created with create_params_type_adapter() from the fields
+    type_adapter: Any
+    sequence_fields: List[bool]
+
+    def validate(
+        self, received_params: Union[Mapping[str, Any], QueryParams, Headers]
+    ) -> Tuple[Dict[str, Any], List[Any]]:
+        # The same as validating each field with _validate_value_with_model_field(),
+        # but with a single call for all the values that are not None
+        fields = self.fields
+        received_values: Dict[str, Any] = {}
+        for field, is_sequence in zip(fields, self.sequence_fields):
+            value = _get_multidict_value(
+                field, received_params, is_sequence=is_sequence
+            )
+            if value is not None:
+                received_values[field.name] = value
+        return _validate_params_values(
+            fields=fields,
+            received_values=received_values,
+            type_adapter=self.type_adapter,
+        )
+
+
+def _validate_params_values(
+    *,
+    fields: Sequence[ModelField],
+    received_values: Dict[str, Any],
+    type_adapter: Any,
+) -> Tuple[Dict[str, Any], List[Any]]:
+    values: Dict[str, Any] = {}
+    errors: List[Any] = []
+    try:
+        validated = type_adapter.validate_python(received_values, from_attributes=True)
+    except ValidationError as exc:
+        validated = {}
+        field_errors: Dict[Union[int, str], List[Any]] = {}
+        for error in exc.errors(include_url=False):
+            name, *error_loc = error["loc"]
+            field_errors.setdefault(name, []).append({**error, "loc": tuple(error_loc)})
+    else:
+        field_errors = {}
+    for field in fields:
+        field_info = field.field_info
+        assert isinstance(field_info, params.Param), (
+            "Params must be subclasses of Param"
+        )
+        loc = (field_info.in_.value, field.alias)
+        if field.name in field_errors:
+            errors.extend(
+                _regenerate_error_with_loc(
+                    errors=field_errors[field.name], loc_prefix=loc
+                )
+            )
+        elif field.name in validated:
+            values[field.name] = validated[field.name]
+        elif field.name not in received_values:
+            v_, errors_ = _validate_value_with_model_field(
+                field=field, value=None, values=values, loc=loc
+            )
+            if errors_:
+                errors.extend(errors_)
+            else:
+                values[field.name] = v_
+    return values, errors
+
+
 def is_union_of_base_models(field_type: Any) -> bool:
     """Check if field type is a Union where all members are BaseModel subclasses."""
     from fastapi.types import UnionType
@@ -904,12 +1642,14 @@ async def _extract_form_body(
 
 async def request_body_to_args(
     body_fields: List[ModelField],
-    received_body: Optional[Union[Dict[str, Any], FormData]],
+    received_body: Optional[Union[Dict[str, Any], FormData, ValidatedBody]],
     embed_body_fields: bool,
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     values: Dict[str, Any] = {}
     errors: List[Dict[str, Any]] = []
     assert body_fields, "request_body_to_args() should be called with fields"
+    if isinstance(received_body, ValidatedBody):
+        return {body_fields[0].name: received_body.value}, errors
     single_not_embedded_field = len(body_fields) == 1 and not embed_body_fields
     first_field = body_fields[0]
     body_to_process = received_body
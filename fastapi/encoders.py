@@ -203,123 +203,301 @@ def jsonable_encoder(
     """
     custom_encoder = custom_encoder or {}
     if custom_encoder:
-        if type(obj) in custom_encoder:
-            return custom_encoder[type(obj)](obj)
-        else:
-            for encoder_type, encoder_instance in custom_encoder.items():
-                if isinstance(obj, encoder_type):
-                    return encoder_instance(obj)
+        encoder = _get_custom_encoder(custom_encoder, obj)
+        if encoder is not None:
+            return encoder(obj)
     if include is not None and not isinstance(include, (set, dict)):
         include = set(include)
     if exclude is not None and not isinstance(exclude, (set, dict)):
         exclude = set(exclude)
-    if isinstance(obj, BaseModel):
-        # TODO: remove when deprecating Pydantic v1
-        encoders: Dict[Any, Any] = {}
-        if not PYDANTIC_V2:
-            encoders = getattr(obj.__config__, "json_encoders", {})  # type: ignore[attr-defined]
-            if custom_encoder:
-                encoders.update(custom_encoder)
-        obj_dict = _model_dump(
-            obj,
-            mode="json",
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
+    options = _EncoderOptions(
+        include=include,
+        exclude=exclude,
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+        custom_encoder=custom_encoder,
+        sqlalchemy_safe=sqlalchemy_safe,
+    )
+    return _get_type_encoder(obj)(obj, options)
+
+
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+_SEQUENCE_TYPES = (list, set, frozenset, GeneratorType, tuple, deque)
+# Don't keep too many dynamically created classes alive
+_MAX_CACHED_TYPES = 1024
+
+
+class _EncoderOptions:
+    """
+    The parameters of a `jsonable_encoder()` call, passed down to encode the nested
+    values, with the lookups of the custom encoders by type cached for the call.
+    """
+
+    __slots__ = (
+        "include",
+        "exclude",
+        "by_alias",
+        "exclude_unset",
+        "exclude_defaults",
+        "exclude_none",
+        "custom_encoder",
+        "sqlalchemy_safe",
+        "custom_encoders_by_type",
+        "_items_options",
+    )
+
+    def __init__(
+        self,
+        *,
+        include: Optional[IncEx],
+        exclude: Optional[IncEx],
+        by_alias: bool,
+        exclude_unset: bool,
+        exclude_defaults: bool,
+        exclude_none: bool,
+        custom_encoder: Dict[Any, Callable[[Any], Any]],
+        sqlalchemy_safe: bool,
+        custom_encoders_by_type: Optional[
+            Dict[Type[Any], Optional[Callable[[Any], Any]]]
+        ] = None,
+    ) -> None:
+        self.include = include
+        self.exclude = exclude
+        self.by_alias = by_alias
+        self.exclude_unset = exclude_unset
+        self.exclude_defaults = exclude_defaults
+        self.exclude_none = exclude_none
+        self.custom_encoder = custom_encoder
+        self.sqlalchemy_safe = sqlalchemy_safe
+        self.custom_encoders_by_type = (
+            {} if custom_encoders_by_type is None else custom_encoders_by_type
+        )
+        self._items_options: Optional[_EncoderOptions] = None
+
+    @property
+    def items_options(self) -> "_EncoderOptions":
+        # The keys and values of dicts are encoded without include, exclude and
+        # exclude_defaults
+        if self._items_options is None:
+            self._items_options = _EncoderOptions(
+                include=None,
+                exclude=None,
+                by_alias=self.by_alias,
+                exclude_unset=self.exclude_unset,
+                exclude_defaults=False,
+                exclude_none=self.exclude_none,
+                custom_encoder=self.custom_encoder,
+                sqlalchemy_safe=self.sqlalchemy_safe,
+                custom_encoders_by_type=self.custom_encoders_by_type,
+            )
+        return self._items_options
+
+
+def _get_custom_encoder(
+    custom_encoder: Dict[Any, Callable[[Any], Any]], obj: Any
+) -> Optional[Callable[[Any], Any]]:
+    if type(obj) in custom_encoder:
+        return custom_encoder[type(obj)]
+    for encoder_type, encoder_instance in custom_encoder.items():
+        if isinstance(obj, encoder_type):
+            return encoder_instance
+    return None
+
+
+def _encode(obj: Any, options: _EncoderOptions) -> Any:
+    if options.custom_encoder:
+        type_ = type(obj)
+        encoders_by_type = options.custom_encoders_by_type
+        if type_ in encoders_by_type:
+            encoder = encoders_by_type[type_]
+        else:
+            encoder = _get_custom_encoder(options.custom_encoder, obj)
+            if _is_cacheable(obj):
+                encoders_by_type[type_] = encoder
+        if encoder is not None:
+            return encoder(obj)
+    return _get_type_encoder(obj)(obj, options)
+
+
+def _encode_model(obj: BaseModel, options: _EncoderOptions) -> Any:
+    # TODO: remove when deprecating Pydantic v1
+    encoders: Dict[Any, Any] = {}
+    if not PYDANTIC_V2:
+        encoders = getattr(obj.__config__, "json_encoders", {})  # type: ignore[attr-defined]
+        if options.custom_encoder:
+            encoders.update(options.custom_encoder)
+    obj_dict = _model_dump(
+        obj,
+        mode="json",
+        include=options.include,
+        exclude=options.exclude,
+        by_alias=options.by_alias,
+        exclude_unset=options.exclude_unset,
+        exclude_none=options.exclude_none,
+        exclude_defaults=options.exclude_defaults,
+    )
+    if "__root__" in obj_dict:
+        obj_dict = obj_dict["__root__"]
+    if PYDANTIC_V2 and not _may_need_json_filtering(type(obj), options):
+        # The data dumped in JSON mode is already made of JSON types, and custom
+        # encoders don't apply to it
+        return obj_dict
+    if PYDANTIC_V2:
+        return _filter_json_data(
+            obj_dict, options.sqlalchemy_safe, options.exclude_none
         )
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(
-            obj_dict,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
+    return _encode(
+        obj_dict,
+        _EncoderOptions(
+            include=None,
+            exclude=None,
+            by_alias=True,
+            exclude_unset=False,
+            exclude_defaults=options.exclude_defaults,
+            exclude_none=options.exclude_none,
             # TODO: remove when deprecating Pydantic v1
             custom_encoder=encoders,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if dataclasses.is_dataclass(obj):
-        obj_dict = dataclasses.asdict(obj)
-        return jsonable_encoder(
-            obj_dict,
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            custom_encoder=custom_encoder,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, UndefinedType):
-        return None
-    if isinstance(obj, dict):
-        encoded_dict = {}
+            sqlalchemy_safe=options.sqlalchemy_safe,
+        ),
+    )
+
+
+# Schemas that can serialize dicts with any keys and None values
+_UNFILTERED_SCHEMA_TYPES = {"any", "dict", "typed-dict", "dataclass", "is-instance"}
+_models_needing_json_filtering: Dict[Type[Any], bool] = {}
+
+
+def _schema_may_need_json_filtering(schema: Any) -> bool:
+    if isinstance(schema, (list, tuple)):
+        return any(_schema_may_need_json_filtering(item) for item in schema)
+    if isinstance(schema, str):
+        return schema.startswith("_sa")
+    if not isinstance(schema, dict):
+        return False
+    if schema.get("type") in _UNFILTERED_SCHEMA_TYPES:
+        return True
+    serialization = schema.get("serialization")
+    if isinstance(serialization, dict) and serialization.get("type") in (
+        "function-plain",
+        "function-wrap",
+    ):
+        return True
+    if "allow" in (schema.get("extra_behavior"), schema.get("extra_fields_behavior")):
+        return True
+    return any(
+        _schema_may_need_json_filtering(key) or _schema_may_need_json_filtering(value)
+        for key, value in schema.items()
+    )
+
+
+def _may_need_json_filtering(model: Type[BaseModel], options: _EncoderOptions) -> bool:
+    """
+    Check if the data of a Pydantic v2 model dumped in JSON mode could have keys
+    starting with `_sa` or None values that `jsonable_encoder()` has to remove,
+    from its schema, e.g. when it has dict fields or custom serializers.
+    """
+    if not options.sqlalchemy_safe and not options.exclude_none:
+        return False
+    try:
+        return _models_needing_json_filtering[model]
+    except KeyError:
+        pass
+    needs_filtering = _schema_may_need_json_filtering(model.__pydantic_core_schema__)
+    if len(_models_needing_json_filtering) >= _MAX_CACHED_TYPES:
+        _models_needing_json_filtering.clear()
+    _models_needing_json_filtering[model] = needs_filtering
+    return needs_filtering
+
+
+def _filter_json_data(data: Any, sqlalchemy_safe: bool, exclude_none: bool) -> Any:
+    if type(data) is dict:
+        filtered_dict = {}
+        for key, value in data.items():
+            if sqlalchemy_safe and isinstance(key, str) and key.startswith("_sa"):
+                continue
+            if value is None:
+                if exclude_none:
+                    continue
+            elif type(value) is dict or type(value) is list:
+                value = _filter_json_data(value, sqlalchemy_safe, exclude_none)
+            filtered_dict[key] = value
+        return filtered_dict
+    if type(data) is list:
+        return [
+            _filter_json_data(item, sqlalchemy_safe, exclude_none)
+            if type(item) is dict or type(item) is list
+            else item
+            for item in data
+        ]
+    return data
+
+
+def _encode_dataclass(obj: Any, options: _EncoderOptions) -> Any:
+    return _encode(dataclasses.asdict(obj), options)
+
+
+def _encode_enum(obj: Enum, options: _EncoderOptions) -> Any:
+    return obj.value
+
+
+def _encode_path(obj: PurePath, options: _EncoderOptions) -> str:
+    return str(obj)
+
+
+def _encode_primitive(obj: Any, options: _EncoderOptions) -> Any:
+    return obj
+
+
+def _encode_undefined(obj: UndefinedType, options: _EncoderOptions) -> None:
+    return None
+
+
+def _encode_dict(obj: Dict[Any, Any], options: _EncoderOptions) -> Dict[Any, Any]:
+    encoded_dict = {}
+    allowed_keys = None
+    if options.include is not None or options.exclude is not None:
         allowed_keys = set(obj.keys())
-        if include is not None:
-            allowed_keys &= set(include)
-        if exclude is not None:
-            allowed_keys -= set(exclude)
-        for key, value in obj.items():
-            if (
-                (
-                    not sqlalchemy_safe
-                    or (not isinstance(key, str))
-                    or (not key.startswith("_sa"))
-                )
-                and (value is not None or not exclude_none)
-                and key in allowed_keys
-            ):
-                encoded_key = jsonable_encoder(
-                    key,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_value = jsonable_encoder(
-                    value,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple, deque)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(
-                jsonable_encoder(
-                    item,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-            )
-        return encoded_list
+        if options.include is not None:
+            allowed_keys &= set(options.include)
+        if options.exclude is not None:
+            allowed_keys -= set(options.exclude)
+    sqlalchemy_safe = options.sqlalchemy_safe
+    exclude_none = options.exclude_none
+    items_options = options.items_options
+    # Without custom encoders, str keys and primitive values are kept as is
+    fast_path = not options.custom_encoder
+    for key, value in obj.items():
+        if sqlalchemy_safe and isinstance(key, str) and key.startswith("_sa"):
+            continue
+        if value is None and exclude_none:
+            continue
+        if allowed_keys is not None and key not in allowed_keys:
+            continue
+        if not fast_path or type(key) is not str:
+            key = _encode(key, items_options)
+        if not fast_path or type(value) not in _PRIMITIVE_TYPES:
+            value = _encode(value, items_options)
+        encoded_dict[key] = value
+    return encoded_dict
+
+
+def _encode_sequence(obj: Any, options: _EncoderOptions) -> List[Any]:
+    if options.custom_encoder:
+        return [_encode(item, options) for item in obj]
+    return [
+        item if type(item) in _PRIMITIVE_TYPES else _encode(item, options)
+        for item in obj
+    ]
 
-    if type(obj) in ENCODERS_BY_TYPE:
-        return ENCODERS_BY_TYPE[type(obj)](obj)
-    for encoder, classes_tuple in encoders_by_class_tuples.items():
-        if isinstance(obj, classes_tuple):
-            return encoder(obj)
 
+def _encode_other(obj: Any, options: _EncoderOptions) -> Any:
+    encoder = ENCODERS_BY_TYPE.get(type(obj))
+    if encoder is None:
+        encoder = _get_class_tuples_encoder(obj)
+    if encoder is not None:
+        return encoder(obj)
     try:
         data = dict(obj)
     except Exception as e:
@@ -330,14 +508,70 @@ def jsonable_encoder(
         except Exception as e:
             errors.append(e)
             raise ValueError(errors) from e
-    return jsonable_encoder(
-        data,
-        include=include,
-        exclude=exclude,
-        by_alias=by_alias,
-        exclude_unset=exclude_unset,
-        exclude_defaults=exclude_defaults,
-        exclude_none=exclude_none,
-        custom_encoder=custom_encoder,
-        sqlalchemy_safe=sqlalchemy_safe,
-    )
+    return _encode(data, options)
+
+
+_TypeEncoder = Callable[[Any, _EncoderOptions], Any]
+_type_encoders: Dict[Type[Any], _TypeEncoder] = {}
+_class_tuples_encoders: Dict[Type[Any], Optional[Callable[[Any], Any]]] = {}
+
+
+def _is_cacheable(obj: Any) -> bool:
+    # Classes can be dataclasses or not with the same metaclass, and objects can
+    # pretend to be instances of another class with __class__
+    type_ = type(obj)
+    return obj.__class__ is type_ and not issubclass(type_, type)
+
+
+def _get_class_tuples_encoder(obj: Any) -> Optional[Callable[[Any], Any]]:
+    type_ = type(obj)
+    try:
+        return _class_tuples_encoders[type_]
+    except KeyError:
+        pass
+    found = None
+    for encoder, classes_tuple in encoders_by_class_tuples.items():
+        if isinstance(obj, classes_tuple):
+            found = encoder
+            break
+    if _is_cacheable(obj):
+        if len(_class_tuples_encoders) >= _MAX_CACHED_TYPES:
+            _class_tuples_encoders.clear()
+        _class_tuples_encoders[type_] = found
+    return found
+
+
+def _get_type_encoder(obj: Any) -> _TypeEncoder:
+    """
+    Get the function that encodes `obj`, resolved once for each type, checking the
+    types in the same order as `jsonable_encoder()` always did.
+    """
+    type_ = type(obj)
+    try:
+        return _type_encoders[type_]
+    except KeyError:
+        pass
+    type_encoder: _TypeEncoder
+    if isinstance(obj, BaseModel):
+        type_encoder = _encode_model
+    elif dataclasses.is_dataclass(obj):
+        type_encoder = _encode_dataclass
+    elif isinstance(obj, Enum):
+        type_encoder = _encode_enum
+    elif isinstance(obj, PurePath):
+        type_encoder = _encode_path
+    elif isinstance(obj, (str, int, float, type(None))):
+        type_encoder = _encode_primitive
+    elif isinstance(obj, UndefinedType):
+        type_encoder = _encode_undefined
+    elif isinstance(obj, dict):
+        type_encoder = _encode_dict
+    elif isinstance(obj, _SEQUENCE_TYPES):
+        type_encoder = _encode_sequence
+    else:
+        type_encoder = _encode_other
+    if _is_cacheable(obj):
+        if len(_type_encoders) >= _MAX_CACHED_TYPES:
+            _type_encoders.clear()
+        _type_encoders[type_] = type_encoder
+    return type_encoder
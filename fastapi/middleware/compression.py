@@ -0,0 +1,275 @@
+import abc
+import zlib
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None  # type: ignore
+
+DEFAULT_ENCODINGS = ("zstd", "br", "gzip")
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+DEFAULT_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "image/svg+xml",
+)
+DEFAULT_EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class Compressor(abc.ABC):
+    """
+    Compress a response body chunk by chunk, flushing each chunk so that it can be
+    sent right away.
+    """
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    def finish(self, data: bytes) -> bytes:
+        pass  # pragma: no cover
+
+
+class GZipCompressor(Compressor):
+    def __init__(self, level: int) -> None:
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data) + self._compressobj.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data) + self._compressobj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self, level: int) -> None:
+        assert brotli is not None, "brotli must be installed to use Brotli"
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        body: bytes = self._compressor.process(data) + self._compressor.flush()
+        return body
+
+    def finish(self, data: bytes) -> bytes:
+        body: bytes = self._compressor.process(data) + self._compressor.finish()
+        return body
+
+
+class ZstdCompressor(Compressor):
+    # A ZstdCompressor (and its compression context) can only be used by one
+    # stream at a time, the idle ones are reused by the next responses
+    _pools: Dict[int, List["zstandard.ZstdCompressor"]] = {}
+
+    def __init__(self, level: int) -> None:
+        assert zstandard is not None, "zstandard must be installed to use Zstandard"
+        self._pool = self._pools.setdefault(level, [])
+        self._compressor = (
+            self._pool.pop() if self._pool else zstandard.ZstdCompressor(level=level)
+        )
+        self._compressobj = self._compressor.compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        body: bytes = self._compressobj.compress(data) + self._compressobj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        return body
+
+    def finish(self, data: bytes) -> bytes:
+        body: bytes = self._compressobj.compress(data) + self._compressobj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+        )
+        self._pool.append(self._compressor)
+        return body
+
+
+COMPRESSORS: Dict[str, Callable[[int], Compressor]] = {
+    "zstd": ZstdCompressor,
+    "br": BrotliCompressor,
+    "gzip": GZipCompressor,
+}
+
+
+def get_available_encodings() -> Tuple[str, ...]:
+    available = {"gzip"}
+    if zstandard is not None:
+        available.add("zstd")
+    if brotli is not None:
+        available.add("br")
+    return tuple(encoding for encoding in DEFAULT_ENCODINGS if encoding in available)
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Pick the encoding with the highest quality value in an `Accept-Encoding` header
+    among `encodings`, in the order of `encodings` when the quality is the same.
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress the responses with Zstandard, Brotli or GZip, negotiated from the
+    `Accept-Encoding` header of the request.
+
+    Zstandard needs the `zstandard` package and Brotli the `brotli` package, the
+    encodings that are not installed are not offered.
+
+    Only responses with a content type starting with one of `content_types`, and
+    not with one of `exclude_content_types`, are compressed. Responses with a
+    body smaller than `minimum_size` bytes are sent as is, and so are partial
+    responses, with a `206` status code or a `Content-Range` header. Streaming
+    responses are compressed chunk by chunk, each chunk is flushed to be sent right
+    away.
+
+    `levels` sets the compression level of each encoding, by default
+    `{"zstd": 3, "br": 4, "gzip": 6}`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 500,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+        levels: Optional[Mapping[str, int]] = None,
+        content_types: Sequence[str] = DEFAULT_CONTENT_TYPES,
+        exclude_content_types: Sequence[str] = DEFAULT_EXCLUDED_CONTENT_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        available = get_available_encodings()
+        self.encodings = [encoding for encoding in encodings if encoding in available]
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.content_types = tuple(content_types)
+        self.exclude_content_types = tuple(exclude_content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            headers.get("accept-encoding", ""), self.encodings
+        )
+        responder = CompressionResponder(self, encoding)
+        await self.app(scope, receive, responder.send_with_compression(send))
+
+
+class CompressionResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: Optional[str]
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor: Optional[Compressor] = None
+
+    def is_compressible(self, headers: Headers) -> bool:
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(
+            self.middleware.content_types
+        ) and not content_type.startswith(self.middleware.exclude_content_types)
+
+    def send_with_compression(self, send: Send) -> Send:
+        async def wrapped_send(message: Message) -> None:
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                # Don't send the initial message until we know if the body is
+                # compressed, to set the headers
+                self.initial_message = message
+                headers = Headers(raw=message["headers"])
+                compressible = self.is_compressible(headers)
+                if compressible:
+                    MutableHeaders(raw=message["headers"]).add_vary_header(
+                        "Accept-Encoding"
+                    )
+                self.passthrough = (
+                    not compressible
+                    or self.encoding is None
+                    or "content-encoding" in headers
+                    or message["status"] in (204, 206, 304)
+                    # The range is of the bytes of the uncompressed body
+                    or "content-range" in headers
+                )
+            elif message_type != "http.response.body" or self.passthrough:
+                if not self.started:
+                    self.started = True
+                    await send(self.initial_message)
+                await send(message)
+            elif not self.started:
+                self.started = True
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if len(body) < self.middleware.minimum_size and not more_body:
+                    # Don't compress small responses
+                    await send(self.initial_message)
+                    await send(message)
+                    return
+                assert self.encoding is not None
+                compressor_class = COMPRESSORS[self.encoding]
+                self.compressor = compressor_class(
+                    self.middleware.levels[self.encoding]
+                )
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                headers["content-encoding"] = self.encoding
+                # The compressed representation is not byte-for-byte the same
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["etag"] = f"W/{etag}"
+                if more_body:
+                    del headers["content-length"]
+                    body = self.compressor.compress(body)
+                else:
+                    body = self.compressor.finish(body)
+                    headers["content-length"] = str(len(body))
+                await send(self.initial_message)
+                await send({**message, "body": body})
+            else:
+                assert self.compressor is not None
+                body = message.get("body", b"")
+                if message.get("more_body", False):
+                    body = self.compressor.compress(body)
+                else:
+                    body = self.compressor.finish(body)
+                await send({**message, "body": body})
+
+        return wrapped_send
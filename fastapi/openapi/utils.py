@@ -25,7 +25,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.constants import METHODS_WITH_BODY, REF_PREFIX, REF_TEMPLATE
 from fastapi.openapi.models import OpenAPI
 from fastapi.params import Body, ParamTypes
-from fastapi.responses import Response
+from fastapi.responses import EventSourceResponse, Response
 from fastapi.types import ModelNameMap
 from fastapi.utils import (
     deep_dict_update,
@@ -251,6 +251,17 @@ def get_openapi_operation_metadata(
     return operation
 
 
+def _get_route_dependant(route: routing.APIRoute) -> Dependant:
+    # The dependency returning the ETag version is solved on its own, before the
+    # path operation, its parameters are parameters of the path operation too
+    if route.etag_dependant is None:
+        return route.dependant
+    return Dependant(
+        path=route.dependant.path,
+        dependencies=[*route.etag_dependant.dependencies, route.dependant],
+    )
+
+
 def get_openapi_path(
     *,
     route: routing.APIRoute,
@@ -278,7 +289,8 @@ def get_openapi_path(
                 route=route, method=method, operation_ids=operation_ids
             )
             parameters: List[Dict[str, Any]] = []
-            flat_dependant = get_flat_dependant(route.dependant, skip_repeats=True)
+            route_dependant = _get_route_dependant(route)
+            flat_dependant = get_flat_dependant(route_dependant, skip_repeats=True)
             security_definitions, operation_security = get_openapi_security_definitions(
                 flat_dependant=flat_dependant
             )
@@ -287,7 +299,7 @@ def get_openapi_path(
             if security_definitions:
                 security_schemes.update(security_definitions)
             operation_parameters = _get_openapi_operation_parameters(
-                dependant=route.dependant,
+                dependant=route_dependant,
                 schema_generator=schema_generator,
                 model_name_map=model_name_map,
                 field_mapping=field_mapping,
@@ -355,7 +367,10 @@ def get_openapi_path(
                 route.status_code
             ):
                 response_schema = {"type": "string"}
-                if lenient_issubclass(current_response_class, JSONResponse):
+                # The schema of Server-Sent Events is the one of their data
+                if lenient_issubclass(
+                    current_response_class, (JSONResponse, EventSourceResponse)
+                ):
                     if route.response_field:
                         response_schema = get_schema_from_model_field(
                             field=route.response_field,
@@ -417,7 +432,7 @@ def get_openapi_path(
                     deep_dict_update(openapi_response, process_response)
                     openapi_response["description"] = description
             http422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
-            all_route_params = get_flat_params(route.dependant)
+            all_route_params = get_flat_params(route_dependant)
             if (all_route_params or route.body_field) and not any(
                 status in operation["responses"]
                 for status in [http422, "4XX", "default"]
@@ -465,7 +480,7 @@ def get_fields_from_routes(
                 responses_from_routes.extend(route.response_fields.values())
             if route.callbacks:
                 callback_flat_models.extend(get_fields_from_routes(route.callbacks))
-            params = get_flat_params(route.dependant)
+            params = get_flat_params(_get_route_dependant(route))
             request_fields_from_routes.extend(params)
 
     flat_models = callback_flat_models + list(
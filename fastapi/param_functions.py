@@ -2,8 +2,9 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from fastapi import params
 from fastapi._compat import Undefined
+from fastapi.dependencies.cache import DependencyCache
 from fastapi.openapi.models import Example
-from typing_extensions import Annotated, Doc, deprecated
+from typing_extensions import Annotated, Doc, Literal, deprecated
 
 _Unset: Any = Undefined
 
@@ -2244,6 +2245,41 @@ def Depends(  # noqa: N802
             """
         ),
     ] = True,
+    scope: Annotated[
+        Literal["request", "app"],
+        Doc(
+            """
+            By default (`"request"`), the dependency is solved for each request.
+
+            Set `scope` to `"app"` to solve the dependency once, the first time it's
+            needed, and re-use the same value in all the requests, until the app
+            shuts down. If it's a dependency with `yield`, the code after the `yield`
+            is run when the app shuts down.
+
+            This is useful for things like connection pools, HTTP clients, or
+            machine learning models.
+
+            An app-scoped dependency (and its own sub-dependencies) can't declare
+            parameters that come from the request, like query parameters, or the
+            `Request` itself.
+            """
+        ),
+    ] = "request",
+    cache: Annotated[
+        Optional[DependencyCache],
+        Doc(
+            """
+            A `DependencyCache` to keep the results of the dependency across
+            requests, for the same values of its parameters and sub-dependencies.
+
+            The cache can expire results after a `ttl` (in seconds) and keeps at most
+            `max_size` results, evicting the least recently used ones. Its `stats`
+            have the number of hits and misses.
+
+            It can't be used with dependencies with `yield`.
+            """
+        ),
+    ] = None,
 ) -> Any:
     """
     Declare a FastAPI dependency.
@@ -2274,7 +2310,9 @@ def Depends(  # noqa: N802
         return commons
     ```
     """
-    return params.Depends(dependency=dependency, use_cache=use_cache)
+    return params.Depends(
+        dependency=dependency, use_cache=use_cache, scope=scope, cache=cache
+    )
 
 
 def Security(  # noqa: N802
@@ -2321,6 +2359,21 @@ def Security(  # noqa: N802
             """
         ),
     ] = True,
+    cache: Annotated[
+        Optional[DependencyCache],
+        Doc(
+            """
+            A `DependencyCache` to keep the results of the dependency across
+            requests, for the same values of its parameters and sub-dependencies.
+
+            The cache can expire results after a `ttl` (in seconds) and keeps at most
+            `max_size` results, evicting the least recently used ones. Its `stats`
+            have the number of hits and misses.
+
+            It can't be used with dependencies with `yield`.
+            """
+        ),
+    ] = None,
 ) -> Any:
     """
     Declare a FastAPI Security dependency.
@@ -2357,4 +2410,6 @@ def Security(  # noqa: N802
         return [{"item_id": "Foo", "owner": current_user.username}]
     ```
     """
-    return params.Security(dependency=dependency, scopes=scopes, use_cache=use_cache)
+    return params.Security(
+        dependency=dependency, scopes=scopes, use_cache=use_cache, cache=cache
+    )
@@ -2,9 +2,10 @@ import warnings
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
+from fastapi.dependencies.cache import DependencyCache
 from fastapi.openapi.models import Example
 from pydantic.fields import FieldInfo
-from typing_extensions import Annotated, deprecated
+from typing_extensions import Annotated, Literal, deprecated
 
 from ._compat import (
     PYDANTIC_V2,
@@ -763,15 +764,23 @@ class File(Form):
 
 class Depends:
     def __init__(
-        self, dependency: Optional[Callable[..., Any]] = None, *, use_cache: bool = True
+        self,
+        dependency: Optional[Callable[..., Any]] = None,
+        *,
+        use_cache: bool = True,
+        scope: Literal["request", "app"] = "request",
+        cache: Optional[DependencyCache] = None,
     ):
         self.dependency = dependency
         self.use_cache = use_cache
+        self.scope = scope
+        self.cache = cache
 
     def __repr__(self) -> str:
         attr = getattr(self.dependency, "__name__", type(self.dependency).__name__)
         cache = "" if self.use_cache else ", use_cache=False"
-        return f"{self.__class__.__name__}({attr}{cache})"
+        scope = "" if self.scope == "request" else f", scope={self.scope!r}"
+        return f"{self.__class__.__name__}({attr}{cache}{scope})"
 
 
 class Security(Depends):
@@ -781,6 +790,7 @@ class Security(Depends):
         *,
         scopes: Optional[Sequence[str]] = None,
         use_cache: bool = True,
+        cache: Optional[DependencyCache] = None,
     ):
-        super().__init__(dependency=dependency, use_cache=use_cache)
+        super().__init__(dependency=dependency, use_cache=use_cache, cache=cache)
         self.scopes = scopes or []
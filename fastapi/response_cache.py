@@ -0,0 +1,259 @@
+import abc
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    raw_headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(
+            len(name) + len(value) for name, value in self.raw_headers
+        )
+
+    def to_response(self) -> Response:
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+class ResponseCacheBackend(abc.ABC):
+    """
+    Where a `ResponseCache` stores the responses.
+
+    Subclass it to store them somewhere else than in memory, e.g. in Redis, the
+    `CachedResponse`s have to be serialized by the backend.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def set(
+        self, key: str, response: CachedResponse, *, ttl: Optional[float]
+    ) -> None:
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        pass  # pragma: no cover
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """
+    Store the responses in memory, in this process, evicting the least recently
+    used ones when there are more than `max_size` of them or when they take more
+    than `max_memory` bytes (of body and headers).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = 1024,
+        max_memory: Optional[int] = 64 * 1024 * 1024,
+    ) -> None:
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.memory = 0
+        self.evictions = 0
+        self._responses: OrderedDict[str, Tuple[float, CachedResponse]] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._responses)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        item = self._responses.get(key)
+        if item is None:
+            return None
+        expires_at, response = item
+        if expires_at < time.monotonic():
+            self._delete(key)
+            return None
+        self._responses.move_to_end(key)
+        return response
+
+    async def set(
+        self, key: str, response: CachedResponse, *, ttl: Optional[float]
+    ) -> None:
+        if self.max_memory is not None and response.size > self.max_memory:
+            return
+        if key in self._responses:
+            self._delete(key)
+        expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+        self._responses[key] = (expires_at, response)
+        self.memory += response.size
+        while (self.max_size is not None and len(self._responses) > self.max_size) or (
+            self.max_memory is not None and self.memory > self.max_memory
+        ):
+            self._delete(next(iter(self._responses)))
+            self.evictions += 1
+
+    async def clear(self) -> None:
+        self._responses.clear()
+        self.memory = 0
+
+    def _delete(self, key: str) -> None:
+        _, response = self._responses.pop(key)
+        self.memory -= response.size
+
+
+@dataclass
+class _PendingResponse:
+    event: anyio.Event
+    # If the response was stored, otherwise the waiting requests generate their own
+    stored: bool = False
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    hits: int
+    misses: int
+    # Requests that could not use the cache, e.g. POST requests
+    bypasses: int
+
+
+class ResponseCache:
+    """
+    A cache for the rendered responses of *path operations*, used with
+    `@app.get("/items/", cache=ResponseCache(...))` or
+    `APIRouter(cache=ResponseCache(...))`.
+
+    Only `GET` and `HEAD` requests use it. The responses are cached by method, path,
+    the query parameters in `query_params` (all of them by default) and the values
+    of the request headers in `vary`. Only responses with a status code in
+    `status_codes`, a body, no cookies, and without `Cache-Control: no-store` or
+    `private` are cached.
+
+    A cache hit skips the dependencies, including the ones handling
+    authentication, the *path operation function* and the serialization of the
+    response, so any header that changes the response, like `Authorization`, has
+    to be in `vary`.
+
+    While a response is being generated, other requests for it wait for it instead
+    of generating it again. If it's not cached in the end, e.g. it has cookies or
+    the *path operation* raised an exception, all the waiting requests generate
+    their own responses concurrently.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = 60,
+        backend: Optional[ResponseCacheBackend] = None,
+        query_params: Optional[Collection[str]] = None,
+        vary: Sequence[str] = (),
+        status_codes: Collection[int] = (200,),
+    ) -> None:
+        self.ttl = ttl
+        self.backend = InMemoryResponseCacheBackend() if backend is None else backend
+        self.query_params = None if query_params is None else set(query_params)
+        self.vary = [name.lower() for name in vary]
+        self.status_codes = set(status_codes)
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self._pending: Dict[str, _PendingResponse] = {}
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            hits=self.hits, misses=self.misses, bypasses=self.bypasses
+        )
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+    def get_key(self, request: Request) -> str:
+        query_params = sorted(
+            (name, value)
+            for name, value in request.query_params.multi_items()
+            if self.query_params is None or name in self.query_params
+        )
+        headers = [f"{name}: {request.headers.get(name, '')}" for name in self.vary]
+        return "\n".join(
+            [request.method, request.url.path, urlencode(query_params), *headers]
+        )
+
+    def is_cacheable(self, response: Response) -> bool:
+        if response.status_code not in self.status_codes or not hasattr(
+            response, "body"
+        ):
+            return False
+        if "set-cookie" in response.headers:
+            return False
+        cache_control = response.headers.get("cache-control", "").lower()
+        return "no-store" not in cache_control and "private" not in cache_control
+
+    async def _store(self, key: str, response: Response) -> bool:
+        if not self.is_cacheable(response):
+            return False
+        await self.backend.set(
+            key,
+            CachedResponse(
+                status_code=response.status_code,
+                raw_headers=list(response.raw_headers),
+                body=bytes(response.body),
+            ),
+            ttl=self.ttl,
+        )
+        return True
+
+    def wrap(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        async def cached_handler(request: Request) -> Response:
+            if request.method not in ("GET", "HEAD"):
+                self.bypasses += 1
+                return await handler(request)
+            key = self.get_key(request)
+            while True:
+                cached = await self.backend.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return cached.to_response()
+                pending = self._pending.get(key)
+                if pending is None:
+                    break
+                await pending.event.wait()
+                if not pending.stored:
+                    # That request failed, or its response is not cacheable, don't
+                    # wait for each other, generate the responses concurrently
+                    self.misses += 1
+                    response = await handler(request)
+                    await self._store(key, response)
+                    return response
+            self.misses += 1
+            pending = self._pending[key] = _PendingResponse(event=anyio.Event())
+            try:
+                response = await handler(request)
+                pending.stored = await self._store(key, response)
+            finally:
+                del self._pending[key]
+                pending.event.set()
+            return response
+
+        return cached_handler
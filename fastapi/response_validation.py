@@ -0,0 +1,160 @@
+import dataclasses
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Tuple, Union
+
+from fastapi._compat import PYDANTIC_V2, ModelField, lenient_issubclass
+from pydantic import BaseModel
+from typing_extensions import Literal, get_args, is_typeddict
+
+
+@dataclass(frozen=True)
+class SampledResponseValidation:
+    """
+    Validate only a random fraction of the responses, created with `sampled()`.
+    """
+
+    rate: float
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.rate <= 1:
+            raise ValueError(
+                f"The response validation sample rate must be between 0 and 1, "
+                f"got {self.rate!r}"
+            )
+
+
+ResponseValidation = Union[
+    Literal["always", "type-check-only", "never"], SampledResponseValidation
+]
+
+
+def sampled(rate: float) -> SampledResponseValidation:
+    """
+    Validate a random fraction `rate` (from `0` to `1`) of the responses against
+    the `response_model`, e.g. `response_validation=sampled(0.01)` validates 1% of
+    them.
+
+    The other responses are serialized with the `response_model` without validating
+    them, as with `response_validation="never"`. Check
+    `route.response_validation_stats` to see how often the sampled validation
+    fails.
+    """
+    return SampledResponseValidation(rate)
+
+
+@dataclass(frozen=True)
+class ResponseValidationStats:
+    validated: int
+    failed: int
+    skipped: int
+
+
+class ResponseValidationMetrics:
+    """
+    Counters of the responses of a path operation that were validated against its
+    `response_model`, the ones that failed that validation, and the ones that were
+    serialized without validating them.
+    """
+
+    def __init__(self) -> None:
+        self.validated = 0
+        self.failed = 0
+        self.skipped = 0
+
+    @property
+    def stats(self) -> ResponseValidationStats:
+        return ResponseValidationStats(
+            validated=self.validated, failed=self.failed, skipped=self.skipped
+        )
+
+    def reset(self) -> None:
+        self.validated = 0
+        self.failed = 0
+        self.skipped = 0
+
+
+def _is_response_model_instance(field: ModelField, value: Any) -> bool:
+    # Only exact instances, an instance of a subclass could have extra fields that
+    # validating it would filter out
+    if PYDANTIC_V2:
+        annotation = field.type_
+    else:
+        annotation = field.outer_type_  # type: ignore[attr-defined]
+    origin = getattr(annotation, "__origin__", None)
+    if origin is None:
+        return isinstance(annotation, type) and type(value) is annotation
+    args: Tuple[Any, ...] = getattr(annotation, "__args__", ())
+    if origin is list and len(args) == 1:
+        item_annotation = args[0]
+        return (
+            isinstance(item_annotation, type)
+            and type(value) is list
+            and all(type(item) is item_annotation for item in value)
+        )
+    return False
+
+
+def _has_fields(annotation: Any) -> bool:
+    # If the annotation has models, dataclasses or TypedDicts, with fields that
+    # serializing data that was not validated could not filter
+    return (
+        lenient_issubclass(annotation, BaseModel)
+        or (isinstance(annotation, type) and dataclasses.is_dataclass(annotation))
+        or is_typeddict(annotation)
+        or any(_has_fields(arg) for arg in get_args(annotation))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _has_cached_fields(annotation: Any) -> bool:
+    return _has_fields(annotation)
+
+
+def _is_filtered_without_validation(field: ModelField, value: Any) -> bool:
+    # If serializing the value with the response field, without validating it, only
+    # sends the data of the response model: when it's made of instances of the
+    # model (or in Pydantic v2 of its subclasses, serialized as the model), or when
+    # there's nothing to filter
+    if PYDANTIC_V2:
+        annotation = field.type_
+    else:
+        annotation = field.outer_type_  # type: ignore[attr-defined]
+    try:
+        has_fields = _has_cached_fields(annotation)
+    except TypeError:
+        # An unhashable annotation
+        has_fields = _has_fields(annotation)
+    if not has_fields:
+        return True
+    if PYDANTIC_V2 and lenient_issubclass(annotation, BaseModel):
+        return isinstance(value, annotation)
+    args: Tuple[Any, ...] = getattr(annotation, "__args__", ())
+    if (
+        PYDANTIC_V2
+        and getattr(annotation, "__origin__", None) is list
+        and len(args) == 1
+        and lenient_issubclass(args[0], BaseModel)
+    ):
+        return type(value) is list and all(isinstance(item, args[0]) for item in value)
+    return _is_response_model_instance(field, value)
+
+
+def should_validate_response(
+    validation: ResponseValidation, field: ModelField, value: Any
+) -> bool:
+    if validation == "always":
+        return True
+    if validation == "type-check-only":
+        return not _is_response_model_instance(field, value)
+    if validation == "never":
+        skip = True
+    else:
+        assert isinstance(validation, SampledResponseValidation), (
+            f"Invalid response validation: {validation!r}"
+        )
+        skip = random.random() >= validation.rate
+    # Data the response model can't filter without validating it, e.g. a dict with
+    # extra keys, is still validated, so that no extra data is sent
+    return not skip or not _is_filtered_without_validation(field, value)
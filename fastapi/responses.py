@@ -1,5 +1,22 @@
-from typing import Any
+import json
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+)
 
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
+from fastapi.encoders import jsonable_encoder
+from starlette._utils import collapse_excgroups
+from starlette.background import BackgroundTask
 from starlette.responses import FileResponse as FileResponse  # noqa
 from starlette.responses import HTMLResponse as HTMLResponse  # noqa
 from starlette.responses import JSONResponse as JSONResponse  # noqa
@@ -7,6 +24,7 @@ from starlette.responses import PlainTextResponse as PlainTextResponse  # noqa
 from starlette.responses import RedirectResponse as RedirectResponse  # noqa
 from starlette.responses import Response as Response  # noqa
 from starlette.responses import StreamingResponse as StreamingResponse  # noqa
+from starlette.types import Receive, Scope, Send
 
 try:
     import ujson
@@ -46,3 +64,210 @@ class ORJSONResponse(JSONResponse):
         return orjson.dumps(
             content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
         )
+
+
+class NDJSONResponse(JSONResponse):
+    """
+    Newline delimited JSON response, each item of the content is rendered as JSON in
+    its own line.
+
+    When a *path operation* using it returns an iterator or an async iterator (e.g.
+    a generator), the items are validated, serialized and sent one by one, as they
+    are produced, instead of rendering the whole content first. As with a
+    `StreamingResponse`, the exit code of the dependencies with `yield` has already
+    run when the items are produced, and an error raised while producing them
+    can't be sent as an error response.
+
+    With any other response class, the items of the iterator are read before
+    sending the response.
+
+    Content that is not a list of items, e.g. a dict, is rendered as a single line,
+    and `None` as an empty body.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def render(self, content: Any) -> bytes:
+        if content is None:
+            return b""
+        render = super().render
+        if isinstance(content, (str, bytes, Mapping)) or not isinstance(
+            content, Iterable
+        ):
+            return render(content) + b"\n"
+        return b"".join(render(item) + b"\n" for item in content)
+
+
+_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass
+class ServerSentEvent:
+    """
+    An event sent with `EventSourceResponse`.
+
+    `data` is sent as is when it's a string (or bytes), anything else is sent as
+    JSON. When a *path operation* has a response model, `data` is validated and
+    serialized with it.
+    """
+
+    data: Any = None
+    event: Optional[str] = None
+    id: Optional[str] = None
+    retry: Optional[int] = None
+    comment: Optional[str] = None
+
+    def encode(self) -> bytes:
+        lines = []
+        if self.comment is not None:
+            lines += [f": {line}" for line in _LINE_BREAK_RE.split(self.comment)]
+        if self.event is not None:
+            _check_single_line("event", self.event)
+            lines.append(f"event: {self.event}")
+        if self.id is not None:
+            _check_single_line("id", self.id)
+            assert "\0" not in self.id, "An event id can't contain a null character"
+            lines.append(f"id: {self.id}")
+        if self.retry is not None:
+            lines.append(f"retry: {int(self.retry)}")
+        if self.data is not None:
+            data = self.data
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            elif not isinstance(data, str):
+                data = json.dumps(
+                    jsonable_encoder(data),
+                    ensure_ascii=False,
+                    allow_nan=False,
+                    indent=None,
+                    separators=(",", ":"),
+                )
+            lines += [f"data: {line}" for line in _LINE_BREAK_RE.split(data)]
+        return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def _check_single_line(name: str, value: str) -> None:
+    assert _LINE_BREAK_RE.search(value) is None, (
+        f"An event {name} can't contain line breaks: {value!r}"
+    )
+
+
+class EventSourceResponse(StreamingResponse):
+    """
+    Server-Sent Events response, it sends each item of the content as an event.
+
+    The items can be `ServerSentEvent`s, or any data to send as the `data` of an
+    event. A *path operation* using it can also return an (async) iterator (e.g. a
+    generator), its items are validated and serialized with the response model one
+    by one, as they are produced.
+
+    A comment is sent as a heartbeat every `ping_interval` seconds (15 by default)
+    without other events, to keep the connection alive through proxies. The events
+    are produced only as fast as the client receives them, and the content stops
+    being iterated when the client disconnects.
+
+    When the client reconnects, it sends the `id` of the last event it received in
+    the `Last-Event-ID` header. It's not handled automatically, declare it as a
+    header parameter to resume the stream from there.
+
+    ## Example
+
+    ```python
+    from typing import AsyncIterator, Optional
+
+    from fastapi import FastAPI, Header
+    from fastapi.responses import EventSourceResponse, ServerSentEvent
+
+    app = FastAPI()
+
+
+    @app.get("/items", response_class=EventSourceResponse)
+    async def stream_items(
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    ) -> AsyncIterator[ServerSentEvent]:
+        start = 0 if last_event_id is None else int(last_event_id) + 1
+        for i in range(start, 10):
+            yield ServerSentEvent(data={"name": f"item{i}"}, id=str(i))
+    ```
+    """
+
+    media_type = "text/event-stream"
+    # Subclass it to change them for path operations using it
+    ping_interval: Optional[float] = 15
+    ping_message = b": ping\n\n"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        ping_interval: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+        if ping_interval is not None:
+            self.ping_interval = ping_interval
+        self.headers.setdefault("cache-control", "no-cache")
+        # Don't let nginx buffer the events
+        self.headers.setdefault("x-accel-buffering", "no")
+
+    async def _encode_events(self) -> AsyncIterator[bytes]:
+        item: Any
+        async for item in self.body_iterator:
+            if isinstance(item, ServerSentEvent):
+                yield item.encode()
+            else:
+                yield ServerSentEvent(data=item).encode()
+
+    async def stream_response(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        # Without a buffer, the events are produced only when the previous one was
+        # sent, and the heartbeat can be sent while waiting for the next one
+        send_stream, receive_stream = anyio.create_memory_object_stream[bytes]()
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(self._produce, send_stream)
+            async with receive_stream:
+                while True:
+                    chunk = self.ping_message
+                    with anyio.move_on_after(self.ping_interval):
+                        try:
+                            chunk = await receive_stream.receive()
+                        except anyio.EndOfStream:
+                            break
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _produce(self, send_stream: MemoryObjectSendStream[bytes]) -> None:
+        async with send_stream:
+            async for chunk in self._encode_events():
+                await send_stream.send(chunk)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Always listen for the client disconnecting, an idle stream could
+        # otherwise only notice it when sending the next heartbeat
+        with collapse_excgroups():
+            async with anyio.create_task_group() as task_group:
+
+                async def wrap(func: Callable[[], Awaitable[None]]) -> None:
+                    await func()
+                    task_group.cancel_scope.cancel()
+
+                task_group.start_soon(wrap, partial(self.stream_response, send))
+                await wrap(partial(self.listen_for_disconnect, receive))
+        if self.background is not None:
+            await self.background()
@@ -1,17 +1,25 @@
 import asyncio
+import collections.abc
 import dataclasses
 import email.message
+import functools
+import hashlib
 import inspect
+import itertools
 import json
-from contextlib import AsyncExitStack, asynccontextmanager
+import threading
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from enum import Enum, IntEnum
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
     Collection,
+    ContextManager,
     Coroutine,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
@@ -24,23 +32,29 @@ from typing import (
 
 from fastapi import params
 from fastapi._compat import (
+    PYDANTIC_V2,
     ModelField,
     Undefined,
     _get_model_config,
     _model_dump,
     _normalize_errors,
+    can_validate_json,
     lenient_issubclass,
 )
+from fastapi._route_trie import RouteTrie
 from fastapi.datastructures import Default, DefaultPlaceholder
-from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.models import Dependant, ExecutionPlan
 from fastapi.dependencies.utils import (
+    ValidatedBody,
     _should_embed_body_fields,
     get_body_field,
     get_dependant,
+    get_execution_plan,
     get_flat_dependant,
     get_parameterless_sub_dependant,
+    get_sub_dependant,
     get_typed_return_annotation,
-    solve_dependencies,
+    solve_execution_plan,
 )
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import (
@@ -49,20 +63,38 @@ from fastapi.exceptions import (
     ResponseValidationError,
     WebSocketRequestValidationError,
 )
+from fastapi.response_cache import ResponseCache
+from fastapi.response_validation import (
+    ResponseValidation,
+    ResponseValidationMetrics,
+    ResponseValidationStats,
+    should_validate_response,
+)
+from fastapi.responses import EventSourceResponse, NDJSONResponse, ServerSentEvent
+from fastapi.startup_profile import StartupProfile
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import (
     create_cloned_field,
     create_model_field,
     generate_unique_id,
+    get_path_param_names,
     get_value_or_default,
     is_body_allowed_for_status_code,
 )
 from pydantic import BaseModel
 from starlette import routing
+from starlette._utils import get_route_path
+from starlette.background import BackgroundTasks as StarletteBackgroundTasks
 from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import URL
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.routing import (
     BaseRoute,
     Match,
@@ -72,9 +104,9 @@ from starlette.routing import (
     websocket_session,
 )
 from starlette.routing import Mount as Mount  # noqa
-from starlette.types import AppType, ASGIApp, Lifespan, Scope
+from starlette.types import AppType, ASGIApp, Lifespan, Receive, Scope, Send
 from starlette.websockets import WebSocket
-from typing_extensions import Annotated, Doc, deprecated
+from typing_extensions import Annotated, Doc, Literal, deprecated, get_args, get_origin
 
 
 def _prepare_response_content(
@@ -152,9 +184,12 @@ async def serialize_response(
     exclude_defaults: bool = False,
     exclude_none: bool = False,
     is_coroutine: bool = True,
+    dump_json: bool = False,
+    validation: ResponseValidation = "always",
+    validation_metrics: Optional[ResponseValidationMetrics] = None,
 ) -> Any:
     if field:
-        errors = []
+        validate = should_validate_response(validation, field, response_content)
         if not hasattr(field, "serialize"):
             # pydantic v1
             response_content = _prepare_response_content(
@@ -163,19 +198,41 @@ async def serialize_response(
                 exclude_defaults=exclude_defaults,
                 exclude_none=exclude_none,
             )
-        if is_coroutine:
-            value, errors_ = field.validate(response_content, {}, loc=("response",))
+        if validate:
+            errors = []
+            if is_coroutine:
+                value, errors_ = field.validate(response_content, {}, loc=("response",))
+            else:
+                value, errors_ = await run_in_threadpool(
+                    field.validate, response_content, {}, loc=("response",)
+                )
+            if isinstance(errors_, list):
+                errors.extend(errors_)
+            elif errors_:
+                errors.append(errors_)
+            if validation_metrics is not None:
+                validation_metrics.validated += 1
+                if errors:
+                    validation_metrics.failed += 1
+            if errors:
+                raise ResponseValidationError(
+                    errors=_normalize_errors(errors), body=response_content
+                )
         else:
-            value, errors_ = await run_in_threadpool(
-                field.validate, response_content, {}, loc=("response",)
-            )
-        if isinstance(errors_, list):
-            errors.extend(errors_)
-        elif errors_:
-            errors.append(errors_)
-        if errors:
-            raise ResponseValidationError(
-                errors=_normalize_errors(errors), body=response_content
+            value = response_content
+            if validation_metrics is not None:
+                validation_metrics.skipped += 1
+
+        if dump_json and hasattr(field, "serialize_json"):
+            return field.serialize_json(
+                value,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                warnings=validate,
             )
 
         if hasattr(field, "serialize"):
@@ -187,6 +244,7 @@ async def serialize_response(
                 exclude_unset=exclude_unset,
                 exclude_defaults=exclude_defaults,
                 exclude_none=exclude_none,
+                warnings=validate,
             )
 
         return jsonable_encoder(
@@ -202,6 +260,188 @@ async def serialize_response(
         return jsonable_encoder(response_content)
 
 
+# Streamed responses are sent in chunks of about this size, and the items of sync
+# iterators are read in a threadpool in batches of this many items
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_BATCH_SIZE = 256
+
+
+def _get_response_item_field(response_field: ModelField) -> Optional[ModelField]:
+    # The field for each item of a list-like response model, used to stream it
+    if PYDANTIC_V2:
+        annotation = response_field.type_
+    else:
+        annotation = response_field.outer_type_  # type: ignore[attr-defined]
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin not in (list, collections.abc.Sequence, collections.abc.Iterable) or (
+        len(args) != 1
+    ):
+        return None
+    return create_cloned_field(
+        create_model_field(
+            name=f"{response_field.name}_item", type_=args[0], mode="serialization"
+        )
+    )
+
+
+_STREAMED_RETURN_TYPES = (
+    collections.abc.Iterator,
+    collections.abc.AsyncIterator,
+    collections.abc.Generator,
+    collections.abc.AsyncGenerator,
+)
+
+
+def _is_event_source_response_class(
+    response_class: Union[Type[Response], DefaultPlaceholder],
+) -> bool:
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    return lenient_issubclass(response_class, EventSourceResponse)
+
+
+def _is_streamed_content(content: Any) -> bool:
+    return isinstance(
+        content, (collections.abc.Iterator, collections.abc.AsyncIterator)
+    ) and not isinstance(content, (str, bytes, Response))
+
+
+def _render_json(content: Any) -> bytes:
+    # The same as JSONResponse.render()
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def _iterate_items(content: Any, *, is_coroutine: bool) -> AsyncIterator[Any]:
+    if isinstance(content, collections.abc.AsyncIterator):
+        async for item in content:
+            yield item
+    elif is_coroutine:
+        for item in content:
+            yield item
+    else:
+        # Iterators from sync path operations could block, read them in a
+        # threadpool, in batches to not switch threads for each item
+        while True:
+            batch = await run_in_threadpool(
+                list, itertools.islice(content, STREAM_BATCH_SIZE)
+            )
+            for item in batch:
+                yield item
+            if len(batch) < STREAM_BATCH_SIZE:
+                break
+
+
+async def stream_response_items(
+    *,
+    field: Optional[ModelField] = None,
+    response_content: Any,
+    ndjson: bool = False,
+    include: Optional[IncEx] = None,
+    exclude: Optional[IncEx] = None,
+    by_alias: bool = True,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    is_coroutine: bool = True,
+    dump_json: bool = False,
+    validation: ResponseValidation = "always",
+    validation_metrics: Optional[ResponseValidationMetrics] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Validate and serialize each item of an (async) iterator as it's produced, and
+    render them as a JSON array or as NDJSON, in chunks of about
+    `STREAM_CHUNK_SIZE` bytes.
+
+    The response has already started when the items are serialized, so an error
+    validating one of them can't be sent as an error response, it's raised and the
+    response is left incomplete.
+    """
+    separator = b"\n" if ndjson else b","
+    chunk: List[bytes] = [] if ndjson else [b"["]
+    chunk_size = 0
+    first = True
+    async for item in _iterate_items(response_content, is_coroutine=is_coroutine):
+        if field:
+            content = await serialize_response(
+                field=field,
+                response_content=item,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                dump_json=dump_json,
+                validation=validation,
+                validation_metrics=validation_metrics,
+            )
+        else:
+            content = jsonable_encoder(item)
+        rendered = content if isinstance(content, bytes) else _render_json(content)
+        if ndjson:
+            chunk += [rendered, separator]
+        elif first:
+            chunk.append(rendered)
+        else:
+            chunk += [separator, rendered]
+        first = False
+        chunk_size += len(rendered) + 1
+        if chunk_size >= STREAM_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+            chunk_size = 0
+    if not ndjson:
+        chunk.append(b"]")
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def stream_server_sent_events(
+    *,
+    field: Optional[ModelField] = None,
+    response_content: Any,
+    include: Optional[IncEx] = None,
+    exclude: Optional[IncEx] = None,
+    by_alias: bool = True,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    is_coroutine: bool = True,
+    dump_json: bool = False,
+    validation: ResponseValidation = "always",
+    validation_metrics: Optional[ResponseValidationMetrics] = None,
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Validate and serialize the data of each event of an (async) iterator as it's
+    produced. Items that are not `ServerSentEvent`s are the data of an event.
+    """
+    async for item in _iterate_items(response_content, is_coroutine=is_coroutine):
+        event = item if isinstance(item, ServerSentEvent) else ServerSentEvent(item)
+        if field and event.data is not None:
+            data = await serialize_response(
+                field=field,
+                response_content=event.data,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                dump_json=dump_json,
+                validation=validation,
+                validation_metrics=validation_metrics,
+            )
+            event = dataclasses.replace(event, data=data)
+        yield event
+
+
 async def run_endpoint_function(
     *, dependant: Dependant, values: Dict[str, Any], is_coroutine: bool
 ) -> Any:
@@ -215,6 +455,173 @@ async def run_endpoint_function(
         return await run_in_threadpool(dependant.call, **values)
 
 
+@dataclasses.dataclass(frozen=True)
+class RequestHandlerPlan:
+    """
+    The steps the request handler of a path operation needs, computed once when the
+    route is created.
+
+    `fast_path` is the specialized handler the route got:
+
+    * `"endpoint_only"`: no parameters, no dependencies and no body, the endpoint
+      is called directly.
+    * `"no_body"`: no request body and no dependencies with `yield`.
+    * `"json_body"`: a JSON request body and no dependencies with `yield`.
+    * `"general"`: anything else, e.g. form bodies or dependencies with `yield`.
+
+    `validates_json_body` is set when the body is a single, not embedded, field,
+    that can be validated directly from the JSON bytes (with Pydantic v2), with the
+    same result as validating the parsed JSON: nothing in it is strict and no
+    validator receives the validation info (that has the validation mode).
+
+    `execution_plan` is the plan to solve the dependencies, built once for both the
+    plan and the request handler.
+    """
+
+    fast_path: Literal["endpoint_only", "no_body", "json_body", "general"]
+    reads_body: bool
+    is_body_form: bool
+    validates_json_body: bool
+    solves_dependencies: bool
+    uses_exit_stack: bool
+    validates_response: bool
+    execution_plan: ExecutionPlan = dataclasses.field(repr=False, compare=False)
+
+
+def _dependant_has_params(dependant: Dependant) -> bool:
+    return bool(
+        dependant.dependencies
+        or dependant.path_params
+        or dependant.query_params
+        or dependant.header_params
+        or dependant.cookie_params
+        or dependant.body_params
+        or dependant.request_param_name
+        or dependant.websocket_param_name
+        or dependant.http_connection_param_name
+        or dependant.response_param_name
+        or dependant.background_tasks_param_name
+        or dependant.security_scopes_param_name
+    )
+
+
+def get_request_handler_plan(
+    *,
+    dependant: Dependant,
+    body_field: Optional[ModelField] = None,
+    response_field: Optional[ModelField] = None,
+) -> RequestHandlerPlan:
+    reads_body = body_field is not None
+    is_body_form = bool(body_field and isinstance(body_field.field_info, params.Form))
+    validates_json_body = bool(
+        PYDANTIC_V2
+        and body_field is not None
+        and not is_body_form
+        and get_flat_dependant(dependant).body_params == [body_field]
+        and can_validate_json(body_field)
+    )
+    solves_dependencies = _dependant_has_params(dependant)
+    execution_plan = get_execution_plan(dependant)
+    uses_exit_stack = is_body_form or execution_plan.has_yield_dependencies
+    fast_path: Literal["endpoint_only", "no_body", "json_body", "general"]
+    if uses_exit_stack:
+        fast_path = "general"
+    elif reads_body:
+        fast_path = "json_body"
+    elif solves_dependencies:
+        fast_path = "no_body"
+    else:
+        fast_path = "endpoint_only"
+    return RequestHandlerPlan(
+        fast_path=fast_path,
+        reads_body=reads_body,
+        is_body_form=is_body_form,
+        validates_json_body=validates_json_body,
+        solves_dependencies=solves_dependencies,
+        uses_exit_stack=uses_exit_stack,
+        validates_response=response_field is not None,
+        execution_plan=execution_plan,
+    )
+
+
+def _is_json_content_type(content_type_value: Optional[str]) -> bool:
+    if not content_type_value:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type_value
+    if message.get_content_maintype() == "application":
+        subtype = message.get_content_subtype()
+        return subtype == "json" or subtype.endswith("+json")
+    return False
+
+
+def _validate_json_body(
+    body_bytes: bytes, content_type: Optional[str], body_field: ModelField
+) -> Optional[ValidatedBody]:
+    if not _is_json_content_type(content_type):
+        return None
+    value, errors = body_field.validate_json(body_bytes)
+    if errors:
+        # Invalid JSON or data, let _read_request_body() parse the body and the body
+        # field validate it, to get the same errors as with any other JSON body
+        return None
+    return ValidatedBody(value=value)
+
+
+async def _read_request_body(
+    request: Request,
+    *,
+    is_body_form: bool,
+    file_stack: Optional[AsyncExitStack] = None,
+    json_body_field: Optional[ModelField] = None,
+) -> Any:
+    try:
+        if is_body_form:
+            assert file_stack is not None, "Form bodies require a file_stack"
+            form = await request.form()
+            file_stack.push_async_callback(form.close)
+            return form
+        body_bytes = await request.body()
+        if body_bytes:
+            content_type = request.headers.get("content-type")
+            if json_body_field is not None:
+                validated_body = _validate_json_body(
+                    body_bytes, content_type, json_body_field
+                )
+                if validated_body is not None:
+                    return validated_body
+            json_body: Any = Undefined
+            if _is_json_content_type(content_type):
+                json_body = await request.json()
+            if json_body != Undefined:
+                return json_body
+            else:
+                return body_bytes
+        return None
+    except json.JSONDecodeError as e:
+        validation_error = RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", e.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": e.msg},
+                }
+            ],
+            body=e.doc,
+        )
+        raise validation_error from e
+    except HTTPException:
+        # If a middleware raises an HTTPException, it should be raised again
+        raise
+    except Exception as e:
+        http_error = HTTPException(
+            status_code=400, detail="There was an error parsing the body"
+        )
+        raise http_error from e
+
+
 def get_request_handler(
     dependant: Dependant,
     body_field: Optional[ModelField] = None,
@@ -229,73 +636,168 @@ def get_request_handler(
     response_model_exclude_none: bool = False,
     dependency_overrides_provider: Optional[Any] = None,
     embed_body_fields: bool = False,
+    plan: Optional[RequestHandlerPlan] = None,
+    concurrent_dependencies: bool = False,
+    response_model_dump_json: bool = False,
+    response_validation: ResponseValidation = "always",
+    response_validation_metrics: Optional[ResponseValidationMetrics] = None,
 ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
     assert dependant.call is not None, "dependant.call must be a function"
     is_coroutine = asyncio.iscoroutinefunction(dependant.call)
-    is_body_form = body_field and isinstance(body_field.field_info, params.Form)
+    if plan is None:
+        plan = get_request_handler_plan(
+            dependant=dependant, body_field=body_field, response_field=response_field
+        )
+    execution_plan = plan.execution_plan
+    is_body_form = plan.is_body_form
+    json_body_field = body_field if plan.validates_json_body else None
     if isinstance(response_class, DefaultPlaceholder):
         actual_response_class: Type[Response] = response_class.value
     else:
         actual_response_class = response_class
+    # The response content is rendered by the response model field, to JSON bytes
+    renders_json_bytes = bool(
+        response_model_dump_json
+        and PYDANTIC_V2
+        and response_field is not None
+        and actual_response_class.render is JSONResponse.render
+    )
+    # Iterators returned by the endpoint are streamed item by item with
+    # NDJSONResponse, when the response model (if any) is a list of items
+    streams_items = actual_response_class.render is NDJSONResponse.render
+    response_item_field = None
+    if streams_items and response_field:
+        response_item_field = _get_response_item_field(response_field)
+        streams_items = response_item_field is not None
+    streams_events = _is_event_source_response_class(actual_response_class)
+
+    async def build_response(
+        raw_response: Any,
+        background_tasks: Optional[StarletteBackgroundTasks],
+        sub_response: Optional[Response],
+    ) -> Response:
+        if isinstance(raw_response, Response):
+            if raw_response.background is None:
+                raw_response.background = background_tasks
+            return raw_response
+        response_args: Dict[str, Any] = {"background": background_tasks}
+        # If status_code was set, use it, otherwise use the default from the
+        # response class, in the case of redirect it's 307
+        sub_status_code = sub_response.status_code if sub_response else None
+        current_status_code = status_code if status_code else sub_status_code
+        if current_status_code is not None:
+            response_args["status_code"] = current_status_code
+        if sub_status_code:
+            response_args["status_code"] = sub_status_code
+        if streams_events and _is_streamed_content(raw_response):
+            response: Response = actual_response_class(
+                stream_server_sent_events(
+                    field=response_field,
+                    response_content=raw_response,
+                    include=response_model_include,
+                    exclude=response_model_exclude,
+                    by_alias=response_model_by_alias,
+                    exclude_unset=response_model_exclude_unset,
+                    exclude_defaults=response_model_exclude_defaults,
+                    exclude_none=response_model_exclude_none,
+                    is_coroutine=is_coroutine,
+                    dump_json=response_model_dump_json and PYDANTIC_V2,
+                    validation=response_validation,
+                    validation_metrics=response_validation_metrics,
+                ),
+                **response_args,
+            )
+            if sub_response is not None:
+                response.headers.raw.extend(sub_response.headers.raw)
+            return response
+        if (
+            streams_items
+            and _is_streamed_content(raw_response)
+            and is_body_allowed_for_status_code(response_args.get("status_code", 200))
+        ):
+            response = StreamingResponse(
+                stream_response_items(
+                    field=response_item_field,
+                    response_content=raw_response,
+                    ndjson=True,
+                    include=response_model_include,
+                    exclude=response_model_exclude,
+                    by_alias=response_model_by_alias,
+                    exclude_unset=response_model_exclude_unset,
+                    exclude_defaults=response_model_exclude_defaults,
+                    exclude_none=response_model_exclude_none,
+                    is_coroutine=is_coroutine,
+                    dump_json=response_model_dump_json and PYDANTIC_V2,
+                    validation=response_validation,
+                    validation_metrics=response_validation_metrics,
+                ),
+                media_type=actual_response_class.media_type,
+                **response_args,
+            )
+            if sub_response is not None:
+                response.headers.raw.extend(sub_response.headers.raw)
+            return response
+        if _is_streamed_content(raw_response):
+            # Read all the items while the dependencies with yield are still open,
+            # so that the iterator can use them, and its errors are handled as any
+            # other error of the endpoint
+            raw_response = [
+                item
+                async for item in _iterate_items(
+                    raw_response, is_coroutine=is_coroutine
+                )
+            ]
+        if plan.validates_response:
+            content = await serialize_response(
+                field=response_field,
+                response_content=raw_response,
+                include=response_model_include,
+                exclude=response_model_exclude,
+                by_alias=response_model_by_alias,
+                exclude_unset=response_model_exclude_unset,
+                exclude_defaults=response_model_exclude_defaults,
+                exclude_none=response_model_exclude_none,
+                is_coroutine=is_coroutine,
+                dump_json=renders_json_bytes,
+                validation=response_validation,
+                validation_metrics=response_validation_metrics,
+            )
+        else:
+            content = jsonable_encoder(raw_response)
+        if renders_json_bytes:
+            response = actual_response_class(None, **response_args)
+            if is_body_allowed_for_status_code(response.status_code):
+                response.body = content
+                response.headers["content-length"] = str(len(content))
+        else:
+            response = actual_response_class(content, **response_args)
+        if not is_body_allowed_for_status_code(response.status_code):
+            response.body = b""
+        if sub_response is not None:
+            response.headers.raw.extend(sub_response.headers.raw)
+        return response
 
     async def app(request: Request) -> Response:
         response: Union[Response, None] = None
         async with AsyncExitStack() as file_stack:
-            try:
-                body: Any = None
-                if body_field:
-                    if is_body_form:
-                        body = await request.form()
-                        file_stack.push_async_callback(body.close)
-                    else:
-                        body_bytes = await request.body()
-                        if body_bytes:
-                            json_body: Any = Undefined
-                            content_type_value = request.headers.get("content-type")
-                            if not content_type_value:
-                                json_body = await request.json()
-                            else:
-                                message = email.message.Message()
-                                message["content-type"] = content_type_value
-                                if message.get_content_maintype() == "application":
-                                    subtype = message.get_content_subtype()
-                                    if subtype == "json" or subtype.endswith("+json"):
-                                        json_body = await request.json()
-                            if json_body != Undefined:
-                                body = json_body
-                            else:
-                                body = body_bytes
-            except json.JSONDecodeError as e:
-                validation_error = RequestValidationError(
-                    [
-                        {
-                            "type": "json_invalid",
-                            "loc": ("body", e.pos),
-                            "msg": "JSON decode error",
-                            "input": {},
-                            "ctx": {"error": e.msg},
-                        }
-                    ],
-                    body=e.doc,
+            body: Any = None
+            if body_field:
+                body = await _read_request_body(
+                    request,
+                    is_body_form=is_body_form,
+                    file_stack=file_stack,
+                    json_body_field=json_body_field,
                 )
-                raise validation_error from e
-            except HTTPException:
-                # If a middleware raises an HTTPException, it should be raised again
-                raise
-            except Exception as e:
-                http_error = HTTPException(
-                    status_code=400, detail="There was an error parsing the body"
-                )
-                raise http_error from e
             errors: List[Any] = []
             async with AsyncExitStack() as async_exit_stack:
-                solved_result = await solve_dependencies(
+                solved_result = await solve_execution_plan(
                     request=request,
-                    dependant=dependant,
+                    plan=execution_plan,
                     body=body,
                     dependency_overrides_provider=dependency_overrides_provider,
                     async_exit_stack=async_exit_stack,
                     embed_body_fields=embed_body_fields,
+                    concurrent=concurrent_dependencies,
                 )
                 errors = solved_result.errors
                 if not errors:
@@ -304,43 +806,14 @@ def get_request_handler(
                         values=solved_result.values,
                         is_coroutine=is_coroutine,
                     )
-                    if isinstance(raw_response, Response):
-                        if raw_response.background is None:
-                            raw_response.background = solved_result.background_tasks
-                        response = raw_response
-                    else:
-                        response_args: Dict[str, Any] = {
-                            "background": solved_result.background_tasks
-                        }
-                        # If status_code was set, use it, otherwise use the default from the
-                        # response class, in the case of redirect it's 307
-                        current_status_code = (
-                            status_code
-                            if status_code
-                            else solved_result.response.status_code
-                        )
-                        if current_status_code is not None:
-                            response_args["status_code"] = current_status_code
-                        if solved_result.response.status_code:
-                            response_args["status_code"] = (
-                                solved_result.response.status_code
-                            )
-                        content = await serialize_response(
-                            field=response_field,
-                            response_content=raw_response,
-                            include=response_model_include,
-                            exclude=response_model_exclude,
-                            by_alias=response_model_by_alias,
-                            exclude_unset=response_model_exclude_unset,
-                            exclude_defaults=response_model_exclude_defaults,
-                            exclude_none=response_model_exclude_none,
-                            is_coroutine=is_coroutine,
-                        )
-                        response = actual_response_class(content, **response_args)
-                        if not is_body_allowed_for_status_code(response.status_code):
-                            response.body = b""
-                        response.headers.raw.extend(solved_result.response.headers.raw)
+                    response = await build_response(
+                        raw_response,
+                        solved_result.background_tasks,
+                        solved_result.response,
+                    )
             if errors:
+                if isinstance(body, ValidatedBody):
+                    body = await request.json()
                 validation_error = RequestValidationError(
                     _normalize_errors(errors), body=body
                 )
@@ -355,23 +828,177 @@ def get_request_handler(
             )
         return response
 
-    return app
+    if plan.fast_path == "general":
+        return app
+
+    if plan.fast_path == "endpoint_only":
+
+        async def endpoint_only_app(request: Request) -> Response:
+            raw_response = await run_endpoint_function(
+                dependant=dependant, values={}, is_coroutine=is_coroutine
+            )
+            return await build_response(raw_response, None, None)
+
+        return endpoint_only_app
+
+    reads_body = plan.reads_body
+
+    async def app_without_exit_stack(request: Request) -> Response:
+        if (
+            dependency_overrides_provider
+            and dependency_overrides_provider.dependency_overrides
+        ):
+            # An override could be a dependency with yield, use the general handler
+            return await app(request)
+        body: Any = None
+        if reads_body:
+            body = await _read_request_body(
+                request, is_body_form=False, json_body_field=json_body_field
+            )
+        solved_result = await solve_execution_plan(
+            request=request,
+            plan=execution_plan,
+            body=body,
+            dependency_overrides_provider=dependency_overrides_provider,
+            # There are no dependencies with yield, nothing will be added to it
+            async_exit_stack=AsyncExitStack(),
+            embed_body_fields=embed_body_fields,
+            concurrent=concurrent_dependencies,
+        )
+        if solved_result.errors:
+            if isinstance(body, ValidatedBody):
+                body = await request.json()
+            raise RequestValidationError(
+                _normalize_errors(solved_result.errors), body=body
+            )
+        raw_response = await run_endpoint_function(
+            dependant=dependant,
+            values=solved_result.values,
+            is_coroutine=is_coroutine,
+        )
+        return await build_response(
+            raw_response, solved_result.background_tasks, solved_result.response
+        )
+
+    return app_without_exit_stack
+
+
+_NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "vary",
+)
+
+
+def _format_etag(version: Any) -> str:
+    etag = str(version)
+    if etag.startswith(('"', 'W/"')):
+        return etag
+    return f'"{etag}"'
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    # If-None-Match uses the weak comparison, ignoring the W/ prefix
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
+def _not_modified_response(headers: Mapping[str, str]) -> Response:
+    return Response(
+        status_code=304,
+        headers={
+            name: headers[name] for name in _NOT_MODIFIED_HEADERS if name in headers
+        },
+    )
+
+
+def get_etag_handler(
+    handler: Callable[[Request], Coroutine[Any, Any, Response]],
+    *,
+    version_dependant: Optional[Dependant] = None,
+    dependency_overrides_provider: Optional[Any] = None,
+) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+    """
+    Wrap a request handler to set the `ETag` header on the responses to `GET` and
+    `HEAD` requests and to send `304 Not Modified` responses.
+
+    The `ETag` is the version returned by the `etag` sub-dependency of
+    `version_dependant`, solved before calling the handler, or a hash of the
+    rendered body of `200` responses.
+    """
+    version_plan = get_execution_plan(version_dependant) if version_dependant else None
+
+    async def etag_handler(request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return await handler(request)
+        if_none_match = request.headers.get("if-none-match")
+        if version_plan is not None:
+            async with AsyncExitStack() as async_exit_stack:
+                solved_result = await solve_execution_plan(
+                    request=request,
+                    plan=version_plan,
+                    dependency_overrides_provider=dependency_overrides_provider,
+                    async_exit_stack=async_exit_stack,
+                    embed_body_fields=False,
+                )
+            if solved_result.errors:
+                raise RequestValidationError(_normalize_errors(solved_result.errors))
+            version = solved_result.values["etag"]
+            if version is not None:
+                etag = _format_etag(version)
+                if if_none_match and _etag_matches(etag, if_none_match):
+                    return _not_modified_response({"etag": etag})
+                response = await handler(request)
+                if 200 <= response.status_code < 300:
+                    response.headers.setdefault("etag", etag)
+                return response
+        response = await handler(request)
+        if (
+            response.status_code != 200
+            or not hasattr(response, "body")
+            or "etag" in response.headers
+        ):
+            return response
+        etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+        response.headers["etag"] = etag
+        if if_none_match and _etag_matches(etag, if_none_match):
+            not_modified_response = _not_modified_response(response.headers)
+            not_modified_response.background = response.background
+            return not_modified_response
+        return response
+
+    return etag_handler
 
 
 def get_websocket_app(
     dependant: Dependant,
     dependency_overrides_provider: Optional[Any] = None,
     embed_body_fields: bool = False,
+    execution_plan: Optional[ExecutionPlan] = None,
 ) -> Callable[[WebSocket], Coroutine[Any, Any, Any]]:
+    if execution_plan is None:
+        execution_plan = get_execution_plan(dependant)
+
     async def app(websocket: WebSocket) -> None:
         async with AsyncExitStack() as async_exit_stack:
             # TODO: remove this scope later, after a few releases
             # This scope fastapi_astack is no longer used by FastAPI, kept for
             # compatibility, just in case
             websocket.scope["fastapi_astack"] = async_exit_stack
-            solved_result = await solve_dependencies(
+            solved_result = await solve_execution_plan(
                 request=websocket,
-                dependant=dependant,
+                plan=execution_plan,
                 dependency_overrides_provider=dependency_overrides_provider,
                 async_exit_stack=async_exit_stack,
                 embed_body_fields=embed_body_fields,
@@ -386,6 +1013,66 @@ def get_websocket_app(
     return app
 
 
+def _get_shared_dependant(
+    shared_dependants: Optional[Dict[Hashable, Dependant]],
+    key: Hashable,
+    build: Callable[[], Dependant],
+) -> Dependant:
+    if shared_dependants is None:
+        return build()
+    try:
+        dependant = shared_dependants.get(key)
+    except TypeError:
+        # An unhashable callable
+        return build()
+    if dependant is None:
+        dependant = shared_dependants.setdefault(key, build())
+    return dependant
+
+
+def get_route_dependant(
+    *,
+    path: str,
+    call: Callable[..., Any],
+    dependencies: Sequence[params.Depends] = (),
+    shared_dependants: Optional[Dict[Hashable, Dependant]] = None,
+) -> Dependant:
+    """
+    Get the dependant of a route, with its `dependencies` first.
+
+    The parameters and sub-dependencies of the endpoint, and the dependants of the
+    `dependencies`, are stored in `shared_dependants` (the ones of the router), by
+    the endpoint or the `Depends` and the names of the path parameters. They are
+    only built the first time, and reused by the next routes, like the ones created
+    by `include_router()`, that only change the path prefix and add dependencies in
+    front.
+    """
+    path_param_names = frozenset(get_path_param_names(path))
+    endpoint_dependant = _get_shared_dependant(
+        shared_dependants,
+        (call, path_param_names),
+        lambda: get_dependant(path=path, call=call),
+    )
+    route_dependencies = [
+        _get_shared_dependant(
+            shared_dependants,
+            (depends, path_param_names),
+            functools.partial(
+                get_parameterless_sub_dependant, depends=depends, path=path
+            ),
+        )
+        for depends in dependencies
+    ]
+    # A copy, as the endpoint dependant is shared, with the same fields and the
+    # same validators for them
+    return dataclasses.replace(
+        endpoint_dependant,
+        path=path,
+        dependencies=route_dependencies + endpoint_dependant.dependencies,
+        params_validators=endpoint_dependant.params_validators,
+    )
+
+
 class APIWebSocketRoute(routing.WebSocketRoute):
     def __init__(
         self,
@@ -395,27 +1082,30 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         name: Optional[str] = None,
         dependencies: Optional[Sequence[params.Depends]] = None,
         dependency_overrides_provider: Optional[Any] = None,
+        shared_dependants: Optional[Dict[Hashable, Dependant]] = None,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
         self.name = get_name(endpoint) if name is None else name
         self.dependencies = list(dependencies or [])
         self.path_regex, self.path_format, self.param_convertors = compile_path(path)
-        self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
-        for depends in self.dependencies[::-1]:
-            self.dependant.dependencies.insert(
-                0,
-                get_parameterless_sub_dependant(depends=depends, path=self.path_format),
-            )
+        self.dependant = get_route_dependant(
+            path=self.path_format,
+            call=self.endpoint,
+            dependencies=self.dependencies,
+            shared_dependants=shared_dependants,
+        )
         self._flat_dependant = get_flat_dependant(self.dependant)
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
         )
+        self.execution_plan = get_execution_plan(self.dependant)
         self.app = websocket_session(
             get_websocket_app(
                 dependant=self.dependant,
                 dependency_overrides_provider=dependency_overrides_provider,
                 embed_body_fields=self._embed_body_fields,
+                execution_plan=self.execution_plan,
             )
         )
 
@@ -426,6 +1116,24 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         return match, child_scope
 
 
+# The attributes set by APIRoute.compile(), when a route created with lazy=True
+# is compiled on first use
+_COMPILED_ROUTE_ATTRIBUTES = frozenset(
+    {
+        "response_field",
+        "secure_cloned_response_field",
+        "response_fields",
+        "dependant",
+        "_flat_dependant",
+        "_embed_body_fields",
+        "body_field",
+        "request_handler_plan",
+        "etag_dependant",
+        "app",
+    }
+)
+
+
 class APIRoute(routing.Route):
     def __init__(
         self,
@@ -460,6 +1168,16 @@ class APIRoute(routing.Route):
         generate_unique_id_function: Union[
             Callable[["APIRoute"], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        response_model_dump_json: Union[bool, DefaultPlaceholder] = Default(False),
+        response_validation: Union[ResponseValidation, DefaultPlaceholder] = Default(
+            "always"
+        ),
+        cache: Union[ResponseCache, None, DefaultPlaceholder] = Default(None),
+        etag: Union[bool, params.Depends, DefaultPlaceholder] = Default(False),
+        lazy: bool = False,
+        startup_profile: Optional[StartupProfile] = None,
+        shared_dependants: Optional[Dict[Hashable, Dependant]] = None,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
@@ -467,6 +1185,16 @@ class APIRoute(routing.Route):
             return_annotation = get_typed_return_annotation(endpoint)
             if lenient_issubclass(return_annotation, Response):
                 response_model = None
+            elif get_origin(return_annotation) in _STREAMED_RETURN_TYPES:
+                # Returned (async) iterators are streamed as a list of their items,
+                # or as events, with the data of each event as the response model
+                (item_annotation, *_) = get_args(return_annotation) or (Any,)
+                if not _is_event_source_response_class(response_class):
+                    response_model = List[item_annotation]  # type: ignore[valid-type]
+                elif lenient_issubclass(item_annotation, ServerSentEvent):
+                    response_model = None
+                else:
+                    response_model = item_annotation
             else:
                 response_model = return_annotation
         self.response_model = response_model
@@ -486,6 +1214,32 @@ class APIRoute(routing.Route):
         self.callbacks = callbacks
         self.openapi_extra = openapi_extra
         self.generate_unique_id_function = generate_unique_id_function
+        self.concurrent_dependencies = concurrent_dependencies
+        if isinstance(concurrent_dependencies, DefaultPlaceholder):
+            self._concurrent_dependencies: bool = concurrent_dependencies.value
+        else:
+            self._concurrent_dependencies = concurrent_dependencies
+        self.response_model_dump_json = response_model_dump_json
+        if isinstance(response_model_dump_json, DefaultPlaceholder):
+            self._response_model_dump_json: bool = response_model_dump_json.value
+        else:
+            self._response_model_dump_json = response_model_dump_json
+        self.response_validation = response_validation
+        if isinstance(response_validation, DefaultPlaceholder):
+            self._response_validation: ResponseValidation = response_validation.value
+        else:
+            self._response_validation = response_validation
+        self.response_validation_metrics = ResponseValidationMetrics()
+        self.cache = cache
+        if isinstance(cache, DefaultPlaceholder):
+            self._cache: Optional[ResponseCache] = cache.value
+        else:
+            self._cache = cache
+        self.etag = etag
+        if isinstance(etag, DefaultPlaceholder):
+            self._etag: Union[bool, params.Depends] = etag.value
+        else:
+            self._etag = etag
         self.tags = tags or []
         self.responses = responses or {}
         self.name = get_name(endpoint) if name is None else name
@@ -508,12 +1262,64 @@ class APIRoute(routing.Route):
             assert is_body_allowed_for_status_code(status_code), (
                 f"Status code {status_code} must not have a response body"
             )
+        self.dependencies = list(dependencies or [])
+        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
+        # if a "form feed" character (page break) is found in the description text,
+        # truncate description text to the content preceding the first "form feed"
+        self.description = self.description.split("\f")[0].strip()
+        for additional_status_code, response in self.responses.items():
+            assert isinstance(response, dict), "An additional response must be a dict"
+            if response.get("model"):
+                assert is_body_allowed_for_status_code(additional_status_code), (
+                    f"Status code {additional_status_code} must not have a response body"
+                )
+        assert callable(endpoint), "An endpoint must be a callable"
+        self.startup_profile = startup_profile
+        self.shared_dependants = shared_dependants
+        # Reentrant, so that accessing a compiled attribute while compiling raises
+        # an AttributeError instead of waiting forever
+        self._compile_lock = threading.RLock()
+        self._compiling = False
+        self.lazy = lazy
+        if not lazy:
+            self.compile()
+
+    def compile(self) -> None:
+        """
+        Build the dependant, the fields and the ASGI app of the route.
+
+        It's done when the route is created, unless it was created with
+        `lazy=True`, then it's done the first time one of them is used, e.g. when
+        the route handles a request or when the OpenAPI schema is generated.
+        """
+        if "app" in self.__dict__:
+            return
+        with self._compile_lock:
+            if "app" in self.__dict__ or self._compiling:
+                return
+            self._compiling = True
+            try:
+                # The time of the phases measured inside is not counted as "compile"
+                with self._measure("compile"):
+                    self._compile()
+            finally:
+                self._compiling = False
+
+    def _measure(self, phase: str) -> ContextManager[None]:
+        if self.startup_profile is None:
+            return nullcontext()
+        route = f"{','.join(sorted(self.methods))} {self.path}"
+        return self.startup_profile.measure(route, phase)
+
+    def _compile(self) -> None:
+        if self.response_model:
             response_name = "Response_" + self.unique_id
-            self.response_field = create_model_field(
-                name=response_name,
-                type_=self.response_model,
-                mode="serialization",
-            )
+            with self._measure("create_model_field"):
+                self.response_field = create_model_field(
+                    name=response_name,
+                    type_=self.response_model,
+                    mode="serialization",
+                )
             # Create a clone of the field, so that a Pydantic submodel is not returned
             # as is just because it's an instance of a subclass of a more limited class
             # e.g. UserInDB (containing hashed_password) could be a subclass of User
@@ -522,52 +1328,78 @@ class APIRoute(routing.Route):
             # By being a new field, no inheritance will be passed as is. A new model
             # will always be created.
             # TODO: remove when deprecating Pydantic v1
-            self.secure_cloned_response_field: Optional[ModelField] = (
-                create_cloned_field(self.response_field)
-            )
+            with self._measure("create_cloned_field"):
+                self.secure_cloned_response_field: Optional[ModelField] = (
+                    create_cloned_field(self.response_field)
+                )
         else:
             self.response_field = None  # type: ignore
             self.secure_cloned_response_field = None
-        self.dependencies = list(dependencies or [])
-        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
-        # if a "form feed" character (page break) is found in the description text,
-        # truncate description text to the content preceding the first "form feed"
-        self.description = self.description.split("\f")[0].strip()
         response_fields = {}
         for additional_status_code, response in self.responses.items():
-            assert isinstance(response, dict), "An additional response must be a dict"
             model = response.get("model")
             if model:
-                assert is_body_allowed_for_status_code(additional_status_code), (
-                    f"Status code {additional_status_code} must not have a response body"
-                )
                 response_name = f"Response_{additional_status_code}_{self.unique_id}"
-                response_field = create_model_field(
-                    name=response_name, type_=model, mode="serialization"
-                )
+                with self._measure("create_model_field"):
+                    response_field = create_model_field(
+                        name=response_name, type_=model, mode="serialization"
+                    )
                 response_fields[additional_status_code] = response_field
         if response_fields:
             self.response_fields: Dict[Union[int, str], ModelField] = response_fields
         else:
             self.response_fields = {}
 
-        assert callable(endpoint), "An endpoint must be a callable"
-        self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
-        for depends in self.dependencies[::-1]:
-            self.dependant.dependencies.insert(
-                0,
-                get_parameterless_sub_dependant(depends=depends, path=self.path_format),
+        with self._measure("get_dependant"):
+            self.dependant = get_route_dependant(
+                path=self.path_format,
+                call=self.endpoint,
+                dependencies=self.dependencies,
+                shared_dependants=self.shared_dependants,
             )
         self._flat_dependant = get_flat_dependant(self.dependant)
         self._embed_body_fields = _should_embed_body_fields(
             self._flat_dependant.body_params
         )
-        self.body_field = get_body_field(
-            flat_dependant=self._flat_dependant,
-            name=self.unique_id,
-            embed_body_fields=self._embed_body_fields,
+        with self._measure("get_body_field"):
+            self.body_field = get_body_field(
+                flat_dependant=self._flat_dependant,
+                name=self.unique_id,
+                embed_body_fields=self._embed_body_fields,
+            )
+        self.request_handler_plan = get_request_handler_plan(
+            dependant=self.dependant,
+            body_field=self.body_field,
+            response_field=self.secure_cloned_response_field,
         )
-        self.app = request_response(self.get_route_handler())
+        # The dependency returning the version used as the ETag, solved on its own
+        # before the rest of the path operation
+        self.etag_dependant: Optional[Dependant] = None
+        if isinstance(self._etag, params.Depends):
+            assert callable(self._etag.dependency), (
+                "An ETag dependency must have a callable dependency"
+            )
+            self.etag_dependant = Dependant(
+                path=self.path_format,
+                dependencies=[
+                    get_sub_dependant(
+                        depends=self._etag,
+                        dependency=self._etag.dependency,
+                        path=self.path_format,
+                        name="etag",
+                    )
+                ],
+            )
+        handler = self.get_route_handler()
+        if self._cache is not None:
+            handler = self._cache.wrap(handler)
+        if self._etag:
+            handler = get_etag_handler(
+                handler,
+                version_dependant=self.etag_dependant,
+                dependency_overrides_provider=self.dependency_overrides_provider,
+            )
+        self.app = request_response(handler)
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         return get_request_handler(
@@ -584,8 +1416,27 @@ class APIRoute(routing.Route):
             response_model_exclude_none=self.response_model_exclude_none,
             dependency_overrides_provider=self.dependency_overrides_provider,
             embed_body_fields=self._embed_body_fields,
+            plan=self.request_handler_plan,
+            concurrent_dependencies=self._concurrent_dependencies,
+            response_model_dump_json=self._response_model_dump_json,
+            response_validation=self._response_validation,
+            response_validation_metrics=self.response_validation_metrics,
         )
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if name in _COMPILED_ROUTE_ATTRIBUTES and "lazy" in self.__dict__:
+                self.compile()
+                return object.__getattribute__(self, name)
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    @property
+    def response_validation_stats(self) -> ResponseValidationStats:
+        return self.response_validation_metrics.stats
+
     def matches(self, scope: Scope) -> Tuple[Match, Scope]:
         match, child_scope = super().matches(scope)
         if match != Match.NONE:
@@ -834,6 +1685,127 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        route_trie: Annotated[
+            bool,
+            Doc(
+                """
+                Dispatch requests using a segment trie built from the routes,
+                instead of checking every route in order until one matches.
+
+                The trie only narrows down the routes that could match the path, so
+                the precedence of routes, `405 Method Not Allowed` responses,
+                mounted apps and redirects of slashes work the same way. This makes
+                the cost of finding a route depend on the depth of the path instead
+                of the number of routes, which is useful for routers with many
+                routes.
+                """
+            ),
+        ] = False,
+        lazy_routes: Annotated[
+            bool,
+            Doc(
+                """
+                Defer building the dependencies, the request body and the response
+                models of the *path operations* added to this router (or included
+                in it) until each one is first used, by a request or to generate
+                the OpenAPI schema, instead of doing it when they are declared.
+
+                This makes startup faster for routers with many routes, e.g. for
+                serverless deployments. Errors in the declaration of a *path
+                operation* are then only raised when it's first used, or by
+                `app.warmup()`.
+                """
+            ),
+        ] = False,
+        startup_profile: Annotated[
+            Optional[StartupProfile],
+            Doc(
+                """
+                A `StartupProfile` to record the time and memory spent building
+                each *path operation* added to this router.
+
+                The *path operations* included in an app created with
+                `FastAPI(startup_profile=True)` are recorded in the app's profile,
+                pass `app.startup_profile` here to also record the ones declared in
+                the router.
+                """
+            ),
+        ] = None,
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of the *path operations*
+                in this router concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only
+                depend on other `async def` functions, run at the same time in a
+                task group. The dependency cache of the request is kept, a cached
+                dependency is still called only once.
+
+                Context variables set by the dependencies that run concurrently, in
+                the task group, are not kept: they are not set for the *path
+                operation function* nor for the other dependencies.
+
+                It can be overridden in each *path operation*.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response models of the *path operations* in this
+                router directly to JSON bytes with Pydantic, instead of converting
+                them to JSON-compatible Python data first and then rendering them
+                with `json.dumps()`.
+
+                It's only used with Pydantic v2, when there's a `response_model` and
+                the response class renders JSON as `JSONResponse` does.
+
+                It can be overridden in each *path operation*.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operations* in this
+                router against their `response_model`: `"always"`,
+                `"type-check-only"`, `sampled(rate)` (from
+                `fastapi.response_validation`), or `"never"`.
+
+                It can be overridden in each *path operation*.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the
+                rendered responses of the *path operations* in this router.
+
+                It can be overridden in each *path operation*.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses of the *path operations* in
+                this router and send `304 Not Modified` responses to requests with
+                a matching `If-None-Match` header. `True` to hash the rendered body,
+                or `Depends(get_version)` to use the version returned by a
+                dependency.
+
+                It can be overridden in each *path operation*.
+                """
+            ),
+        ] = Default(False),
     ) -> None:
         super().__init__(
             routes=routes,
@@ -859,6 +1831,66 @@ class APIRouter(routing.Router):
         self.route_class = route_class
         self.default_response_class = default_response_class
         self.generate_unique_id_function = generate_unique_id_function
+        self.route_trie = route_trie
+        self.lazy_routes = lazy_routes
+        self.startup_profile = startup_profile
+        # The dependants of the routes, shared by the ones with the same endpoint
+        # or route dependencies, see get_route_dependant()
+        self._shared_dependants: Dict[Hashable, Dependant] = {}
+        self.concurrent_dependencies = concurrent_dependencies
+        self.response_model_dump_json = response_model_dump_json
+        self.response_validation = response_validation
+        self.cache = cache
+        self.etag = etag
+        self._route_trie: Optional[RouteTrie] = None
+
+    def _get_route_trie(self) -> RouteTrie:
+        if self._route_trie is None or self._route_trie.is_stale(self.routes):
+            self._route_trie = RouteTrie(self.routes)
+        return self._route_trie
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.route_trie or scope["type"] == "lifespan":
+            await super().app(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        route_trie = self._get_route_trie()
+        route_path = get_route_path(scope)
+        partial = None
+        for route in route_trie.get_candidates(route_path):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            redirect_path = get_route_path(redirect_scope)
+            for route in route_trie.get_candidates(redirect_path):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        await self.default(scope, receive, send)
 
     def route(
         self,
@@ -912,6 +1944,13 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Union[
             Callable[[APIRoute], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        response_model_dump_json: Union[bool, DefaultPlaceholder] = Default(False),
+        response_validation: Union[ResponseValidation, DefaultPlaceholder] = Default(
+            "always"
+        ),
+        cache: Union[ResponseCache, None, DefaultPlaceholder] = Default(None),
+        etag: Union[bool, params.Depends, DefaultPlaceholder] = Default(False),
     ) -> None:
         route_class = route_class_override or self.route_class
         responses = responses or {}
@@ -931,6 +1970,19 @@ class APIRouter(routing.Router):
         current_generate_unique_id = get_value_or_default(
             generate_unique_id_function, self.generate_unique_id_function
         )
+        current_concurrent_dependencies = get_value_or_default(
+            concurrent_dependencies, self.concurrent_dependencies
+        )
+        current_response_model_dump_json = get_value_or_default(
+            response_model_dump_json, self.response_model_dump_json
+        )
+        current_response_validation: Union[ResponseValidation, DefaultPlaceholder] = (
+            get_value_or_default(response_validation, self.response_validation)
+        )
+        current_cache = get_value_or_default(cache, self.cache)
+        current_etag: Union[bool, params.Depends, DefaultPlaceholder] = (
+            get_value_or_default(etag, self.etag)
+        )
         route = route_class(
             self.prefix + path,
             endpoint=endpoint,
@@ -958,6 +2010,14 @@ class APIRouter(routing.Router):
             callbacks=current_callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=current_generate_unique_id,
+            concurrent_dependencies=current_concurrent_dependencies,
+            response_model_dump_json=current_response_model_dump_json,
+            response_validation=current_response_validation,
+            cache=current_cache,
+            etag=current_etag,
+            lazy=self.lazy_routes,
+            startup_profile=self.startup_profile,
+            shared_dependants=self._shared_dependants,
         )
         self.routes.append(route)
 
@@ -990,6 +2050,13 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: Union[bool, DefaultPlaceholder] = Default(False),
+        response_model_dump_json: Union[bool, DefaultPlaceholder] = Default(False),
+        response_validation: Union[ResponseValidation, DefaultPlaceholder] = Default(
+            "always"
+        ),
+        cache: Union[ResponseCache, None, DefaultPlaceholder] = Default(None),
+        etag: Union[bool, params.Depends, DefaultPlaceholder] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         def decorator(func: DecoratedCallable) -> DecoratedCallable:
             self.add_api_route(
@@ -1018,6 +2085,11 @@ class APIRouter(routing.Router):
                 callbacks=callbacks,
                 openapi_extra=openapi_extra,
                 generate_unique_id_function=generate_unique_id_function,
+                etag=etag,
+                cache=cache,
+                response_validation=response_validation,
+                response_model_dump_json=response_model_dump_json,
+                concurrent_dependencies=concurrent_dependencies,
             )
             return func
 
@@ -1041,6 +2113,7 @@ class APIRouter(routing.Router):
             name=name,
             dependencies=current_dependencies,
             dependency_overrides_provider=self.dependency_overrides_provider,
+            shared_dependants=self._shared_dependants,
         )
         self.routes.append(route)
 
@@ -1270,6 +2343,9 @@ class APIRouter(routing.Router):
                     )
         if responses is None:
             responses = {}
+        # The included routes reuse the dependants already built by the router
+        for key, dependant in router._shared_dependants.items():
+            self._shared_dependants.setdefault(key, dependant)
         for route in router.routes:
             if isinstance(route, APIRoute):
                 combined_responses = {**responses, **route.responses}
@@ -1300,6 +2376,29 @@ class APIRouter(routing.Router):
                     generate_unique_id_function,
                     self.generate_unique_id_function,
                 )
+                current_concurrent_dependencies = get_value_or_default(
+                    route.concurrent_dependencies,
+                    router.concurrent_dependencies,
+                    self.concurrent_dependencies,
+                )
+                current_response_model_dump_json = get_value_or_default(
+                    route.response_model_dump_json,
+                    router.response_model_dump_json,
+                    self.response_model_dump_json,
+                )
+                current_response_validation: Union[
+                    ResponseValidation, DefaultPlaceholder
+                ] = get_value_or_default(
+                    route.response_validation,
+                    router.response_validation,
+                    self.response_validation,
+                )
+                current_cache = get_value_or_default(
+                    route.cache, router.cache, self.cache
+                )
+                current_etag: Union[bool, params.Depends, DefaultPlaceholder] = (
+                    get_value_or_default(route.etag, router.etag, self.etag)
+                )
                 self.add_api_route(
                     prefix + route.path,
                     route.endpoint,
@@ -1329,6 +2428,11 @@ class APIRouter(routing.Router):
                     callbacks=current_callbacks,
                     openapi_extra=route.openapi_extra,
                     generate_unique_id_function=current_generate_unique_id,
+                    concurrent_dependencies=current_concurrent_dependencies,
+                    response_model_dump_json=current_response_model_dump_json,
+                    response_validation=current_response_validation,
+                    cache=current_cache,
+                    etag=current_etag,
                 )
             elif isinstance(route, routing.Route):
                 methods = list(route.methods or [])
@@ -1672,29 +2776,116 @@ class APIRouter(routing.Router):
             Optional[Dict[str, Any]],
             Doc(
                 """
-                Extra metadata to be included in the OpenAPI schema for this *path
-                operation*.
+                Extra metadata to be included in the OpenAPI schema for this *path
+                operation*.
+
+                Read more about it in the
+                [FastAPI docs for Path Operation Advanced Configuration](https://fastapi.tiangolo.com/advanced/path-operation-advanced-configuration/#custom-openapi-path-operation-schema).
+                """
+            ),
+        ] = None,
+        generate_unique_id_function: Annotated[
+            Callable[[APIRoute], str],
+            Doc(
+                """
+                Customize the function used to generate unique IDs for the *path
+                operations* shown in the generated OpenAPI.
+
+                This is particularly useful when automatically generating clients or
+                SDKs for your API.
+
+                Read more about it in the
+                [FastAPI docs about how to Generate Clients](https://fastapi.tiangolo.com/advanced/generate-clients/#custom-generate-unique-id-function).
+                """
+            ),
+        ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
 
-                Read more about it in the
-                [FastAPI docs for Path Operation Advanced Configuration](https://fastapi.tiangolo.com/advanced/path-operation-advanced-configuration/#custom-openapi-path-operation-schema).
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
                 """
             ),
-        ] = None,
-        generate_unique_id_function: Annotated[
-            Callable[[APIRoute], str],
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
             Doc(
                 """
-                Customize the function used to generate unique IDs for the *path
-                operations* shown in the generated OpenAPI.
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
 
-                This is particularly useful when automatically generating clients or
-                SDKs for your API.
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
 
-                Read more about it in the
-                [FastAPI docs about how to Generate Clients](https://fastapi.tiangolo.com/advanced/generate-clients/#custom-generate-unique-id-function).
+                By default it's inherited from the router or the app.
                 """
             ),
-        ] = Default(generate_unique_id),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP GET operation.
@@ -1739,6 +2930,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def put(
@@ -2072,6 +3268,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PUT operation.
@@ -2121,6 +3404,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def post(
@@ -2454,6 +3742,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP POST operation.
@@ -2503,6 +3878,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def delete(
@@ -2836,6 +4216,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP DELETE operation.
@@ -2880,6 +4347,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def options(
@@ -3213,6 +4685,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP OPTIONS operation.
@@ -3257,6 +4816,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def head(
@@ -3590,6 +5154,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP HEAD operation.
@@ -3639,6 +5290,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def patch(
@@ -3972,6 +5628,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP PATCH operation.
@@ -4021,6 +5764,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     def trace(
@@ -4354,6 +6102,93 @@ class APIRouter(routing.Router):
                 """
             ),
         ] = Default(generate_unique_id),
+        concurrent_dependencies: Annotated[
+            bool,
+            Doc(
+                """
+                Solve the independent `async` dependencies of this *path operation*
+                concurrently.
+
+                Sub-dependencies declared by the same dependency (or by the *path
+                operation function*) that are `async def` functions, and that only depend
+                on other `async def` functions, run at the same time in a task group. The
+                dependency cache of the request is kept, a cached dependency is still
+                called only once.
+
+                Context variables set by the dependencies that run concurrently, in the
+                task group, are not kept: they are not set for the *path operation
+                function* nor for the other dependencies.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_model_dump_json: Annotated[
+            bool,
+            Doc(
+                """
+                Serialize the response model directly to JSON bytes with Pydantic, instead
+                of converting it to JSON-compatible Python data first and then rendering it
+                with `json.dumps()`.
+
+                This is faster, especially for large responses. It's only used with
+                Pydantic v2, when there's a `response_model` and the response class renders
+                JSON as `JSONResponse` does. `response_model_include`,
+                `response_model_exclude`, and the other `response_model_*` parameters are
+                still applied.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
+        response_validation: Annotated[
+            ResponseValidation,
+            Doc(
+                """
+                How to validate the data returned by the *path operation function* against
+                the `response_model`: `"always"`, `"type-check-only"`, `sampled(rate)`
+                (from `fastapi.response_validation`), or `"never"`.
+
+                Data the `response_model` can't filter without validating it, e.g. dicts,
+                is always validated. The counts are in `route.response_validation_stats`.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default("always"),
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                A `ResponseCache` (from `fastapi.response_cache`) to store the rendered
+                responses of this *path operation* and send them again for the same
+                requests.
+
+                A cache hit skips the dependencies, the *path operation function* and the
+                serialization of the response.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(None),
+        etag: Annotated[
+            Union[bool, params.Depends],
+            Doc(
+                """
+                Set an `ETag` header on the responses to `GET` and `HEAD` requests, and
+                send a `304 Not Modified` response without a body when the request has a
+                matching `If-None-Match` header.
+
+                With `True`, the `ETag` is a hash of the rendered body. With
+                `Depends(get_version)`, the value returned by the dependency is the `ETag`,
+                it's solved first, and when the client already has that version, the
+                other dependencies, the *path operation function*, and the serialization
+                of the response are skipped. If it returns `None`, the body is hashed.
+
+                By default it's inherited from the router or the app.
+                """
+            ),
+        ] = Default(False),
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
         Add a *path operation* using an HTTP TRACE operation.
@@ -4403,6 +6238,11 @@ class APIRouter(routing.Router):
             callbacks=callbacks,
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
+            etag=etag,
+            cache=cache,
+            response_validation=response_validation,
+            response_model_dump_json=response_model_dump_json,
+            concurrent_dependencies=concurrent_dependencies,
         )
 
     @deprecated(
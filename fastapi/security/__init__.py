@@ -1,15 +1,56 @@
-from .api_key import APIKeyCookie as APIKeyCookie
-from .api_key import APIKeyHeader as APIKeyHeader
-from .api_key import APIKeyQuery as APIKeyQuery
-from .http import HTTPAuthorizationCredentials as HTTPAuthorizationCredentials
-from .http import HTTPBasic as HTTPBasic
-from .http import HTTPBasicCredentials as HTTPBasicCredentials
-from .http import HTTPBearer as HTTPBearer
-from .http import HTTPDigest as HTTPDigest
-from .oauth2 import OAuth2 as OAuth2
-from .oauth2 import OAuth2AuthorizationCodeBearer as OAuth2AuthorizationCodeBearer
-from .oauth2 import OAuth2PasswordBearer as OAuth2PasswordBearer
-from .oauth2 import OAuth2PasswordRequestForm as OAuth2PasswordRequestForm
-from .oauth2 import OAuth2PasswordRequestFormStrict as OAuth2PasswordRequestFormStrict
-from .oauth2 import SecurityScopes as SecurityScopes
-from .open_id_connect_url import OpenIdConnect as OpenIdConnect
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .api_key import APIKeyCookie as APIKeyCookie
+    from .api_key import APIKeyHeader as APIKeyHeader
+    from .api_key import APIKeyQuery as APIKeyQuery
+    from .http import HTTPAuthorizationCredentials as HTTPAuthorizationCredentials
+    from .http import HTTPBasic as HTTPBasic
+    from .http import HTTPBasicCredentials as HTTPBasicCredentials
+    from .http import HTTPBearer as HTTPBearer
+    from .http import HTTPDigest as HTTPDigest
+    from .oauth2 import OAuth2 as OAuth2
+    from .oauth2 import OAuth2AuthorizationCodeBearer as OAuth2AuthorizationCodeBearer
+    from .oauth2 import OAuth2PasswordBearer as OAuth2PasswordBearer
+    from .oauth2 import OAuth2PasswordRequestForm as OAuth2PasswordRequestForm
+    from .oauth2 import (
+        OAuth2PasswordRequestFormStrict as OAuth2PasswordRequestFormStrict,
+    )
+    from .oauth2 import SecurityScopes as SecurityScopes
+    from .open_id_connect_url import OpenIdConnect as OpenIdConnect
+
+# The module of each name, only imported when the name is first used, as in the
+# fastapi package
+_lazy_imports = {
+    "APIKeyCookie": "api_key",
+    "APIKeyHeader": "api_key",
+    "APIKeyQuery": "api_key",
+    "HTTPAuthorizationCredentials": "http",
+    "HTTPBasic": "http",
+    "HTTPBasicCredentials": "http",
+    "HTTPBearer": "http",
+    "HTTPDigest": "http",
+    "OAuth2": "oauth2",
+    "OAuth2AuthorizationCodeBearer": "oauth2",
+    "OAuth2PasswordBearer": "oauth2",
+    "OAuth2PasswordRequestForm": "oauth2",
+    "OAuth2PasswordRequestFormStrict": "oauth2",
+    "SecurityScopes": "oauth2",
+    "OpenIdConnect": "open_id_connect_url",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = __import__(module_name, globals(), level=1, fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_imports})
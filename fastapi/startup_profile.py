@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from typing_extensions import Literal
+
+StartupProfileSortKey = Literal["seconds", "memory", "calls", "route", "phase"]
+
+
+@dataclass
+class StartupProfileEntry:
+    # The route, e.g. "GET /items/{item_id}", or "" for the whole app
+    route: str
+    # What was done, e.g. "get_dependant" or "openapi"
+    phase: str
+    calls: int = 0
+    # Without the time and memory of the other phases done inside this one
+    seconds: float = 0.0
+    # The bytes allocated and still in use at the end, None if the memory is not
+    # traced
+    memory: Optional[int] = None
+
+
+class StartupProfile:
+    """
+    The time and memory spent building each *path operation*, used with
+    `FastAPI(startup_profile=True)`, per phase: creating its dependencies with
+    `get_dependant`, the response fields with `create_model_field` and
+    `create_cloned_field`, and the request body with `get_body_field`, and the
+    time and memory spent generating the OpenAPI schema.
+
+    With `trace_memory=True` it starts `tracemalloc` if it wasn't tracing yet,
+    that makes the app slower, call `stop()` once the app has started.
+    """
+
+    def __init__(self, *, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self._entries: Dict[Tuple[str, str], StartupProfileEntry] = {}
+        self._lock = threading.Lock()
+        # The phases being measured in each thread, with the time and memory of
+        # the phases measured inside them
+        self._local = threading.local()
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """
+        Stop tracing the memory, if it was started by this profile.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def measure(self, route: str, phase: str) -> Iterator[None]:
+        stack: List[List[float]] = self._local.__dict__.setdefault("stack", [])
+        nested = [0.0, 0.0]
+        stack.append(nested)
+        tracing = tracemalloc.is_tracing()
+        start_memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0] - start_memory if tracing else 0
+            stack.pop()
+            if stack:
+                stack[-1][0] += seconds
+                stack[-1][1] += memory
+            with self._lock:
+                entry = self._entries.get((route, phase))
+                if entry is None:
+                    entry = StartupProfileEntry(route=route, phase=phase)
+                    self._entries[(route, phase)] = entry
+                entry.calls += 1
+                entry.seconds += seconds - nested[0]
+                if tracing:
+                    entry.memory = int((entry.memory or 0) + memory - nested[1])
+
+    def get_entries(
+        self, *, sort_by: StartupProfileSortKey = "seconds"
+    ) -> List[StartupProfileEntry]:
+        """
+        The time and memory of each phase of each route, sorted by `sort_by`, the
+        largest first for numbers.
+        """
+        with self._lock:
+            entries = [
+                StartupProfileEntry(**asdict(entry)) for entry in self._entries.values()
+            ]
+        return _sort_entries(entries, sort_by)
+
+    def get_routes(
+        self, *, sort_by: StartupProfileSortKey = "seconds"
+    ) -> List[StartupProfileEntry]:
+        """
+        The total time and memory of all the phases of each route, with `"total"`
+        as their phase.
+        """
+        routes: Dict[str, StartupProfileEntry] = {}
+        for entry in self.get_entries():
+            total = routes.setdefault(
+                entry.route, StartupProfileEntry(route=entry.route, phase="total")
+            )
+            total.calls += entry.calls
+            total.seconds += entry.seconds
+            if entry.memory is not None:
+                total.memory = (total.memory or 0) + entry.memory
+        return _sort_entries(list(routes.values()), sort_by)
+
+    def as_dict(self, *, sort_by: StartupProfileSortKey = "seconds") -> Dict[str, Any]:
+        routes = self.get_routes(sort_by=sort_by)
+        return {
+            "seconds": sum(route.seconds for route in routes),
+            "routes": [asdict(route) for route in routes],
+            "entries": [asdict(entry) for entry in self.get_entries(sort_by=sort_by)],
+        }
+
+    def to_json(
+        self, *, sort_by: StartupProfileSortKey = "seconds", indent: Optional[int] = 2
+    ) -> str:
+        return json.dumps(self.as_dict(sort_by=sort_by), indent=indent)
+
+    def format_table(
+        self,
+        *,
+        sort_by: StartupProfileSortKey = "seconds",
+        limit: Optional[int] = 20,
+        by_route: bool = False,
+    ) -> str:
+        """
+        A text table of the entries (or the totals of each route, with
+        `by_route=True`), the first `limit` ones after sorting them by `sort_by`.
+        """
+        if by_route:
+            entries = self.get_routes(sort_by=sort_by)
+        else:
+            entries = self.get_entries(sort_by=sort_by)
+        rows = [("Route", "Phase", "Calls", "Time (ms)", "Memory (KiB)")]
+        for entry in entries[:limit]:
+            memory = "-" if entry.memory is None else f"{entry.memory / 1024:.1f}"
+            rows.append(
+                (
+                    entry.route or "(app)",
+                    entry.phase,
+                    str(entry.calls),
+                    f"{entry.seconds * 1000:.2f}",
+                    memory,
+                )
+            )
+        widths = [max(len(row[column]) for row in rows) for column in range(5)]
+        lines = [
+            "  ".join(
+                value.ljust(width) if column < 2 else value.rjust(width)
+                for column, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+
+def _sort_entries(
+    entries: List[StartupProfileEntry], sort_by: StartupProfileSortKey
+) -> List[StartupProfileEntry]:
+    if sort_by == "route":
+        return sorted(entries, key=lambda entry: (entry.route, entry.phase))
+    if sort_by == "phase":
+        return sorted(entries, key=lambda entry: (entry.phase, entry.route))
+    return sorted(entries, key=lambda entry: getattr(entry, sort_by) or 0, reverse=True)
@@ -1 +1,238 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+import anyio
+import anyio.to_thread
+from fastapi.middleware.compression import negotiate_encoding
+from starlette.datastructures import URL, Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.staticfiles import NotModifiedResponse
 from starlette.staticfiles import StaticFiles as StaticFiles  # noqa
+from starlette.types import Scope
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+PRECOMPRESSED_SUFFIXES = {"zstd": ".zst", "br": ".br", "gzip": ".gz"}
+# A hash of the content in the file name, e.g. "app.3f2a9c1b.js"
+DEFAULT_FINGERPRINT_PATTERN = r"[.-][0-9a-fA-F]{8,}\.\w+$"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class _CachedFile:
+    mtime_ns: int
+    size: int
+    body: bytes
+    etag: str
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    Serve static files, like `StaticFiles`, from an index of the files built when
+    it is created, and from a cache in memory for the small ones.
+
+    Requests for paths that are not in the index are answered with a 404 without
+    touching the filesystem, files added later are not served until
+    `build_index()` is called again.
+
+    When the client accepts it, a precompressed sibling of the file (`app.js.zst`,
+    `app.js.br` or `app.js.gz`) is sent instead, for the encodings in
+    `precompressed`.
+
+    Files up to `max_cached_file_size` bytes are kept in memory, up to
+    `max_cache_memory` bytes in total, and read again when their modification
+    time or size changes. They have a strong `ETag` made from their content.
+
+    Files with a name matching `fingerprint_pattern`, e.g. `app.3f2a9c1b.js`, are
+    sent with a `Cache-Control` header to cache them for a year, the others with
+    `cache_control`, if set.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Optional[PathLike] = None,
+        packages: Optional[List[Union[str, Tuple[str, str]]]] = None,
+        html: bool = False,
+        check_dir: bool = True,
+        follow_symlink: bool = False,
+        precompressed: Sequence[str] = ("zstd", "br", "gzip"),
+        max_cached_file_size: int = 256 * 1024,
+        max_cache_memory: int = 32 * 1024 * 1024,
+        cache_control: Optional[str] = None,
+        fingerprint_pattern: Optional[str] = DEFAULT_FINGERPRINT_PATTERN,
+    ) -> None:
+        super().__init__(
+            directory=directory,
+            packages=packages,
+            html=html,
+            check_dir=check_dir,
+            follow_symlink=follow_symlink,
+        )
+        for encoding in precompressed:
+            assert encoding in PRECOMPRESSED_SUFFIXES, (
+                f"Unsupported precompressed encoding: {encoding!r}"
+            )
+        self.precompressed = list(precompressed)
+        self.max_cached_file_size = max_cached_file_size
+        self.max_cache_memory = max_cache_memory
+        self.cache_control = cache_control
+        self.fingerprint_pattern = (
+            None if fingerprint_pattern is None else re.compile(fingerprint_pattern)
+        )
+        self.cache_memory = 0
+        self._cache: OrderedDict[str, _CachedFile] = OrderedDict()
+        self.files: Dict[str, str] = {}
+        self.directories: FrozenSet[str] = frozenset()
+        self.build_index()
+
+    def build_index(self) -> None:
+        """
+        Index the files of all the directories, by their path relative to the
+        directory, the same way `get_path()` returns them.
+        """
+        files: Dict[str, str] = {}
+        directories = set()
+        # The first directories take precedence, as with StaticFiles
+        for directory in reversed(self.all_directories):
+            if not os.path.isdir(directory):
+                continue
+            if self.follow_symlink:
+                root = os.path.abspath(directory)
+            else:
+                root = os.path.realpath(directory)
+            for dirpath, _, filenames in os.walk(
+                directory, followlinks=self.follow_symlink
+            ):
+                relative_dir = os.path.normpath(os.path.relpath(dirpath, directory))
+                directories.add(relative_dir)
+                for filename in filenames:
+                    joined_path = os.path.join(dirpath, filename)
+                    if self.follow_symlink:
+                        full_path = os.path.abspath(joined_path)
+                    else:
+                        full_path = os.path.realpath(joined_path)
+                    if os.path.commonpath([full_path, root]) != root:
+                        # Don't serve symlinks to files out of the directory
+                        continue
+                    path = os.path.normpath(os.path.join(relative_dir, filename))
+                    files[path] = full_path
+        self.files = files
+        self.directories = frozenset(directories)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        if path not in self.files and self.html and path in self.directories:
+            index_path = os.path.normpath(os.path.join(path, "index.html"))
+            if index_path in self.files:
+                if not scope["path"].endswith("/"):
+                    # Directory URLs should redirect to always end in "/"
+                    url = URL(scope=scope)
+                    return RedirectResponse(url=url.replace(path=url.path + "/"))
+                path = index_path
+        if path in self.files:
+            return await self.static_file_response(path, scope)
+        if self.html and "404.html" in self.files:
+            return FileResponse(self.files["404.html"], status_code=404)
+        raise HTTPException(status_code=404)
+
+    async def static_file_response(self, path: str, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        available = [
+            encoding
+            for encoding in self.precompressed
+            if path + PRECOMPRESSED_SUFFIXES[encoding] in self.files
+        ]
+        encoding = None
+        if available:
+            encoding = negotiate_encoding(
+                request_headers.get("accept-encoding", ""), available
+            )
+        served_path = (
+            path if encoding is None else path + PRECOMPRESSED_SUFFIXES[encoding]
+        )
+        full_path = self.files[served_path]
+        try:
+            stat_result, cached = await anyio.to_thread.run_sync(
+                self.load_file, full_path, self._cache.get(full_path)
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            raise HTTPException(status_code=404) from None
+        headers = {}
+        if available:
+            headers["vary"] = "Accept-Encoding"
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+        cache_control = self.get_cache_control(path)
+        if cache_control is not None:
+            headers["cache-control"] = cache_control
+        media_type = guess_type(path)[0] or "text/plain"
+        if cached is not None:
+            self.cache_file(full_path, cached)
+            headers["etag"] = cached.etag
+            headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        response: Response
+        if cached is None or "range" in request_headers:
+            # FileResponse handles the Range and If-Range headers, with the ETag of
+            # the cached content if there's one
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                headers=headers,
+                media_type=media_type,
+            )
+        else:
+            response = Response(cached.body, headers=headers, media_type=media_type)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def load_file(
+        self, full_path: str, cached: Optional[_CachedFile]
+    ) -> Tuple[os.stat_result, Optional[_CachedFile]]:
+        stat_result = os.stat(full_path)
+        if (
+            cached is not None
+            and cached.mtime_ns == stat_result.st_mtime_ns
+            and cached.size == stat_result.st_size
+        ):
+            return stat_result, cached
+        if stat_result.st_size > self.max_cached_file_size:
+            return stat_result, None
+        with open(full_path, "rb") as file:
+            body = file.read()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return stat_result, _CachedFile(
+            mtime_ns=stat_result.st_mtime_ns, size=len(body), body=body, etag=etag
+        )
+
+    def cache_file(self, full_path: str, cached: _CachedFile) -> None:
+        current = self._cache.get(full_path)
+        if current is cached:
+            self._cache.move_to_end(full_path)
+            return
+        if current is not None:
+            del self._cache[full_path]
+            self.cache_memory -= current.size
+        if cached.size > self.max_cache_memory:
+            return
+        self._cache[full_path] = cached
+        self.cache_memory += cached.size
+        while self.cache_memory > self.max_cache_memory:
+            _, evicted = self._cache.popitem(last=False)
+            self.cache_memory -= evicted.size
+
+    def get_cache_control(self, path: str) -> Optional[str]:
+        if self.fingerprint_pattern is not None and self.fingerprint_pattern.search(
+            os.path.basename(path)
+        ):
+            return IMMUTABLE_CACHE_CONTROL
+        return self.cache_control
@@ -0,0 +1,64 @@
+"""
+Compare the CPU time per MB and the compression ratio of the encodings supported
+by `CompressionMiddleware` at a few compression levels, on a JSON response body
+sent at once and in 64 KiB streamed chunks.
+
+Run it with:
+
+    python scripts/benchmarks/compression.py
+"""
+
+import json
+import time
+from typing import List, Tuple
+
+from fastapi.middleware.compression import COMPRESSORS, get_available_encodings
+
+LEVELS = {"zstd": [1, 3, 9], "br": [1, 4, 9], "gzip": [1, 6, 9]}
+CHUNK_SIZE = 64 * 1024
+ITERATIONS = 5
+
+
+def create_body() -> bytes:
+    items = [
+        {
+            "id": i,
+            "name": f"Item {i}",
+            "description": "A very nice item, with a description " * (i % 5),
+            "price": i * 1.25,
+            "tags": ["a", "b", "c"][: i % 4],
+        }
+        for i in range(20_000)
+    ]
+    return json.dumps(items).encode()
+
+
+def compress(encoding: str, level: int, chunks: List[bytes]) -> Tuple[float, int]:
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        compressor = COMPRESSORS[encoding](level)
+        size = 0
+        for chunk in chunks[:-1]:
+            size += len(compressor.compress(chunk))
+        size += len(compressor.finish(chunks[-1]))
+    return (time.process_time() - start) / ITERATIONS, size
+
+
+def main() -> None:
+    body = create_body()
+    megabytes = len(body) / 1024 / 1024
+    streamed = [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+    print(f"{megabytes:.1f} MB JSON body, {len(streamed)} streamed chunks")
+    for encoding in get_available_encodings():
+        for level in LEVELS[encoding]:
+            for label, chunks in (("single", [body]), ("stream", streamed)):
+                elapsed, size = compress(encoding, level, chunks)
+                print(
+                    f"{encoding:>5} level {level:>2} {label}: "
+                    f"{elapsed / megabytes * 1000:7.2f}ms CPU/MB, "
+                    f"ratio {len(body) / size:6.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
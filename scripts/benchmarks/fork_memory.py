@@ -0,0 +1,151 @@
+"""
+Compare the memory of the worker processes forked from an app with many routes,
+as with Gunicorn's `--preload`, when the app is created with `lazy_routes=True`,
+with the default eager routes, and with eager routes and `app.prepare_for_fork()`
+called before forking.
+
+Each worker handles a few requests, including one to `/openapi.json`, runs the
+garbage collector and reports its resident memory: the pages still shared with
+the parent process and the ones copied (private) to the worker. It reads
+`/proc/<pid>/smaps_rollup`, so it only works on Linux.
+
+Run it with:
+
+    python scripts/benchmarks/fork_memory.py
+"""
+
+import gc
+import json
+import os
+from typing import Dict, List, Optional, Union
+
+from fastapi import APIRouter, Depends, FastAPI, Query
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+ROUTE_COUNT = 2_500
+ROUTES_PER_ROUTER = 25
+WORKERS = 4
+MODES = ["lazy", "eager", "prepare_for_fork"]
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+    price: float
+    tags: List[str] = []
+
+
+def get_token(token: str = Query("")) -> str:
+    return token
+
+
+def create_router(lazy_routes: bool) -> APIRouter:
+    router = APIRouter(lazy_routes=lazy_routes)
+    for i in range(ROUTES_PER_ROUTER // 5):
+
+        @router.get(f"/items{i}/")
+        def read_items(skip: int = 0, limit: int = 100) -> List[Item]:
+            return [Item(name="Foo", price=1)]
+
+        @router.get(f"/items{i}/{{item_id}}")
+        def read_item(item_id: int, token: str = Depends(get_token)) -> Item:
+            return Item(name="Foo", price=1)
+
+        @router.post(f"/items{i}/")
+        def create_item(item: Item) -> Item:
+            return item
+
+        @router.put(f"/items{i}/{{item_id}}")
+        def update_item(item_id: int, item: Item) -> Item:
+            return item  # pragma: no cover
+
+        @router.delete(f"/items{i}/{{item_id}}", status_code=204)
+        def delete_item(item_id: int) -> None:
+            return None  # pragma: no cover
+
+    return router
+
+
+def create_app(lazy_routes: bool) -> FastAPI:
+    app = FastAPI(lazy_routes=lazy_routes)
+    for i in range(ROUTE_COUNT // ROUTES_PER_ROUTER):
+        app.include_router(create_router(lazy_routes), prefix=f"/service{i}")
+    return app
+
+
+def get_memory_usage(pid: Union[int, str] = "self") -> Dict[str, int]:
+    """
+    The resident memory of a process in KiB: in total (`rss`), shared with other
+    processes, e.g. the parent it was forked from (`shared`), only used by this
+    process (`private`), and its proportional share (`pss`), the private memory
+    plus the shared memory divided by the number of processes sharing it.
+    """
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values["Rss"],
+        "shared": values["Shared_Clean"] + values["Shared_Dirty"],
+        "private": values["Private_Clean"] + values["Private_Dirty"],
+        "pss": values["Pss"],
+    }
+
+
+def run_worker(app: FastAPI, write_fd: int) -> None:
+    client = TestClient(app)
+    for i in range(0, ROUTE_COUNT // ROUTES_PER_ROUTER, 10):
+        client.get(f"/service{i}/items0/")
+        client.get(f"/service{i}/items0/1")
+        client.post(f"/service{i}/items0/", json={"name": "Foo", "price": 1})
+    client.get("/openapi.json")
+    gc.collect()
+    with os.fdopen(write_fd, "w") as f:
+        json.dump(get_memory_usage(), f)
+
+
+def run_server(mode: str) -> None:
+    app = create_app(lazy_routes=mode == "lazy")
+    if mode == "prepare_for_fork":
+        app.prepare_for_fork()
+    parent = get_memory_usage()
+    pipes = []
+    for _ in range(WORKERS):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            run_worker(app, write_fd)
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+    workers = []
+    for pid, read_fd in pipes:
+        with os.fdopen(read_fd) as f:
+            workers.append(json.load(f))
+        os.waitpid(pid, 0)
+    average = {key: sum(w[key] for w in workers) // WORKERS for key in workers[0]}
+    print(
+        f"{mode:>16}: parent {parent['rss'] / 1024:.1f} MiB RSS, "
+        f"each worker {average['rss'] / 1024:.1f} MiB RSS, "
+        f"{average['shared'] / 1024:.1f} MiB shared, "
+        f"{average['private'] / 1024:.1f} MiB private"
+    )
+
+
+def main() -> None:
+    print(f"{ROUTE_COUNT} routes, {WORKERS} workers")
+    for mode in MODES:
+        # Each app in a new process, so that they don't share memory
+        pid = os.fork()
+        if pid == 0:
+            run_server(mode)
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
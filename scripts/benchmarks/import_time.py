@@ -0,0 +1,70 @@
+"""
+Measure with `python -X importtime` how long common entry points of FastAPI take
+to import, each in a new interpreter, and the slowest modules they import.
+
+Run it with:
+
+    python scripts/benchmarks/import_time.py
+"""
+
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+ENTRY_POINTS = [
+    "import fastapi",
+    "import fastapi.encoders",
+    "import fastapi.exceptions",
+    "from fastapi import FastAPI",
+    "from fastapi.security import OAuth2PasswordBearer",
+    "from fastapi.testclient import TestClient",
+]
+REPEAT = 5
+SLOWEST = 3
+
+
+def get_import_times(statement: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Return the total import time of `statement` and the cumulative time of each
+    module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        import_times[name.strip()] = int(cumulative)
+        # The modules imported directly by the statement are not indented
+        if name[1] != " ":
+            total += int(cumulative)
+    return total, import_times
+
+
+def main() -> None:
+    for statement in ENTRY_POINTS:
+        total, import_times = min(
+            (get_import_times(statement) for _ in range(REPEAT)),
+            key=lambda run: run[0],
+        )
+        slowest = sorted(
+            (name for name in import_times if name.startswith("fastapi.")),
+            key=lambda name: import_times[name],
+            reverse=True,
+        )[:SLOWEST]
+        details = ", ".join(
+            f"{name} {import_times[name] / 1000:.1f}ms" for name in slowest
+        )
+        print(f"{statement:>50}: {total / 1000:7.1f}ms  {details}")
+
+
+if __name__ == "__main__":
+    main()
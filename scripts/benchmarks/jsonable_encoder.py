@@ -0,0 +1,111 @@
+"""
+Time `jsonable_encoder()` on a few typical payloads: containers of primitives,
+nested dicts, special types (datetimes, UUIDs, decimals, enums), dataclasses and
+Pydantic models, alone and nested in a model.
+
+Run it with:
+
+    python scripts/benchmarks/jsonable_encoder.py
+"""
+
+import datetime
+import timeit
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+SIZE = 1_000
+
+
+class Status(Enum):
+    active = "active"
+    inactive = "inactive"
+
+
+@dataclass
+class DataclassItem:
+    id: int
+    name: str
+    price: float
+    tags: List[str]
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+    tags: List[str]
+    created_at: datetime.datetime
+
+
+class Order(BaseModel):
+    items: List[Item]
+
+
+class OrderWithMetadata(Order):
+    metadata: Dict[str, Any]
+
+
+def create_payloads() -> Dict[str, Any]:
+    now = datetime.datetime(2024, 1, 1, 12, 30)
+    return {
+        "list of ints": list(range(SIZE)),
+        "list of strings": [f"item-{i}" for i in range(SIZE)],
+        "dict of primitives": {f"key-{i}": i for i in range(SIZE)},
+        "nested dicts": [
+            {"id": i, "name": f"Item {i}", "price": i * 1.5, "tags": ["a", "b"]}
+            for i in range(SIZE)
+        ],
+        "special types": [
+            {
+                "id": UUID(int=i),
+                "created_at": now,
+                "price": Decimal("1.25"),
+                "status": Status.active,
+            }
+            for i in range(SIZE)
+        ],
+        "dataclasses": [
+            DataclassItem(id=i, name=f"Item {i}", price=i * 1.5, tags=["a", "b"])
+            for i in range(SIZE)
+        ],
+        "models": [
+            Item(id=i, name=f"Item {i}", price=i * 1.5, tags=["a"], created_at=now)
+            for i in range(SIZE)
+        ],
+        "nested model": Order(
+            items=[
+                Item(id=i, name=f"Item {i}", price=i * 1.5, tags=["a"], created_at=now)
+                for i in range(SIZE)
+            ],
+        ),
+        "nested model with dict": OrderWithMetadata(
+            items=[
+                Item(id=i, name=f"Item {i}", price=i * 1.5, tags=["a"], created_at=now)
+                for i in range(SIZE)
+            ],
+            metadata={f"key-{i}": i for i in range(SIZE)},
+        ),
+    }
+
+
+def measure(payload: Any) -> float:
+    number = 20
+    timer = timeit.Timer(lambda: jsonable_encoder(payload))
+    return min(timer.repeat(number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{SIZE} items per payload")
+    for name, payload in create_payloads().items():
+        elapsed = measure(payload)
+        print(f"{name:>24}: {elapsed * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compare serializing a `response_model` with `jsonable_encoder()` and
+`json.dumps()` and with Pydantic's `dump_json()`
+(`FastAPI(response_model_dump_json=True)`).
+
+Run it with:
+
+    python scripts/benchmarks/response_serialization.py
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+from starlette.types import Message
+
+ITEM_COUNT = 500
+ITERATIONS = 200
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+    created: datetime
+    tags: List[str]
+
+
+items = [
+    {
+        "id": i,
+        "name": f"Item {i}",
+        "price": i * 1.5,
+        "created": datetime(2024, 1, 1),
+        "tags": ["a", "b", "c"],
+    }
+    for i in range(ITEM_COUNT)
+]
+
+
+def create_app(response_model_dump_json: bool) -> FastAPI:
+    app = FastAPI(response_model_dump_json=response_model_dump_json, openapi_url=None)
+
+    @app.get("/items/", response_model=List[Item])
+    async def read_items() -> Any:
+        return items
+
+    return app
+
+
+def get_scope(path: str) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+async def dispatch(app: FastAPI) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await app(get_scope("/items/"), receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{ITEM_COUNT} items per response, {ITERATIONS} requests")
+    for response_model_dump_json in (False, True):
+        app = create_app(response_model_dump_json=response_model_dump_json)
+        elapsed = asyncio.run(dispatch(app))
+        label = "dump_json" if response_model_dump_json else "default"
+        print(
+            f"{label:>10}: {elapsed:.3f}s, {elapsed / ITERATIONS * 1e3:.2f}ms/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare dispatching requests with a linear scan over all the routes and with the
+route trie (`FastAPI(route_trie=True)`).
+
+Run it with:
+
+    python scripts/benchmarks/routing.py
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from starlette.types import Message
+
+ROUTE_COUNT = 2_500
+ITERATIONS = 200
+
+
+def create_app(route_trie: bool) -> FastAPI:
+    app = FastAPI(route_trie=route_trie, openapi_url=None)
+    for i in range(ROUTE_COUNT // 5):
+        base = f"/service{i}"
+
+        def endpoint() -> str:
+            return "ok"
+
+        app.get(f"{base}/items")(endpoint)
+        app.get(f"{base}/items/{{item_id}}")(endpoint)
+        app.post(f"{base}/items/{{item_id}}")(endpoint)
+        app.get(f"{base}/users/{{user_id:int}}/items")(endpoint)
+        app.get(f"{base}/files/{{file_path:path}}")(endpoint)
+    return app
+
+
+def get_scope(path: str) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+async def dispatch(app: FastAPI, paths: List[str]) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for path in paths:
+            await app.router(get_scope(path), receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    last = ROUTE_COUNT // 5 - 1
+    paths = [
+        "/service0/items",
+        f"/service{last // 2}/items/42",
+        f"/service{last}/users/7/items",
+        f"/service{last}/files/a/b/c.txt",
+        "/not-found",
+    ]
+    requests = ITERATIONS * len(paths)
+    print(f"{ROUTE_COUNT} routes, {requests} requests")
+    for route_trie in (False, True):
+        app = create_app(route_trie=route_trie)
+        elapsed = asyncio.run(dispatch(app, paths))
+        label = "trie" if route_trie else "linear"
+        print(f"{label:>8}: {elapsed:.3f}s, {elapsed / requests * 1e6:.1f}µs/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare the time to create an app with many routes, declared in routers included
+directly in the app or nested a few levels deep, when the routes are built as
+they are declared and with `lazy_routes=True`, and the time `app.warmup()` takes
+to build the lazy ones afterwards.
+
+Run it with:
+
+    python scripts/benchmarks/startup.py
+"""
+
+import time
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Query
+from pydantic import BaseModel
+
+ROUTE_COUNT = 2_500
+ROUTES_PER_ROUTER = 25
+NESTING_DEPTHS = [1, 3]
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+    price: float
+    tags: List[str] = []
+
+
+def get_token(token: str = Query("")) -> str:
+    return token
+
+
+def create_router(lazy_routes: bool) -> APIRouter:
+    router = APIRouter(lazy_routes=lazy_routes)
+    for i in range(ROUTES_PER_ROUTER // 5):
+
+        @router.get(f"/items{i}/")
+        def read_items(skip: int = 0, limit: int = 100) -> List[Item]:
+            return []  # pragma: no cover
+
+        @router.get(f"/items{i}/{{item_id}}")
+        def read_item(item_id: int, token: str = Depends(get_token)) -> Item:
+            return Item(name="Foo", price=1)  # pragma: no cover
+
+        @router.post(f"/items{i}/")
+        def create_item(item: Item) -> Item:
+            return item  # pragma: no cover
+
+        @router.put(f"/items{i}/{{item_id}}")
+        def update_item(item_id: int, item: Item) -> Item:
+            return item  # pragma: no cover
+
+        @router.delete(f"/items{i}/{{item_id}}", status_code=204)
+        def delete_item(item_id: int) -> None:
+            return None  # pragma: no cover
+
+    return router
+
+
+def create_app(lazy_routes: bool, depth: int) -> FastAPI:
+    app = FastAPI(lazy_routes=lazy_routes)
+    for i in range(ROUTE_COUNT // ROUTES_PER_ROUTER):
+        router = create_router(lazy_routes)
+        # Each level adds a prefix and a dependency, e.g. /service0/v1/items0/
+        for level in range(depth - 1, 0, -1):
+            parent = APIRouter(lazy_routes=lazy_routes)
+            parent.include_router(
+                router, prefix=f"/v{level}", dependencies=[Depends(get_token)]
+            )
+            router = parent
+        app.include_router(router, prefix=f"/service{i}")
+    return app
+
+
+def main() -> None:
+    print(f"{ROUTE_COUNT} routes")
+    for depth in NESTING_DEPTHS:
+        for lazy_routes in (False, True):
+            start = time.perf_counter()
+            app = create_app(lazy_routes=lazy_routes, depth=depth)
+            created = time.perf_counter() - start
+            label = f"depth {depth}, {'lazy' if lazy_routes else 'eager'}"
+            line = f"{label:>16}: created in {created:.3f}s"
+            if lazy_routes:
+                start = time.perf_counter()
+                app.warmup()
+                line += f", warmed up in {time.perf_counter() - start:.3f}s"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
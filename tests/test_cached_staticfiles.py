@@ -0,0 +1,200 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.staticfiles import IMMUTABLE_CACHE_CONTROL, CachedStaticFiles
+from fastapi.testclient import TestClient
+
+CONTENT = "console.log('Hello World');\n" * 20
+
+
+@pytest.fixture(name="directory")
+def get_directory(tmp_path: Path) -> Path:
+    (tmp_path / "app.js").write_text(CONTENT)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(CONTENT.encode()))
+    (tmp_path / "app.3f2a9c1b.css").write_text("body {}")
+    (tmp_path / "large.txt").write_text("x" * 2000)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.html").write_text("<h1>Docs</h1>")
+    (tmp_path / "404.html").write_text("<h1>Not Found</h1>")
+    return tmp_path
+
+
+def get_client(directory: Path, **kwargs) -> TestClient:
+    app = FastAPI()
+    app.mount(
+        "/static",
+        CachedStaticFiles(directory=directory, max_cached_file_size=1000, **kwargs),
+    )
+    return TestClient(app)
+
+
+def test_serve_file(directory: Path):
+    static_files = CachedStaticFiles(directory=directory)
+    client = get_client(directory)
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.text == CONTENT
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in response.headers
+    assert "cache-control" not in response.headers
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+    # The ETag comes from the content, not from the modification time
+    os.utime(directory / "app.js", (0, 0))
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert response.headers["etag"] == etag
+    assert static_files.files.keys() >= {"app.js", "app.js.gz", "docs/index.html"}
+
+
+def test_precompressed(directory: Path):
+    client = get_client(directory)
+    with client.stream(
+        "GET", "/static/app.js", headers={"Accept-Encoding": "br, gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert gzip.decompress(raw) == CONTENT.encode()
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.text == CONTENT
+
+
+def test_not_modified(directory: Path):
+    client = get_client(directory)
+    for path in ["/static/app.js", "/static/large.txt"]:
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        etag = response.headers["etag"]
+        response = client.get(
+            path, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    response = client.get("/static/app.js", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_range(directory: Path):
+    client = get_client(directory)
+    headers = {"Accept-Encoding": "identity"}
+    etag = client.get("/static/app.js", headers=headers).headers["etag"]
+    response = client.get("/static/app.js", headers={**headers, "Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.text == CONTENT[:10]
+    assert response.headers["content-range"] == f"bytes 0-9/{len(CONTENT)}"
+    assert response.headers["etag"] == etag
+    response = client.get(
+        "/static/app.js", headers={**headers, "Range": "bytes=0-9", "If-Range": etag}
+    )
+    assert response.status_code == 206
+    response = client.get(
+        "/static/app.js",
+        headers={**headers, "Range": "bytes=0-9", "If-Range": '"other"'},
+    )
+    assert response.status_code == 200
+    assert response.text == CONTENT
+
+
+def test_revalidate_cached_file(directory: Path):
+    static_files = CachedStaticFiles(directory=directory, max_cached_file_size=1000)
+    app = FastAPI()
+    app.mount("/static", static_files)
+    client = TestClient(app)
+    response = client.get("/static/app.3f2a9c1b.css")
+    assert response.text == "body {}"
+    assert static_files.cache_memory == len("body {}")
+    path = directory / "app.3f2a9c1b.css"
+    path.write_text("body { color: red; }")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+    response = client.get("/static/app.3f2a9c1b.css")
+    assert response.text == "body { color: red; }"
+    assert static_files.cache_memory == len("body { color: red; }")
+    # Large files are not cached
+    response = client.get("/static/large.txt")
+    assert response.text == "x" * 2000
+    assert static_files.cache_memory == len("body { color: red; }")
+
+
+def test_cache_memory_limit(directory: Path):
+    static_files = CachedStaticFiles(
+        directory=directory, max_cache_memory=len(CONTENT) + 5
+    )
+    app = FastAPI()
+    app.mount("/static", static_files)
+    client = TestClient(app)
+    client.get("/static/app.3f2a9c1b.css")
+    assert static_files.cache_memory == len("body {}")
+    # The least recently used file is evicted to make room for app.js
+    client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert static_files.cache_memory == len(CONTENT)
+    # Files larger than the whole cache don't evict anything
+    response = client.get("/static/large.txt")
+    assert response.text == "x" * 2000
+    assert static_files.cache_memory == len(CONTENT)
+
+
+def test_cache_control(directory: Path):
+    client = get_client(directory, cache_control="no-cache")
+    response = client.get("/static/app.3f2a9c1b.css")
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    response = client.get("/static/app.js")
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_not_found_without_filesystem(directory: Path, monkeypatch):
+    static_files = CachedStaticFiles(directory=directory)
+    app = FastAPI()
+    app.mount("/static", static_files)
+    client = TestClient(app)
+
+    def fail(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("The filesystem should not be used")
+
+    monkeypatch.setattr(static_files, "lookup_path", fail)
+    monkeypatch.setattr(static_files, "load_file", fail)
+    response = client.get("/static/missing.js")
+    assert response.status_code == 404
+
+
+def test_files_added_later(directory: Path):
+    static_files = CachedStaticFiles(directory=directory)
+    app = FastAPI()
+    app.mount("/static", static_files)
+    client = TestClient(app)
+    (directory / "new.js").write_text("new")
+    assert client.get("/static/new.js").status_code == 404
+    static_files.build_index()
+    assert client.get("/static/new.js").text == "new"
+
+
+def test_deleted_file(directory: Path):
+    client = get_client(directory)
+    (directory / "large.txt").unlink()
+    response = client.get("/static/large.txt")
+    assert response.status_code == 404
+
+
+def test_html(directory: Path):
+    client = get_client(directory, html=True)
+    response = client.get("/static/docs", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://testserver/static/docs/"
+    response = client.get("/static/docs/")
+    assert response.text == "<h1>Docs</h1>"
+    response = client.get("/static/missing")
+    assert response.status_code == 404
+    assert response.text == "<h1>Not Found</h1>"
+
+
+def test_method_not_allowed(directory: Path):
+    client = get_client(directory)
+    response = client.post("/static/app.js")
+    assert response.status_code == 405
+
+
+def test_invalid_precompressed_encoding(directory: Path):
+    with pytest.raises(AssertionError):
+        CachedStaticFiles(directory=directory, precompressed=["deflate"])
@@ -0,0 +1,217 @@
+import gzip
+import zlib
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.compression import (
+    COMPRESSORS,
+    DEFAULT_LEVELS,
+    CompressionMiddleware,
+    Compressor,
+    negotiate_encoding,
+)
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+CONTENT = "x" * 1000 + "compressible"
+
+# httpx advertises Brotli and Zstandard too when they are installed, so they are
+# not part of the test requirements
+encodings = [
+    pytest.param(
+        "zstd",
+        marks=pytest.mark.skipif(zstandard is None, reason="needs zstandard"),
+    ),
+    pytest.param("br", marks=pytest.mark.skipif(brotli is None, reason="needs brotli")),
+    "gzip",
+]
+
+
+def decompress(encoding: str, body: bytes) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br":
+        return brotli.decompress(body)
+    return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+
+def create_app(**kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **kwargs)
+
+    @app.get("/text", response_class=PlainTextResponse)
+    def read_text():
+        return CONTENT
+
+    @app.get("/small", response_class=PlainTextResponse)
+    def read_small():
+        return "small"
+
+    @app.get("/json")
+    def read_json():
+        return {"content": CONTENT}
+
+    @app.get("/image")
+    def read_image():
+        return PlainTextResponse(CONTENT, media_type="image/png")
+
+    @app.get("/stream")
+    def read_stream():
+        def generate():
+            for _ in range(10):
+                yield CONTENT
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    @app.get("/encoded")
+    def read_encoded():
+        return PlainTextResponse(CONTENT, headers={"content-encoding": "identity"})
+
+    @app.get("/etag")
+    def read_etag():
+        return PlainTextResponse(CONTENT, headers={"etag": '"v1"'})
+
+    return app
+
+
+client = TestClient(create_app())
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip, br", "br"),
+        ("gzip", "gzip"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("zstd;q=0, br;q=0, *", "gzip"),
+        ("*", "zstd"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("br;q=invalid, gzip", "gzip"),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str):
+    assert negotiate_encoding(accept_encoding, ["zstd", "br", "gzip"]) == expected
+
+
+def get_raw(path: str, encoding: str):
+    # httpx decodes the body, read the raw one
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("encoding", encodings)
+@pytest.mark.parametrize("path", ["/text", "/json"])
+def test_compress(path: str, encoding: str):
+    response, raw = get_raw(path, encoding)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert len(raw) < len(CONTENT)
+    assert CONTENT.encode() in decompress(encoding, raw)
+
+
+@pytest.mark.parametrize("encoding", encodings)
+def test_stream(encoding: str):
+    response, raw = get_raw("/stream", encoding)
+    assert response.headers["content-encoding"] == encoding
+    assert "content-length" not in response.headers
+    assert decompress(encoding, raw) == CONTENT.encode() * 10
+
+
+@pytest.mark.parametrize("encoding", encodings)
+def test_compressor_flushes_each_chunk(encoding: str):
+    compressor = COMPRESSORS[encoding](DEFAULT_LEVELS[encoding])
+    first = compressor.compress(CONTENT.encode())
+    # Each chunk can be decompressed as soon as it is sent
+    assert first
+    if encoding == "gzip":
+        assert zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(first) == (
+            CONTENT.encode()
+        )
+    elif encoding == "br":
+        assert brotli.Decompressor().process(first) == CONTENT.encode()
+    else:
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(first) == CONTENT.encode()
+    last = compressor.finish(CONTENT.encode())
+    assert decompress(encoding, first + last) == CONTENT.encode() * 2
+
+
+@pytest.mark.parametrize(
+    "path", ["/small", "/image", "/encoded"], ids=["small", "image", "encoded"]
+)
+def test_not_compressed(path: str):
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") in (None, "identity")
+
+
+def test_not_accepted():
+    response = client.get("/text", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == CONTENT
+
+
+def test_range_request(tmp_path: Path):
+    # The range is of the uncompressed bytes, a partial response is not compressed
+    path = tmp_path / "content.txt"
+    path.write_text(CONTENT)
+    app = create_app()
+
+    @app.get("/file")
+    def read_file():
+        return FileResponse(path, media_type="text/plain")
+
+    response = TestClient(app).get(
+        "/file", headers={"Accept-Encoding": "gzip", "Range": "bytes=0-599"}
+    )
+    assert response.status_code == 206, response.text
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-range"] == f"bytes 0-599/{len(CONTENT)}"
+    assert response.text == CONTENT[:600]
+
+
+def test_weak_etag():
+    response = client.get("/etag", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["etag"] == 'W/"v1"'
+
+
+def test_options():
+    client = TestClient(
+        create_app(
+            minimum_size=10,
+            encodings=["gzip"],
+            levels={"gzip": 1},
+            content_types=["application/json"],
+        )
+    )
+    response = client.get("/json", headers={"Accept-Encoding": "zstd, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"content": CONTENT}
+    response = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_compressor_abstract_methods():
+    class IncompleteCompressor(Compressor):
+        def compress(self, data: bytes) -> bytes:
+            return data  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        IncompleteCompressor()  # type: ignore[abstract]
@@ -0,0 +1,199 @@
+from contextvars import ContextVar
+from typing import List, Optional
+
+import anyio
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from typing_extensions import Annotated
+
+events: List[str] = []
+
+
+async def get_settings():
+    events.append("settings")
+    await anyio.sleep(0.01)
+    return {"debug": True}
+
+
+async def get_user(settings: Annotated[dict, Depends(get_settings)]):
+    events.append("user start")
+    await anyio.sleep(0.05)
+    events.append("user end")
+    return "rick"
+
+
+async def get_items(settings: Annotated[dict, Depends(get_settings)]):
+    events.append("items start")
+    await anyio.sleep(0.05)
+    events.append("items end")
+    return ["portal gun"]
+
+
+def get_sync_value():
+    events.append("sync")
+    return "sync"
+
+
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+async def set_request_id():
+    request_id.set("abc")
+
+
+async def get_failing(q: int):
+    return q
+
+
+async def get_other_failing(limit: int):
+    return limit
+
+
+async def raise_not_found():
+    await anyio.sleep(0.01)
+    raise HTTPException(status_code=404, detail="Not found")
+
+
+async def raise_forbidden():
+    raise HTTPException(status_code=403, detail="Forbidden")
+
+
+app = FastAPI(concurrent_dependencies=True)
+
+
+@app.get("/")
+async def read_root(
+    user: Annotated[str, Depends(get_user)],
+    items: Annotated[list, Depends(get_items)],
+    sync_value: Annotated[str, Depends(get_sync_value)],
+):
+    return {"user": user, "items": items, "sync_value": sync_value}
+
+
+@app.get("/sequential", concurrent_dependencies=False)
+async def read_sequential(
+    user: Annotated[str, Depends(get_user)],
+    items: Annotated[list, Depends(get_items)],
+):
+    return {"user": user, "items": items}
+
+
+@app.get("/errors")
+async def read_errors(
+    failing: Annotated[int, Depends(get_failing)],
+    other_failing: Annotated[int, Depends(get_other_failing)],
+):
+    return {"failing": failing, "other_failing": other_failing}  # pragma: no cover
+
+
+@app.get("/exceptions")
+async def read_exceptions(
+    forbidden: Annotated[None, Depends(raise_forbidden)],
+    not_found: Annotated[None, Depends(raise_not_found)],
+):
+    pass  # pragma: no cover
+
+
+@app.get("/exceptions/first-to-happen")
+async def read_first_exception_to_happen(
+    not_found: Annotated[None, Depends(raise_not_found)],
+    forbidden: Annotated[None, Depends(raise_forbidden)],
+):
+    pass  # pragma: no cover
+
+
+@app.get("/context")
+async def read_context(
+    request_id_set: Annotated[None, Depends(set_request_id)],
+    items: Annotated[list, Depends(get_items)],
+):
+    return {"request_id": request_id.get()}
+
+
+@app.get("/context/sequential", concurrent_dependencies=False)
+async def read_context_sequential(
+    request_id_set: Annotated[None, Depends(set_request_id)],
+    items: Annotated[list, Depends(get_items)],
+):
+    return {"request_id": request_id.get()}
+
+
+router = APIRouter(concurrent_dependencies=False)
+
+
+@router.get("/router")
+async def read_router(
+    user: Annotated[str, Depends(get_user)],
+    items: Annotated[list, Depends(get_items)],
+):
+    return {"user": user, "items": items}
+
+
+app.include_router(router)
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    events.clear()
+
+
+def test_concurrent():
+    response = client.get("/")
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "user": "rick",
+        "items": ["portal gun"],
+        "sync_value": "sync",
+    }
+    assert events.count("settings") == 1
+    assert events.index("items start") < events.index("user end")
+    # Not concurrent, it runs after the others, not while they run
+    assert events[-1] == "sync"
+
+
+@pytest.mark.parametrize(
+    "path,expected", [("/context", None), ("/context/sequential", "abc")]
+)
+def test_context_vars(path: str, expected: Optional[str]):
+    # Context variables set by concurrent dependencies are lost with their tasks
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"request_id": expected}
+
+
+@pytest.mark.parametrize("path", ["/sequential", "/router"])
+def test_sequential(path: str):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"user": "rick", "items": ["portal gun"]}
+    assert events == ["settings", "user start", "user end", "items start", "items end"]
+
+
+def test_errors_in_declaration_order():
+    response = client.get("/errors")
+    assert response.status_code == 422, response.text
+    locations = [error["loc"] for error in response.json()["detail"]]
+    assert locations == [["query", "q"], ["query", "limit"]]
+
+
+def test_first_exception_is_raised():
+    response = client.get("/exceptions")
+    assert response.status_code == 403, response.text
+    assert response.json() == {"detail": "Forbidden"}
+
+
+def test_first_exception_to_happen_is_raised():
+    # raise_not_found is declared first, but it's cancelled before it raises
+    response = client.get("/exceptions/first-to-happen")
+    assert response.status_code == 403, response.text
+    assert response.json() == {"detail": "Forbidden"}
+
+
+def test_route_default_from_router():
+    routes = {route.path: route for route in app.routes}
+    assert routes["/"]._concurrent_dependencies is True
+    assert routes["/sequential"]._concurrent_dependencies is False
+    assert routes["/router"]._concurrent_dependencies is False
@@ -0,0 +1,179 @@
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from typing_extensions import Annotated
+
+state: Dict[str, Any] = {"settings": 0, "events": []}
+
+
+def get_settings():
+    state["settings"] += 1
+    return {"url": "postgresql://db"}
+
+
+async def get_pool(settings: Annotated[dict, Depends(get_settings)]):
+    state["events"].append("pool open")
+    yield {"pool": settings["url"]}
+    state["events"].append("pool closed")
+
+
+def get_client():
+    state["events"].append("client open")
+    yield "client"
+    state["events"].append("client closed")
+
+
+def get_user(request: Request):
+    return request.headers.get("user", "anonymous")
+
+
+AppPool = Annotated[dict, Depends(get_pool, scope="app")]
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter()
+
+    @router.get("/items/")
+    async def read_items(
+        pool: AppPool,
+        user: Annotated[str, Depends(get_user)],
+        settings: Annotated[dict, Depends(get_settings)],
+    ):
+        return {"pool": pool, "user": user, "settings": settings}
+
+    @router.get("/client/", dependencies=[Depends(get_client, scope="app")])
+    def read_client(pool: AppPool):
+        return pool
+
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    state["settings"] = 0
+    state["events"] = []
+
+
+def test_solved_once_per_lifespan():
+    app = create_app()
+    with TestClient(app) as client:
+        for user in ["rick", "morty"]:
+            response = client.get("/items/", headers={"user": user})
+            assert response.status_code == 200, response.text
+            assert response.json() == {
+                "pool": {"pool": "postgresql://db"},
+                "user": user,
+                "settings": {"url": "postgresql://db"},
+            }
+        response = client.get("/client/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"pool": "postgresql://db"}
+        # Once for the pool, and once per request for the request-scoped one
+        assert state["settings"] == 3
+        assert state["events"] == ["pool open", "client open"]
+    assert state["events"] == [
+        "pool open",
+        "client open",
+        "client closed",
+        "pool closed",
+    ]
+    with TestClient(app) as client:
+        client.get("/client/")
+    # The dependencies in the decorator are solved first
+    assert state["events"][4:] == [
+        "client open",
+        "pool open",
+        "pool closed",
+        "client closed",
+    ]
+
+
+def test_override():
+    app = create_app()
+
+    async def override_pool():
+        return {"pool": "sqlite://"}
+
+    app.dependency_overrides[get_pool] = override_pool
+    with TestClient(app) as client:
+        response = client.get("/client/")
+        assert response.json() == {"pool": "sqlite://"}
+    assert state["events"] == ["client open", "client closed"]
+
+
+def test_override_sub_dependency_after_first_request():
+    app = create_app()
+    with TestClient(app) as client:
+        response = client.get("/client/")
+        assert response.json() == {"pool": "postgresql://db"}
+        app.dependency_overrides[get_settings] = lambda: {"url": "sqlite://"}
+        response = client.get("/client/")
+        assert response.json() == {"pool": "sqlite://"}
+        app.dependency_overrides.clear()
+        response = client.get("/client/")
+        assert response.json() == {"pool": "postgresql://db"}
+    assert state["events"] == [
+        "client open",
+        "pool open",
+        "pool open",
+        "pool closed",
+        "pool closed",
+        "client closed",
+    ]
+
+
+def test_lifespan_state_is_kept():
+    events: List[str] = []
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        events.append("startup")
+        yield {"name": "app"}
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/")
+    def read_root(request: Request, pool: AppPool):
+        return {"state": request.state.name, "pool": pool}
+
+    with TestClient(app) as client:
+        response = client.get("/")
+        assert response.json() == {
+            "state": "app",
+            "pool": {"pool": "postgresql://db"},
+        }
+    assert events == ["startup", "shutdown"]
+    assert state["events"] == ["pool open", "pool closed"]
+
+
+def test_request_data_not_allowed():
+    app = FastAPI()
+
+    def get_token(token: str):
+        return token  # pragma: no cover
+
+    def get_session(token: Annotated[str, Depends(get_token)]):
+        return token  # pragma: no cover
+
+    with pytest.raises(FastAPIError, match="token"):
+
+        @app.get("/")
+        def read_root(session: Annotated[str, Depends(get_session, scope="app")]):
+            pass  # pragma: no cover
+
+    with pytest.raises(FastAPIError, match="request"):
+
+        @app.get("/user/")
+        def read_user(user: Annotated[str, Depends(get_user, scope="app")]):
+            pass  # pragma: no cover
+
+
+def test_depends_repr():
+    assert repr(Depends(get_pool, scope="app")) == "Depends(get_pool, scope='app')"
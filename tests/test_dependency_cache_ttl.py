@@ -0,0 +1,239 @@
+import time
+from typing import List
+
+import anyio
+import pytest
+from fastapi import Body, Depends, FastAPI, Header, Request, Security
+from fastapi.dependencies.cache import CacheStats, DependencyCache
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from typing_extensions import Annotated
+
+calls: List[str] = []
+
+tenant_cache = DependencyCache(ttl=60, max_size=2)
+flags_cache = DependencyCache(ttl=0.05)
+
+
+async def get_tenant(x_api_key: Annotated[str, Header()]):
+    calls.append(x_api_key)
+    await anyio.sleep(0.05)
+    return {"tenant": x_api_key.upper()}
+
+
+def get_flags(user_id: int):
+    calls.append(f"flags {user_id}")
+    return {"beta": user_id % 2 == 0}
+
+
+app = FastAPI()
+
+
+@app.get("/tenant/")
+async def read_tenant(
+    tenant: Annotated[dict, Security(get_tenant, cache=tenant_cache)],
+):
+    return tenant
+
+
+@app.get("/flags/")
+async def read_flags(flags: Annotated[dict, Depends(get_flags, cache=flags_cache)]):
+    return flags
+
+
+def get_path(request: Request):
+    calls.append(request.url.path)
+    return request.url.path
+
+
+path_cache = DependencyCache()
+
+
+@app.get("/path/")
+async def read_path(path: Annotated[str, Depends(get_path, cache=path_cache)]):
+    return path
+
+
+class Session:
+    pass
+
+
+def get_session():
+    yield Session()
+
+
+def get_repository(session: Annotated[Session, Depends(get_session)]):
+    calls.append("repository")
+    return "repository"
+
+
+repository_cache = DependencyCache()
+
+
+@app.get("/repository/")
+def read_repository(
+    repository: Annotated[str, Depends(get_repository, cache=repository_cache)],
+):
+    return repository
+
+
+def get_name(name: Annotated[str, Body()]):
+    calls.append(name)
+    return name
+
+
+name_cache = DependencyCache()
+
+
+@app.post("/name/")
+def create_name(name: Annotated[str, Depends(get_name, cache=name_cache)]):
+    return name
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    calls.clear()
+    for cache in (tenant_cache, flags_cache, path_cache, repository_cache, name_cache):
+        cache.clear()
+        cache.hits = cache.misses = cache.evictions = 0
+
+
+def test_cached_across_requests():
+    for _ in range(3):
+        response = client.get("/tenant/", headers={"x-api-key": "rick"})
+        assert response.status_code == 200, response.text
+        assert response.json() == {"tenant": "RICK"}
+    assert calls == ["rick"]
+    assert tenant_cache.stats == CacheStats(hits=2, misses=1, evictions=0, size=1)
+
+
+def test_lru_eviction():
+    for key in ["rick", "morty", "rick", "summer", "rick", "morty"]:
+        client.get("/tenant/", headers={"x-api-key": key})
+    assert calls == ["rick", "morty", "summer", "morty"]
+    assert tenant_cache.stats == CacheStats(hits=2, misses=4, evictions=2, size=2)
+
+
+def test_ttl():
+    assert client.get("/flags/", params={"user_id": 2}).json() == {"beta": True}
+    assert client.get("/flags/", params={"user_id": 2}).json() == {"beta": True}
+    time.sleep(0.06)
+    assert client.get("/flags/", params={"user_id": 2}).json() == {"beta": True}
+    assert calls == ["flags 2", "flags 2"]
+
+
+def test_validation_errors_not_cached():
+    response = client.get("/flags/", params={"user_id": "abc"})
+    assert response.status_code == 422, response.text
+    assert calls == []
+    assert flags_cache.stats.misses == 0
+
+
+def test_single_flight():
+    async def main():
+        results = []
+
+        async def call() -> None:
+            step = ("key", ())
+            results.append(await cache.get_or_call(step, get_value))
+
+        async def get_value():
+            calls.append("value")
+            await anyio.sleep(0.05)
+            return "value"
+
+        cache = DependencyCache()
+        async with anyio.create_task_group() as task_group:
+            for _ in range(5):
+                task_group.start_soon(call)
+        assert results == ["value"] * 5
+        assert cache.stats == CacheStats(hits=4, misses=1, evictions=0, size=1)
+
+    anyio.run(main)
+    assert calls == ["value"]
+
+
+def test_failed_call_not_cached():
+    attempts: List[int] = []
+
+    async def main():
+        async def get_value():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("Temporary error")
+            return "value"
+
+        cache = DependencyCache()
+        with pytest.raises(ValueError):
+            await cache.get_or_call("key", get_value)
+        assert await cache.get_or_call("key", get_value) == "value"
+        assert await cache.get_or_call("key", get_value) == "value"
+
+    anyio.run(main)
+    assert len(attempts) == 2
+
+
+def test_unhashable_values_not_cached():
+    cache = DependencyCache()
+
+    async def main():
+        async def get_value():
+            calls.append("value")
+            return "value"
+
+        for _ in range(2):
+            assert await cache.get_or_call(("key", ({},)), get_value) == "value"
+
+    anyio.run(main)
+    assert calls == ["value", "value"]
+    assert cache.stats == CacheStats(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_generator_not_allowed():
+    def get_db():
+        yield "db"  # pragma: no cover
+
+    with pytest.raises(FastAPIError, match="can't use a cache"):
+
+        @app.get("/db/")
+        def read_db(db: Annotated[str, Depends(get_db, cache=DependencyCache())]):
+            pass  # pragma: no cover
+
+
+def test_override_not_cached():
+    response = client.get("/flags/", params={"user_id": 2})
+    assert response.json() == {"beta": True}
+    app.dependency_overrides[get_flags] = lambda: {"beta": "fake"}
+    try:
+        for _ in range(2):
+            response = client.get("/flags/", params={"user_id": 2})
+            assert response.json() == {"beta": "fake"}
+    finally:
+        app.dependency_overrides.clear()
+    response = client.get("/flags/", params={"user_id": 2})
+    assert response.json() == {"beta": True}
+    assert calls == ["flags 2"]
+    assert flags_cache.stats.size == 1
+
+
+def test_request_values_not_cached():
+    for _ in range(2):
+        response = client.get("/path/")
+        assert response.json() == "/path/"
+    assert calls == ["/path/", "/path/"]
+    assert path_cache.stats == CacheStats(hits=0, misses=0, evictions=0, size=0)
+
+
+def test_per_request_values_not_cached():
+    # A new session and body in each request, they would only fill the cache
+    for i in range(5):
+        response = client.get("/repository/")
+        assert response.json() == "repository"
+        response = client.post("/name/", json=f"name {i}")
+        assert response.json() == f"name {i}"
+    assert calls.count("repository") == 5
+    assert repository_cache.stats == CacheStats(hits=0, misses=0, evictions=0, size=0)
+    assert name_cache.stats == CacheStats(hits=0, misses=0, evictions=0, size=0)
@@ -0,0 +1,163 @@
+from typing import List
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI, Query, Security
+from fastapi.dependencies.utils import get_dependant, get_execution_plan
+from fastapi.security import SecurityScopes
+from fastapi.testclient import TestClient
+
+calls: List[str] = []
+
+
+async def get_settings():
+    calls.append("settings")
+    return {"db": "sqlite"}
+
+
+def get_db(settings: dict = Depends(get_settings)):
+    calls.append("db start")
+    yield settings["db"]
+    calls.append("db end")
+
+
+def get_tenant(tenant_id: int = Query(), settings: dict = Depends(get_settings)):
+    calls.append("tenant")
+    return {"id": tenant_id, "db": settings["db"]}
+
+
+def get_counter(settings: dict = Depends(get_settings)):
+    calls.append("counter")
+    return len(calls)
+
+
+async def get_user(
+    security_scopes: SecurityScopes,
+    tenant: dict = Depends(get_tenant),
+    db: str = Depends(get_db),
+):
+    calls.append("user")
+    return {"tenant": tenant["id"], "db": db, "scopes": security_scopes.scopes}
+
+
+app = FastAPI()
+
+
+@app.get("/items/")
+def read_items(
+    user: dict = Security(get_user, scopes=["items"]),
+    counter: int = Depends(get_counter, use_cache=False),
+    other_counter: int = Depends(get_counter, use_cache=False),
+    q: str = "",
+):
+    calls.append("endpoint")
+    return {"user": user, "counter": counter, "other_counter": other_counter, "q": q}
+
+
+client = TestClient(app)
+
+
+def test_plan_steps():
+    dependant = get_dependant(path="/items/", call=read_items)
+    plan = get_execution_plan(dependant)
+    assert [step.dependant.call for step in plan.steps] == [
+        get_settings,
+        get_tenant,
+        get_settings,
+        get_db,
+        get_user,
+        get_settings,
+        get_counter,
+        get_settings,
+        get_counter,
+        read_items,
+    ]
+    assert [step.call_kind for step in plan.steps[:5]] == [
+        "coroutine",
+        "sync",
+        "coroutine",
+        "generator",
+        "coroutine",
+    ]
+    assert plan.steps[-1].sub_steps == [
+        ("user", 4),
+        ("counter", 6),
+        ("other_counter", 8),
+    ]
+    assert plan.has_yield_dependencies
+
+
+def test_solve():
+    calls.clear()
+    response = client.get("/items/", params={"tenant_id": 3, "q": "foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "user": {"tenant": 3, "db": "sqlite", "scopes": ["items"]},
+        "counter": 6,
+        "other_counter": 7,
+        "q": "foo",
+    }
+    assert calls == [
+        "settings",
+        "tenant",
+        "db start",
+        "user",
+        # The security scopes are part of the cache key
+        "settings",
+        "counter",
+        "counter",
+        "endpoint",
+        "db end",
+    ]
+
+
+def test_errors_skip_dependents():
+    calls.clear()
+    response = client.get("/items/", params={"tenant_id": "x"})
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "tenant_id"]
+    ]
+    assert "tenant" not in calls
+    assert "user" not in calls
+    assert "endpoint" not in calls
+    assert calls.count("counter") == 2
+    assert calls[-1] == "db end"
+
+
+def test_overrides():
+    calls.clear()
+
+    def override_get_settings():
+        return {"db": "postgres"}
+
+    app.dependency_overrides[get_settings] = override_get_settings
+    try:
+        response = client.get("/items/", params={"tenant_id": 1})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200, response.text
+    assert response.json()["user"] == {
+        "tenant": 1,
+        "db": "postgres",
+        "scopes": ["items"],
+    }
+    assert "settings" not in calls
+
+
+def test_plan_built_once_per_route():
+    plan_app = FastAPI()
+    with patch(
+        "fastapi.routing.get_execution_plan", wraps=get_execution_plan
+    ) as mock_get_execution_plan:
+
+        @plan_app.get("/user")
+        async def read_user(user: dict = Depends(get_user)):
+            pass  # pragma: no cover
+
+        @plan_app.websocket("/ws")
+        async def websocket_user(user: dict = Depends(get_user)):
+            pass  # pragma: no cover
+
+    assert mock_get_execution_plan.call_count == 2
+    route = plan_app.routes[-2]
+    assert route.request_handler_plan.execution_plan.dependant is route.dependant
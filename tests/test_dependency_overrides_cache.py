@@ -0,0 +1,94 @@
+from typing import Any, List
+from unittest.mock import patch
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.dependencies import utils
+from fastapi.testclient import TestClient
+from typing_extensions import Annotated
+
+
+async def common_parameters(q: str = "default"):
+    return {"q": q}
+
+
+def get_user():
+    return "rick"
+
+
+app = FastAPI()
+router = APIRouter()
+
+
+@router.get("/items/")
+async def read_items(
+    commons: Annotated[dict, Depends(common_parameters)],
+    user: Annotated[str, Depends(get_user)],
+):
+    return {"commons": commons, "user": user}
+
+
+app.include_router(router)
+
+client = TestClient(app)
+
+
+def override_common_parameters(k: str = "override"):
+    return {"k": k}
+
+
+def override_user():
+    return "morty"
+
+
+def count_get_dependant() -> Any:
+    return patch.object(utils, "get_dependant", wraps=utils.get_dependant)
+
+
+def test_overrides_are_built_once():
+    app.dependency_overrides[common_parameters] = override_common_parameters
+    try:
+        with count_get_dependant() as get_dependant:
+            for _ in range(3):
+                response = client.get("/items/", params={"k": "value"})
+                assert response.status_code == 200, response.text
+                assert response.json() == {"commons": {"k": "value"}, "user": "rick"}
+        assert get_dependant.call_count == 1
+    finally:
+        app.dependency_overrides = {}
+
+
+def test_overrides_change_invalidates_cache():
+    calls: List[str] = []
+
+    def first_override():
+        calls.append("first")
+        return "first"
+
+    def second_override():
+        calls.append("second")
+        return "second"
+
+    app.dependency_overrides[get_user] = first_override
+    try:
+        assert client.get("/items/").json()["user"] == "first"
+        app.dependency_overrides[get_user] = second_override
+        assert client.get("/items/").json()["user"] == "second"
+        app.dependency_overrides[common_parameters] = override_common_parameters
+        assert client.get("/items/").json() == {
+            "commons": {"k": "override"},
+            "user": "second",
+        }
+        del app.dependency_overrides[get_user]
+        assert client.get("/items/").json()["user"] == "rick"
+        app.dependency_overrides = {get_user: override_user}
+        assert client.get("/items/").json() == {
+            "commons": {"q": "default"},
+            "user": "morty",
+        }
+    finally:
+        app.dependency_overrides = {}
+    assert client.get("/items/").json() == {
+        "commons": {"q": "default"},
+        "user": "rick",
+    }
+    assert calls == ["first", "second", "second"]
@@ -0,0 +1,187 @@
+from typing import List
+
+import pytest
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+calls: List[str] = []
+versions = {"foo": 3}
+
+
+def get_item_version(item_id: str):
+    calls.append("get_item_version")
+    return versions.get(item_id)
+
+
+def expensive_dependency():
+    calls.append("expensive_dependency")
+
+
+app = FastAPI()
+router = APIRouter(etag=True)
+
+
+@router.get("/items/{item_id}")
+def read_item(item_id: str):
+    calls.append("read_item")
+    return {"item_id": item_id}
+
+
+@router.get("/no-etag", etag=False)
+def read_no_etag():
+    return "no etag"
+
+
+@router.get("/custom-etag")
+def read_custom_etag(response: Response):
+    response.headers["etag"] = '"custom"'
+    return "custom"
+
+
+@router.get("/not-found")
+def read_not_found(response: Response):
+    response.status_code = 404
+    return "not found"
+
+
+@router.get("/background")
+def read_background(background_tasks: BackgroundTasks):
+    background_tasks.add_task(calls.append, "background")
+    return "background"
+
+
+@router.post("/items/{item_id}")
+def update_item(item_id: str):
+    return {"item_id": item_id}
+
+
+@router.get(
+    "/versioned/{item_id}",
+    etag=Depends(get_item_version),
+    dependencies=[Depends(expensive_dependency)],
+)
+def read_versioned(item_id: str, response: Response):
+    calls.append("read_versioned")
+    response.headers["cache-control"] = "max-age=0"
+    return {"item_id": item_id}
+
+
+def get_locale_version(locale: str = "en"):
+    return f"{locale}-1"
+
+
+@router.get("/localized", etag=Depends(get_locale_version))
+def read_localized():
+    return "localized"
+
+
+app.include_router(router)
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def test_body_hash():
+    response = client.get("/items/foo")
+    assert response.status_code == 200, response.text
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert client.get("/items/bar").headers["etag"] != etag
+    assert client.get("/items/foo").headers["etag"] == etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", "W/{etag}", '"other", {etag}', "*"],
+)
+def test_not_modified(if_none_match: str):
+    etag = client.get("/items/foo").headers["etag"]
+    response = client.get(
+        "/items/foo", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "content-length" not in response.headers
+
+
+def test_modified():
+    response = client.get("/items/foo", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert response.json() == {"item_id": "foo"}
+
+
+def test_no_etag():
+    assert "etag" not in client.get("/no-etag").headers
+    assert "etag" not in client.get("/not-found").headers
+    assert "etag" not in client.post("/items/foo").headers
+    assert client.get("/custom-etag").headers["etag"] == '"custom"'
+
+
+def test_not_modified_runs_background_tasks():
+    etag = client.get("/background").headers["etag"]
+    response = client.get("/background", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert calls == ["background", "background"]
+
+
+def test_version_dependency():
+    response = client.get("/versioned/foo")
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"3"'
+    assert calls == [
+        "get_item_version",
+        "expensive_dependency",
+        "read_versioned",
+    ]
+    calls.clear()
+    response = client.get("/versioned/foo", headers={"If-None-Match": '"3"'})
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"3"'
+    assert calls == ["get_item_version"]
+
+
+def test_version_dependency_changed():
+    versions["foo"] = 4
+    try:
+        response = client.get("/versioned/foo", headers={"If-None-Match": '"3"'})
+    finally:
+        versions["foo"] = 3
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"4"'
+
+
+def test_version_dependency_none():
+    # Without a version, the body is hashed
+    response = client.get("/versioned/bar")
+    etag = response.headers["etag"]
+    assert len(etag) == 34
+    response = client.get("/versioned/bar", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "max-age=0"
+    assert calls.count("read_versioned") == 2
+
+
+def test_version_dependency_params():
+    response = client.get("/localized", params={"locale": "fr"})
+    assert response.headers["etag"] == '"fr-1"'
+
+
+def test_version_dependency_params_openapi():
+    # The parameters of the version dependency are parameters of the path operation
+    response = client.get("/openapi.json")
+    operation = response.json()["paths"]["/localized"]["get"]
+    assert operation["parameters"] == [
+        {
+            "name": "locale",
+            "in": "query",
+            "required": False,
+            "schema": {"type": "string", "default": "en", "title": "Locale"},
+        }
+    ]
+    assert "422" in operation["responses"]
+    operation = response.json()["paths"]["/versioned/{item_id}"]["get"]
+    assert [param["name"] for param in operation["parameters"]] == ["item_id"]
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+def get_import_times(statement: str) -> Dict[str, int]:
+    """
+    Run `statement` in a new interpreter with `-X importtime` and return the
+    cumulative import time in microseconds of each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+HEAVY_MODULES = [
+    "fastapi.applications",
+    "fastapi.routing",
+    "fastapi.params",
+    "fastapi.openapi.models",
+]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fastapi",
+        "import fastapi.encoders",
+        "import fastapi.exceptions",
+        "from fastapi.responses import JSONResponse",
+    ],
+)
+def test_light_entry_points(statement: str):
+    import_times = get_import_times(statement)
+    assert "fastapi" in import_times
+    assert [module for module in HEAVY_MODULES if module in import_times] == []
+
+
+def test_app():
+    import_times = get_import_times("from fastapi import FastAPI, Depends")
+    assert import_times.keys() >= set(HEAVY_MODULES)
+    for module in [
+        "fastapi.security.api_key",
+        "fastapi.security.http",
+        "starlette.testclient",
+        "starlette.templating",
+    ]:
+        assert module not in import_times
+
+
+def test_public_names():
+    import fastapi
+    import fastapi.security
+
+    assert fastapi.FastAPI.__module__ == "fastapi.applications"
+    assert fastapi.security.HTTPBasic.__module__ == "fastapi.security.http"
+    assert set(fastapi.__all__) <= set(dir(fastapi))
+    assert set(fastapi.security.__all__) <= set(dir(fastapi.security))
+    with pytest.raises(AttributeError):
+        fastapi.NotAName  # noqa: B018
+    with pytest.raises(AttributeError):
+        fastapi.security.NotAName  # noqa: B018
@@ -0,0 +1,126 @@
+import gc
+import weakref
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+
+
+def get_token(x_token: str = Header()) -> str:
+    if x_token != "secret":
+        raise HTTPException(status_code=401)
+    return x_token
+
+
+def get_limit(limit: int = 10) -> int:
+    return limit
+
+
+router = APIRouter()
+
+
+@router.post("/items/{item_id}")
+def update_item(item_id: int, item: Item, limit: int = Depends(get_limit)):
+    return {"item_id": item_id, "name": item.name, "limit": limit}
+
+
+@router.get("/users/")
+def read_user(user_id: int):
+    return {"user_id": user_id}
+
+
+v1_router = APIRouter()
+v1_router.include_router(router, prefix="/v1")
+app = FastAPI()
+app.include_router(v1_router, prefix="/api", dependencies=[Depends(get_token)])
+app.include_router(router, prefix="/users/{user_id}")
+
+client = TestClient(app)
+
+
+def get_route(routes, path: str) -> APIRoute:
+    (route,) = [r for r in routes if isinstance(r, APIRoute) and r.path == path]
+    return route
+
+
+def test_included_routes_share_dependants():
+    route = get_route(router.routes, "/items/{item_id}")
+    v1_route = get_route(v1_router.routes, "/v1/items/{item_id}")
+    app_route = get_route(app.routes, "/api/v1/items/{item_id}")
+    assert v1_route.dependant is not route.dependant
+    assert v1_route.dependant.path == "/v1/items/{item_id}"
+    assert v1_route.dependant.dependencies[0] is route.dependant.dependencies[0]
+    assert v1_route.dependant.body_params[0] is route.dependant.body_params[0]
+    assert v1_route.dependant.path_params[0] is route.dependant.path_params[0]
+    # The dependencies of the routers are added in front
+    token_dependant, limit_dependant = app_route.dependant.dependencies
+    assert token_dependant.call is get_token
+    assert limit_dependant is route.dependant.dependencies[0]
+    assert len(route.dependant.dependencies) == 1
+
+
+def test_included_routes():
+    response = client.post(
+        "/api/v1/items/3",
+        params={"limit": 5},
+        json={"name": "Foo"},
+        headers={"X-Token": "secret"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item_id": 3, "name": "Foo", "limit": 5}
+    response = client.post("/api/v1/items/3", json={"name": "Foo"})
+    assert response.status_code == 422
+    response = client.post(
+        "/api/v1/items/3", json={"name": "Foo"}, headers={"X-Token": "wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_prefix_with_path_params():
+    route = get_route(router.routes, "/users/")
+    user_route = get_route(app.routes, "/users/{user_id}/users/")
+    assert [field.name for field in route.dependant.query_params] == ["user_id"]
+    assert [field.name for field in user_route.dependant.path_params] == ["user_id"]
+    assert user_route.dependant.query_params == []
+    response = client.get("/users/7/users/")
+    assert response.json() == {"user_id": 7}
+
+
+def test_dependency_overrides():
+    app.dependency_overrides[get_limit] = lambda: 1
+    try:
+        response = client.post(
+            "/api/v1/items/3",
+            params={"limit": 5},
+            json={"name": "Foo"},
+            headers={"X-Token": "secret"},
+        )
+        assert response.json() == {"item_id": 3, "name": "Foo", "limit": 1}
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_dependants_scoped_to_routers():
+    other_router = APIRouter()
+    other_router.post("/items/{item_id}")(update_item)
+    other_route = get_route(other_router.routes, "/items/{item_id}")
+    route = get_route(router.routes, "/items/{item_id}")
+    assert other_route.dependant.dependencies[0] is not route.dependant.dependencies[0]
+
+
+def test_endpoints_not_kept_alive():
+    def read_temporary(q: int = 0):
+        return q  # pragma: no cover
+
+    temporary_app = FastAPI()
+    temporary_app.get("/temporary/")(read_temporary)
+    temporary_app.include_router(router)
+    endpoint_ref = weakref.ref(read_temporary)
+    del temporary_app, read_temporary
+    gc.collect()
+    assert endpoint_ref() is None
@@ -0,0 +1,245 @@
+from datetime import datetime
+from typing import List
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from fastapi import Body, Depends, FastAPI, HTTPException, Request
+from fastapi._compat import PYDANTIC_V2
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+from starlette.requests import Request as StarletteRequest
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+app = FastAPI()
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    return JSONResponse(
+        status_code=422,
+        content=jsonable_encoder({"detail": exc.errors(), "body": exc.body}),
+    )
+
+
+@app.post("/items/")
+async def create_item(item: Item, q: int = 0):
+    return {"item": item, "q": q}
+
+
+@app.post("/items/raw/")
+async def create_item_raw(item: Item, request: Request):
+    return {"item": item, "json": await request.json()}
+
+
+@app.post("/embedded/")
+async def create_embedded(item: Item = Body(embed=True)):
+    return item
+
+
+def get_item(item: Item):
+    return item
+
+
+@app.post("/dependency/")
+async def create_from_dependency(item: Item = Depends(get_item)):
+    return item
+
+
+if PYDANTIC_V2:
+    from pydantic import ConfigDict, ValidationInfo, field_validator
+
+    class StrictEvent(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        id: UUID
+        created: datetime
+
+    class StrictFieldEvent(BaseModel):
+        created: datetime = Field(strict=True)
+
+    class ModeEvent(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def add_mode(cls, value: str, info: ValidationInfo) -> str:
+            return f"{value} ({info.mode})"
+
+    @app.post("/strict/")
+    async def create_strict(event: StrictEvent):
+        return event
+
+    @app.post("/strict-field/")
+    async def create_strict_field(event: StrictFieldEvent):
+        return event
+
+    @app.post("/mode/")
+    async def create_mode(event: ModeEvent):
+        return event
+
+
+client = TestClient(app)
+
+
+def get_route(path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path:
+            return route
+    raise AssertionError(path)  # pragma: no cover
+
+
+@needs_pydanticv2
+def test_plan():
+    assert get_route("/items/").request_handler_plan.validates_json_body
+    assert get_route("/dependency/").request_handler_plan.validates_json_body
+    assert not get_route("/embedded/").request_handler_plan.validates_json_body
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize("path", ["/items/", "/dependency/"])
+def test_validated_from_bytes(path: str):
+    with patch.object(StarletteRequest, "json", side_effect=AssertionError):
+        response = client.post(path, json={"name": "Foo", "tags": ["bar"]})
+    assert response.status_code == 200, response.text
+    if path == "/items/":
+        assert response.json() == {"item": {"name": "Foo", "tags": ["bar"]}, "q": 0}
+    else:
+        assert response.json() == {"name": "Foo", "tags": ["bar"]}
+
+
+def test_request_json_still_available():
+    response = client.post("/items/raw/", json={"name": "Foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "item": {"name": "Foo", "tags": []},
+        "json": {"name": "Foo"},
+    }
+
+
+def test_invalid_json():
+    response = client.post(
+        "/items/",
+        content=b'{"name": "Foo", ',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "json_invalid",
+                "loc": ["body", 16],
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": "Expecting property name enclosed in double quotes"},
+            }
+        ],
+        "body": '{"name": "Foo", ',
+    }
+
+
+def test_invalid_data():
+    response = client.post("/items/", json={"tags": "bar"})
+    assert response.status_code == 422, response.text
+    errors = response.json()["detail"]
+    assert [(error["type"], error["loc"]) for error in errors] == [
+        ("missing", ["body", "name"]),
+        ("list_type", ["body", "tags"]),
+    ]
+    assert response.json()["body"] == {"tags": "bar"}
+
+
+def test_invalid_body_type():
+    response = client.post("/items/", json=["Foo"])
+    assert response.status_code == 422, response.text
+    assert response.json()["body"] == ["Foo"]
+
+
+def test_error_in_other_param_keeps_parsed_body():
+    response = client.post("/items/?q=abc", json={"name": "Foo"})
+    assert response.status_code == 422, response.text
+    assert [error["loc"] for error in response.json()["detail"]] == [["query", "q"]]
+    assert response.json()["body"] == {"name": "Foo"}
+
+
+def test_not_json_content_type():
+    response = client.post(
+        "/items/", content=b'{"name": "Foo"}', headers={"content-type": "text/plain"}
+    )
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["type"] == "model_attributes_type"
+
+
+@pytest.mark.parametrize(
+    "error,status_code",
+    [(HTTPException(status_code=413), 413), (RuntimeError("disconnected"), 400)],
+)
+def test_receive_error(error: Exception, status_code: int):
+    # The body is read once, the error of a receive that raises is not swallowed
+    # and the stream is not read again
+    def raise_on_receive(app):
+        async def middleware(scope, receive, send):
+            received = []
+
+            async def receive_error():
+                if received:
+                    # The stream was already consumed
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                received.append(True)
+                raise error
+
+            await app(scope, receive_error, send)
+
+        return middleware
+
+    error_app = FastAPI()
+    error_app.post("/items/")(create_item)
+    error_app.add_middleware(raise_on_receive)
+    response = TestClient(error_app).post("/items/", json={"name": "Foo"})
+    assert response.status_code == status_code, response.text
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize("path", ["/strict/", "/strict-field/", "/mode/"])
+def test_plan_validates_parsed_json(path: str):
+    # Validating the JSON bytes would accept strings for strict datetimes and UUIDs,
+    # and validators would see the "json" mode
+    assert not get_route(path).request_handler_plan.validates_json_body
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize(
+    "path,body",
+    [
+        (
+            "/strict/",
+            {
+                "id": "2a8b7d1c-4f62-4e9b-9d6a-3b1f0c5e7a21",
+                "created": "2025-01-01T00:00:00",
+            },
+        ),
+        ("/strict-field/", {"created": "2025-01-01T00:00:00"}),
+    ],
+)
+def test_strict(path: str, body: dict):
+    # The same as validating the parsed JSON, strings are not valid in strict mode
+    response = client.post(path, json=body)
+    assert response.status_code == 422, response.text
+
+
+@needs_pydanticv2
+def test_validator_mode():
+    response = client.post("/mode/", json={"name": "Foo"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Foo (python)"}
@@ -4,11 +4,11 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from pathlib import PurePath, PurePosixPath, PureWindowsPath
-from typing import Optional
+from typing import List, Optional
 
 import pytest
 from fastapi._compat import PYDANTIC_V2, Undefined
-from fastapi.encoders import jsonable_encoder
+from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
 from pydantic import BaseModel, Field, ValidationError
 
 from .utils import needs_pydanticv1, needs_pydanticv2
@@ -316,3 +316,122 @@ def test_encode_deque_encodes_child_models():
 def test_encode_pydantic_undefined():
     data = {"value": Undefined}
     assert jsonable_encoder(data) == {"value": None}
+
+
+def test_custom_encoder_per_call():
+    data = {"name": "foo", "tags": ["bar"]}
+    assert jsonable_encoder(data, custom_encoder={str: str.upper}) == {
+        "NAME": "FOO",
+        "TAGS": ["BAR"],
+    }
+    assert jsonable_encoder(data, custom_encoder={str: lambda s: s * 2}) == {
+        "namename": "foofoo",
+        "tagstags": ["barbar"],
+    }
+    assert jsonable_encoder(data) == data
+
+
+def test_encode_subclass_of_encoded_type():
+    class SafeDatetime(datetime):
+        pass
+
+    dt = SafeDatetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert jsonable_encoder([dt, {"dt": dt}]) == [
+        "2020-01-01T00:00:00+00:00",
+        {"dt": "2020-01-01T00:00:00+00:00"},
+    ]
+
+
+def test_encode_type_added_to_encoders_by_type():
+    class Token:
+        def __init__(self, value: str):
+            self.value = value
+
+    assert jsonable_encoder(Token("a")) == {"value": "a"}
+    ENCODERS_BY_TYPE[Token] = lambda token: token.value
+    try:
+        assert jsonable_encoder(Token("a")) == "a"
+    finally:
+        del ENCODERS_BY_TYPE[Token]
+
+
+def test_encode_dataclass_class():
+    @dataclass
+    class Item:
+        name: str
+
+    class NotADataclass:
+        pass
+
+    with pytest.raises(TypeError):
+        jsonable_encoder(Item)
+    with pytest.raises(ValueError):
+        jsonable_encoder(NotADataclass)
+
+
+def test_encode_dict_keys():
+    class Color(Enum):
+        red = "red"
+
+    data = {"_sa_instance_state": 1, 1: None, Color.red: 2, "foo": {"_sa": 3}}
+    assert jsonable_encoder(data) == {1: None, "red": 2, "foo": {}}
+    assert jsonable_encoder(data, exclude_none=True) == {"red": 2, "foo": {}}
+    assert jsonable_encoder(data, sqlalchemy_safe=False) == {
+        "_sa_instance_state": 1,
+        1: None,
+        "red": 2,
+        "foo": {"_sa": 3},
+    }
+
+
+@needs_pydanticv2
+def test_encode_model_dict_fields_filtered():
+    class Item(BaseModel):
+        name: str
+        description: Optional[str] = None
+        extra: dict = {}
+
+    class Container(BaseModel):
+        items: List[Item]
+
+    container = Container(
+        items=[Item(name="foo", extra={"_sa_instance_state": 1, "bar": None})]
+    )
+    assert jsonable_encoder(container) == {
+        "items": [{"name": "foo", "description": None, "extra": {"bar": None}}]
+    }
+    assert jsonable_encoder(container, exclude_none=True) == {
+        "items": [{"name": "foo", "extra": {}}]
+    }
+    assert jsonable_encoder(container, sqlalchemy_safe=False) == {
+        "items": [
+            {
+                "name": "foo",
+                "description": None,
+                "extra": {"_sa_instance_state": 1, "bar": None},
+            }
+        ]
+    }
+
+
+@needs_pydanticv2
+def test_encode_model_include_exclude_nested():
+    class Item(BaseModel):
+        name: str
+        price: float
+        created: datetime
+
+    class Order(BaseModel):
+        id: int
+        items: List[Item]
+
+    order = Order(
+        id=1, items=[Item(name="foo", price=1.5, created=datetime(2020, 1, 1))]
+    )
+    assert jsonable_encoder(order, include={"items": {0: {"name"}}}) == {
+        "items": [{"name": "foo"}]
+    }
+    assert jsonable_encoder(order, exclude={"items": {"__all__": {"price"}}}) == {
+        "id": 1,
+        "items": [{"name": "foo", "created": "2020-01-01T00:00:00"}],
+    }
@@ -0,0 +1,162 @@
+import threading
+from typing import Any, Callable, Coroutine, List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+def get_token(token: str = "default") -> str:
+    return token
+
+
+def create_app(lazy_routes: bool) -> FastAPI:
+    app = FastAPI(lazy_routes=lazy_routes)
+    router = APIRouter(lazy_routes=lazy_routes)
+
+    @app.get("/items/{item_id}", response_model=Item)
+    def read_item(item_id: int, token: str = Depends(get_token)):
+        return {"name": f"Item {item_id}", "price": 1.5, "token": token}
+
+    @router.post("/items/")
+    def create_item(item: Item) -> List[Item]:
+        return [item]
+
+    app.include_router(router, prefix="/router")
+    return app
+
+
+def get_api_routes(app: FastAPI) -> List[APIRoute]:
+    return [route for route in app.routes if isinstance(route, APIRoute)]
+
+
+def is_compiled(route: APIRoute) -> bool:
+    return "app" in route.__dict__
+
+
+def test_routes_are_not_compiled():
+    app = create_app(lazy_routes=True)
+    routes = get_api_routes(app)
+    assert len(routes) == 2
+    assert not any(is_compiled(route) for route in routes)
+    assert all(route.lazy for route in routes)
+
+
+def test_compile_on_request():
+    app = create_app(lazy_routes=True)
+    client = TestClient(app)
+    read_item, create_item = get_api_routes(app)
+    response = client.get("/items/3", params={"token": "secret"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "Item 3", "price": 1.5}
+    assert is_compiled(read_item)
+    assert not is_compiled(create_item)
+    response = client.post("/router/items/", json={"name": "Foo", "price": 2})
+    assert response.json() == [{"name": "Foo", "price": 2.0}]
+    assert is_compiled(create_item)
+
+
+def test_openapi():
+    app = create_app(lazy_routes=True)
+    client = TestClient(app)
+    response = client.get("/openapi.json")
+    assert response.json() == create_app(lazy_routes=False).openapi()
+    assert all(is_compiled(route) for route in get_api_routes(app))
+
+
+def test_warmup():
+    app = create_app(lazy_routes=True)
+    assert app.warmup() is None
+    assert all(is_compiled(route) for route in get_api_routes(app))
+    # Already compiled routes are not compiled again
+    dependant = get_api_routes(app)[0].dependant
+    app.warmup()
+    assert get_api_routes(app)[0].dependant is dependant
+
+
+def test_warmup_background():
+    app = create_app(lazy_routes=True)
+    client = TestClient(app)
+    thread = app.warmup(background=True)
+    assert thread is not None
+    response = client.get("/items/3")
+    assert response.status_code == 200, response.text
+    thread.join()
+    assert all(is_compiled(route) for route in get_api_routes(app))
+
+
+def test_declaration_errors_are_deferred():
+    app = FastAPI(lazy_routes=True)
+
+    @app.get("/", response_model=Depends)
+    def read_root():
+        pass  # pragma: no cover
+
+    with pytest.raises(FastAPIError):
+        app.warmup()
+
+
+def test_missing_attribute():
+    app = create_app(lazy_routes=True)
+    route = get_api_routes(app)[0]
+    with pytest.raises(AttributeError):
+        route.not_an_attribute  # noqa: B018
+
+
+def test_compile_routes_in_parallel():
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowRoute(APIRoute):
+        def get_route_handler(
+            self,
+        ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            if self.path == "/slow":
+                started.set()
+                release.wait(5)
+            return super().get_route_handler()
+
+    router = APIRouter(lazy_routes=True, route_class=SlowRoute)
+    router.get("/slow")(get_token)
+    router.get("/fast")(get_token)
+    slow_route, fast_route = router.routes
+    assert isinstance(slow_route, APIRoute)
+    assert isinstance(fast_route, APIRoute)
+    thread = threading.Thread(target=slow_route.compile)
+    thread.start()
+    started.wait(5)
+    # Each route has its own lock, the other routes don't wait for the slow one
+    fast_route.compile()
+    assert is_compiled(fast_route)
+    assert not is_compiled(slow_route)
+    release.set()
+    thread.join()
+    assert is_compiled(slow_route)
+
+
+def test_attribute_access_while_compiling():
+    accessed: List[bool] = []
+
+    class CheckingRoute(APIRoute):
+        def get_route_handler(
+            self,
+        ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            # Not set yet, the route is not compiled again nor waits for itself
+            accessed.append(hasattr(self, "app"))
+            return super().get_route_handler()
+
+    router = APIRouter(lazy_routes=True, route_class=CheckingRoute)
+    router.get("/")(get_token)
+    response = TestClient(router).get("/")
+    assert response.json() == "default"
+    assert accessed == [False]
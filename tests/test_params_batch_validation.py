@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+import pytest
+from fastapi import Cookie, Depends, FastAPI, Header, Query
+from fastapi.dependencies.utils import get_params_validator
+from fastapi.params import ParamTypes
+from fastapi.testclient import TestClient
+from typing_extensions import Annotated
+
+from .utils import needs_pydanticv2
+
+app = FastAPI()
+
+
+@app.get("/items/")
+def read_items(
+    q: Annotated[Optional[str], Query(max_length=5)] = None,
+    skip: int = 0,
+    limit: Annotated[int, Query(gt=0, le=100)] = 10,
+    item_query: Annotated[Optional[str], Query(alias="item-query")] = None,
+    tags: Annotated[List[int], Query()] = [],  # noqa: B006
+    required_flag: bool = Query(),
+    user_agent: Annotated[str, Header()] = "unknown",
+    x_token: Annotated[Optional[List[str]], Header()] = None,
+    session: Annotated[Optional[str], Cookie()] = None,
+    tracker: Annotated[int, Cookie()] = 0,
+):
+    return {
+        "q": q,
+        "skip": skip,
+        "limit": limit,
+        "item_query": item_query,
+        "tags": tags,
+        "required_flag": required_flag,
+        "user_agent": user_agent,
+        "x_token": x_token,
+        "session": session,
+        "tracker": tracker,
+    }
+
+
+client = TestClient(app)
+
+
+def test_valid():
+    client = TestClient(app, cookies={"session": "abc", "tracker": "3"})
+    response = client.get(
+        "/items/",
+        params=[
+            ("q", "foo"),
+            ("skip", "2"),
+            ("item-query", "bar"),
+            ("tags", "1"),
+            ("tags", "2"),
+            ("required_flag", "yes"),
+        ],
+        headers=[("user-agent", "tests"), ("x-token", "a"), ("x-token", "b")],
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "q": "foo",
+        "skip": 2,
+        "limit": 10,
+        "item_query": "bar",
+        "tags": [1, 2],
+        "required_flag": True,
+        "user_agent": "tests",
+        "x_token": ["a", "b"],
+        "session": "abc",
+        "tracker": 3,
+    }
+
+
+def test_defaults():
+    response = client.get("/items/", params={"required_flag": "false"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "q": None,
+        "skip": 0,
+        "limit": 10,
+        "item_query": None,
+        "tags": [],
+        "required_flag": False,
+        "user_agent": "testclient",
+        "x_token": None,
+        "session": None,
+        "tracker": 0,
+    }
+
+
+def test_errors_keep_locations_and_order():
+    client = TestClient(app, cookies={"tracker": "y"})
+    response = client.get(
+        "/items/",
+        params=[("q", "foobar"), ("limit", "0"), ("tags", "1"), ("tags", "x")],
+    )
+    assert response.status_code == 422, response.text
+    errors = response.json()["detail"]
+    assert [(error["type"], error["loc"]) for error in errors] == [
+        ("string_too_long", ["query", "q"]),
+        ("greater_than", ["query", "limit"]),
+        ("int_parsing", ["query", "tags", 1]),
+        ("missing", ["query", "required_flag"]),
+        ("int_parsing", ["cookie", "tracker"]),
+    ]
+    assert errors[0] == {
+        "type": "string_too_long",
+        "loc": ["query", "q"],
+        "msg": "String should have at most 5 characters",
+        "input": "foobar",
+        "ctx": {"max_length": 5},
+    }
+
+
+@needs_pydanticv2
+def test_type_adapter_per_location():
+    dependant = app.routes[-1].dependant
+    query_validator = get_params_validator(dependant, ParamTypes.query)
+    assert query_validator is not None
+    assert get_params_validator(dependant, ParamTypes.query) is query_validator
+    assert get_params_validator(dependant, ParamTypes.path) is None
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [("/alias/?q=1&size=2", 200), ("/alias/?q=1&size=x", 422)],
+)
+def test_sub_dependency(path: str, expected: int):
+    def pagination(q: int, page_size: Annotated[int, Query(alias="size")] = 5):
+        return {"q": q, "page_size": page_size}
+
+    sub_app = FastAPI()
+
+    @sub_app.get("/alias/")
+    def read_alias(page: Annotated[dict, Depends(pagination)]):
+        return page
+
+    response = TestClient(sub_app).get(path)
+    assert response.status_code == expected, response.text
+    if expected == 200:
+        assert response.json() == {"q": 1, "page_size": 2}
+    else:
+        assert response.json()["detail"][0]["loc"] == ["query", "size"]
@@ -0,0 +1,120 @@
+import gc
+from typing import Any, Callable, Dict, List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.routing import Mount
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+def get_page(skip: int = 0, limit: int = 10) -> Dict[str, int]:
+    return {"skip": skip, "limit": limit}
+
+
+def create_app(**kwargs) -> FastAPI:
+    app = FastAPI(lazy_routes=True, **kwargs)
+    router = APIRouter(lazy_routes=True)
+
+    @app.get("/items/{item_id}", response_model=Item)
+    def read_item(item_id: int):
+        return {"name": f"Item {item_id}", "price": 1.5}
+
+    @router.post("/items/")
+    def create_item(item: Item) -> List[Item]:
+        return [item]
+
+    @router.get("/items/")
+    def read_items(page: Dict[str, int] = Depends(get_page)):
+        return page
+
+    app.include_router(router, prefix="/router")
+    sub_app = FastAPI(lazy_routes=True)
+    sub_app.include_router(router)
+    app.mount("/sub", sub_app)
+    return app
+
+
+def get_step_dependant(route: APIRoute, call: Callable[..., Any]) -> Dependant:
+    for step in route.request_handler_plan.execution_plan.steps:
+        if step.dependant.call is call:
+            return step.dependant
+    raise AssertionError(call)  # pragma: no cover
+
+
+@pytest.fixture(autouse=True)
+def unfreeze():
+    yield
+    gc.unfreeze()
+
+
+def test_prepare_for_fork():
+    app = create_app(route_trie=True)
+    app.prepare_for_fork()
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert len(routes) == 3
+    assert all("app" in route.__dict__ for route in routes)
+    assert app.middleware_stack is not None
+    assert app.router._route_trie is not None
+    assert app.openapi_schema is not None
+    assert gc.get_freeze_count() > 0
+    client = TestClient(app)
+    response = client.post("/router/items/", json={"name": "Foo", "price": 2})
+    assert response.json() == [{"name": "Foo", "price": 2.0}]
+    response = client.get("/openapi.json")
+    assert response.json() == app.openapi_schema
+
+
+def test_no_openapi():
+    app = create_app(openapi_url=None)
+    app.prepare_for_fork()
+    assert app.openapi_schema is None
+    response = TestClient(app).get("/items/3")
+    assert response.json() == {"name": "Item 3", "price": 1.5}
+
+
+def test_no_middleware_after_prepare_for_fork():
+    app = create_app()
+    app.add_middleware(GZipMiddleware)
+    app.prepare_for_fork()
+    with pytest.raises(RuntimeError):
+        app.add_middleware(GZipMiddleware)
+
+
+def test_prepared_before_freeze(monkeypatch: pytest.MonkeyPatch):
+    app = create_app()
+    (mount,) = [route for route in app.routes if isinstance(route, Mount)]
+    sub_app = mount.app
+    assert isinstance(sub_app, FastAPI)
+    freeze = gc.freeze
+    frozen = []
+
+    def check_and_freeze() -> None:
+        # Everything is built before the objects are frozen
+        for current_app in [app, sub_app]:
+            routes = [r for r in current_app.routes if isinstance(r, APIRoute)]
+            assert all("app" in route.__dict__ for route in routes)
+            assert current_app.middleware_stack is not None
+            (route,) = [r for r in routes if r.endpoint.__name__ == "read_items"]
+            assert "query" in get_step_dependant(route, get_page).params_validators
+        assert app.openapi_schema is not None
+        assert sub_app.openapi_schema is None
+        frozen.append(True)
+        freeze()
+
+    monkeypatch.setattr(gc, "freeze", check_and_freeze)
+    app.prepare_for_fork()
+    assert frozen == [True]
+    client = TestClient(app)
+    response = client.get("/sub/items/", params={"skip": 5})
+    assert response.json() == {"skip": 5, "limit": 10}
+    response = client.get("/router/items/", params={"limit": 2})
+    assert response.json() == {"skip": 0, "limit": 2}
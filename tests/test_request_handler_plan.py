@@ -0,0 +1,144 @@
+from typing import Optional
+
+from fastapi import BackgroundTasks, Depends, FastAPI, Form, Response
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: Optional[float] = None
+
+
+def get_token():
+    return "token"
+
+
+def get_db():
+    yield "db"
+
+
+app = FastAPI()
+tasks = []
+
+
+@app.get("/ping")
+def ping():
+    return {"ping": "pong"}
+
+
+@app.get("/created", status_code=201)
+async def created():
+    return "created"
+
+
+@app.get("/items/{item_id}", response_model=Item)
+def read_item(item_id: str, token: str = Depends(get_token)):
+    return {"name": item_id, "price": 1.5, "token": token}
+
+
+@app.post("/items/")
+async def create_item(item: Item, background_tasks: BackgroundTasks):
+    background_tasks.add_task(tasks.append, item.name)
+    return item
+
+
+@app.get("/db")
+def read_db(response: Response, db: str = Depends(get_db)):
+    response.headers["X-DB"] = db
+    response.status_code = 202
+    return db
+
+
+@app.post("/login/")
+def login(username: str = Form()):
+    return username
+
+
+client = TestClient(app)
+
+
+def get_plan(path: str):
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path:
+            return route.request_handler_plan
+    raise AssertionError(path)  # pragma: no cover
+
+
+def test_plans():
+    assert get_plan("/ping").fast_path == "endpoint_only"
+    assert get_plan("/created").fast_path == "endpoint_only"
+    items_plan = get_plan("/items/{item_id}")
+    assert items_plan.fast_path == "no_body"
+    assert items_plan.validates_response
+    assert not items_plan.uses_exit_stack
+    create_plan = get_plan("/items/")
+    assert create_plan.fast_path == "json_body"
+    assert create_plan.reads_body
+    assert not create_plan.validates_response
+    db_plan = get_plan("/db")
+    assert db_plan.fast_path == "general"
+    assert db_plan.uses_exit_stack
+    login_plan = get_plan("/login/")
+    assert login_plan.fast_path == "general"
+    assert login_plan.is_body_form
+
+
+def test_endpoint_only():
+    response = client.get("/ping")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"ping": "pong"}
+    response = client.get("/created")
+    assert response.status_code == 201, response.text
+    assert response.json() == "created"
+
+
+def test_no_body():
+    response = client.get("/items/foo")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 1.5}
+
+
+def test_json_body():
+    tasks.clear()
+    response = client.post("/items/", json={"name": "bar"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "bar", "price": None}
+    assert tasks == ["bar"]
+
+
+def test_json_body_errors():
+    response = client.post("/items/", json={"price": 2})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", "name"]
+    response = client.post(
+        "/items/", content="{", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_general():
+    response = client.get("/db")
+    assert response.status_code == 202, response.text
+    assert response.headers["x-db"] == "db"
+    response = client.post("/login/", data={"username": "rick"})
+    assert response.status_code == 200, response.text
+    assert response.json() == "rick"
+
+
+def test_overrides_with_yield_use_general_handler():
+    teardown = []
+
+    def override_get_token():
+        yield "override"
+        teardown.append("done")
+
+    app.dependency_overrides[get_token] = override_get_token
+    try:
+        response = client.get("/items/foo")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200, response.text
+    assert teardown == ["done"]
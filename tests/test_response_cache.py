@@ -0,0 +1,243 @@
+from typing import List, Optional
+
+import anyio
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Header, Response
+from fastapi.response_cache import (
+    CachedResponse,
+    InMemoryResponseCacheBackend,
+    ResponseCache,
+    ResponseCacheBackend,
+    ResponseCacheStats,
+)
+from fastapi.testclient import TestClient
+
+calls: List[str] = []
+
+
+def dependency():
+    calls.append("dependency")
+
+
+def create_app(cache: ResponseCache) -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(cache=cache)
+
+    @router.get("/items/{item_id}", dependencies=[Depends(dependency)])
+    def read_item(item_id: str, q: Optional[str] = None, page: int = 1):
+        calls.append(f"read_item {item_id}")
+        return {"item_id": item_id, "q": q, "page": page}
+
+    @router.post("/items/{item_id}")
+    def update_item(item_id: str):
+        calls.append("update_item")
+        return {"item_id": item_id}
+
+    @router.get("/user")
+    def read_user(authorization: str = Header()):
+        calls.append("read_user")
+        return {"authorization": authorization}
+
+    @router.get("/cookie")
+    def read_cookie(response: Response):
+        calls.append("read_cookie")
+        response.set_cookie("session", "secret")
+        return "cookie"
+
+    @router.get("/missing")
+    def read_missing(response: Response):
+        calls.append("read_missing")
+        response.status_code = 404
+        return "missing"
+
+    @router.get("/uncached", cache=None)
+    def read_uncached():
+        calls.append("read_uncached")
+        return "uncached"
+
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def test_hit():
+    cache = ResponseCache(ttl=None)
+    client = TestClient(create_app(cache))
+    response = client.get("/items/foo?q=bar")
+    assert response.json() == {"item_id": "foo", "q": "bar", "page": 1}
+    cached_response = client.get("/items/foo?q=bar")
+    assert cached_response.status_code == 200
+    assert cached_response.headers == response.headers
+    assert cached_response.content == response.content
+    assert calls == ["dependency", "read_item foo"]
+    assert cache.stats == ResponseCacheStats(hits=1, misses=1, bypasses=0)
+
+
+def test_key():
+    cache = ResponseCache(query_params=["q"])
+    client = TestClient(create_app(cache))
+    client.get("/items/foo?q=bar")
+    client.get("/items/foo?q=baz")
+    client.get("/items/bar?q=bar")
+    # page is not part of the key
+    response = client.get("/items/foo?q=bar&page=2")
+    assert response.json() == {"item_id": "foo", "q": "bar", "page": 1}
+    assert calls.count("dependency") == 3
+    assert cache.stats.hits == 1
+
+
+def test_vary():
+    cache = ResponseCache(vary=["Authorization"])
+    client = TestClient(create_app(cache))
+    assert client.get("/user", headers={"Authorization": "a"}).json() == {
+        "authorization": "a"
+    }
+    assert client.get("/user", headers={"Authorization": "b"}).json() == {
+        "authorization": "b"
+    }
+    client.get("/user", headers={"Authorization": "a"})
+    assert calls == ["read_user", "read_user"]
+
+
+def test_not_cached():
+    cache = ResponseCache()
+    client = TestClient(create_app(cache))
+    for _ in range(2):
+        client.post("/items/foo")
+        client.get("/cookie")
+        client.get("/missing")
+        client.get("/uncached")
+    assert calls == ["update_item", "read_cookie", "read_missing", "read_uncached"] * 2
+    assert cache.stats == ResponseCacheStats(hits=0, misses=4, bypasses=2)
+
+
+def test_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    client = TestClient(create_app(ResponseCache(ttl=10)))
+    client.get("/items/foo")
+    now += 5
+    client.get("/items/foo")
+    assert calls == ["dependency", "read_item foo"]
+    now += 10
+    client.get("/items/foo")
+    assert calls == ["dependency", "read_item foo"] * 2
+
+
+def test_memory_bound():
+    backend = InMemoryResponseCacheBackend(max_memory=200)
+    cache = ResponseCache(backend=backend)
+    client = TestClient(create_app(cache))
+    for item_id in ("a", "b", "c"):
+        client.get(f"/items/{item_id}")
+    assert backend.size < 3
+    assert 0 < backend.memory <= 200
+    assert backend.evictions == 3 - backend.size
+    anyio.run(cache.clear)
+    assert backend.size == 0
+    assert backend.memory == 0
+
+
+def get_concurrently(app: FastAPI, path: str, count: int = 5) -> List[bytes]:
+    async def main() -> List[bytes]:
+        bodies: List[bytes] = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def request() -> None:
+            async def send(message):
+                if message["type"] == "http.response.body":
+                    bodies.append(message["body"])
+
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": path,
+                "root_path": "",
+                "query_string": b"",
+                "headers": [],
+                "scheme": "http",
+                "server": ("testserver", 80),
+            }
+            await app.router(scope, receive, send)
+
+        async with anyio.create_task_group() as task_group:
+            for _ in range(count):
+                task_group.start_soon(request)
+        return bodies
+
+    return anyio.run(main)
+
+
+def test_stampede():
+    cache = ResponseCache()
+    app = FastAPI()
+
+    @app.get("/slow", cache=cache)
+    async def read_slow():
+        calls.append("read_slow")
+        await anyio.sleep(0.05)
+        return "slow"
+
+    assert get_concurrently(app, "/slow") == [b'"slow"'] * 5
+    assert calls == ["read_slow"]
+    assert cache.stats == ResponseCacheStats(hits=4, misses=1, bypasses=0)
+
+
+def test_stampede_not_cacheable():
+    # Once the first response turns out not to be cacheable, the waiting requests
+    # don't wait for each other
+    cache = ResponseCache()
+    app = FastAPI()
+    running: List[int] = [0, 0]
+
+    @app.get("/cookie", cache=cache)
+    async def read_cookie(response: Response):
+        running[0] += 1
+        running[1] = max(running)
+        response.set_cookie("session", "secret")
+        await anyio.sleep(0.05)
+        running[0] -= 1
+        return "cookie"
+
+    assert get_concurrently(app, "/cookie") == [b'"cookie"'] * 5
+    assert running[1] == 4
+    assert cache.stats == ResponseCacheStats(hits=0, misses=5, bypasses=0)
+
+
+def test_backend_abstract_methods():
+    class IncompleteBackend(ResponseCacheBackend):
+        async def get(self, key: str) -> Optional[CachedResponse]:
+            return None  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()  # type: ignore[abstract]
+
+
+def test_custom_backend():
+    class DictBackend(ResponseCacheBackend):
+        def __init__(self) -> None:
+            self.responses = {}
+
+        async def get(self, key: str) -> Optional[CachedResponse]:
+            return self.responses.get(key)
+
+        async def set(
+            self, key: str, response: CachedResponse, *, ttl: Optional[float]
+        ) -> None:
+            self.responses[key] = response
+
+        async def clear(self) -> None:  # pragma: no cover
+            self.responses.clear()
+
+    backend = DictBackend()
+    client = TestClient(create_app(ResponseCache(backend=backend)))
+    client.get("/items/foo")
+    client.get("/items/foo")
+    assert calls == ["dependency", "read_item foo"]
+    assert list(backend.responses) == ["GET\n/items/foo\n"]
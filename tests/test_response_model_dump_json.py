@@ -0,0 +1,155 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi._compat import ModelField
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    description: Optional[str] = None
+    price: Decimal
+    created: datetime
+    tags: List[str] = []
+    internal_id: int = Field(alias="internalId")
+
+
+item_data = {
+    "name": "Portal Gun",
+    "price": Decimal("42.50"),
+    "created": datetime(2024, 1, 2, 3, 4, 5),
+    "tags": ["ñ", "💥"],
+    "internalId": 7,
+}
+
+
+def create_app(response_model_dump_json: bool) -> FastAPI:
+    app = FastAPI(response_model_dump_json=response_model_dump_json)
+    router = APIRouter()
+
+    @router.get("/items/", response_model=List[Item])
+    def read_items():
+        return [item_data, {**item_data, "description": "Plumbus"}]
+
+    @router.get(
+        "/items/exclude/",
+        response_model=Item,
+        response_model_exclude={"tags"},
+        response_model_exclude_none=True,
+        response_model_by_alias=False,
+    )
+    def read_item_exclude():
+        return item_data
+
+    @router.get(
+        "/items/include/",
+        response_model=Item,
+        response_model_include={"name", "price"},
+    )
+    def read_item_include():
+        return item_data
+
+    @router.get("/items/unset/", response_model=Item, response_model_exclude_unset=True)
+    def read_item_unset():
+        return item_data
+
+    @router.get("/items/invalid/", response_model=Item)
+    def read_invalid():
+        return {"name": "Portal Gun"}
+
+    @router.get("/items/orjson/", response_model=Item, response_class=ORJSONResponse)
+    def read_orjson():
+        return item_data
+
+    @router.get("/items/status/", response_model=Item, status_code=201)
+    def read_status():
+        return item_data
+
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture(name="clients")
+def get_clients():
+    return TestClient(create_app(False)), TestClient(create_app(True))
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/items/",
+        "/items/exclude/",
+        "/items/include/",
+        "/items/unset/",
+        "/items/orjson/",
+        "/items/status/",
+    ],
+)
+def test_same_response(clients, path: str):
+    default_client, dump_json_client = clients
+    expected = default_client.get(path)
+    response = dump_json_client.get(path)
+    assert response.status_code == expected.status_code
+    assert response.json() == expected.json()
+    assert response.headers == expected.headers
+
+
+@needs_pydanticv2
+def test_serialized_with_dump_json(clients, monkeypatch: pytest.MonkeyPatch):
+    _, client = clients
+    calls = []
+    serialize = ModelField.serialize
+
+    def spy(self, *args, **kwargs):
+        calls.append(self.name)  # pragma: no cover
+        return serialize(self, *args, **kwargs)  # pragma: no cover
+
+    monkeypatch.setattr(ModelField, "serialize", spy)
+    response = client.get("/items/exclude/")
+    assert calls == []
+    assert response.content == (
+        b'{"name":"Portal Gun","price":"42.50",'
+        b'"created":"2024-01-02T03:04:05","internal_id":7}'
+    )
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_response_validation(clients):
+    _, client = clients
+    with pytest.raises(ResponseValidationError):
+        client.get("/items/invalid/")
+
+
+def test_route_override():
+    app = FastAPI(response_model_dump_json=True)
+
+    @app.get("/", response_model=Item, response_model_dump_json=False)
+    def read_root():
+        return item_data
+
+    route = app.routes[-1]
+    assert route._response_model_dump_json is False
+
+
+@needs_pydanticv2
+@pytest.mark.parametrize("status_code", [204, 304])
+def test_no_body_status_code(status_code: int):
+    app = FastAPI(response_model_dump_json=True)
+
+    @app.get("/items/", response_model=Optional[Item])
+    def read_item(response: Response):
+        response.status_code = status_code
+        return None
+
+    response = TestClient(app).get("/items/")
+    assert response.status_code == status_code
+    assert response.content == b""
+    assert "content-length" not in response.headers
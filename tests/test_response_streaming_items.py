@@ -0,0 +1,259 @@
+import json
+from typing import AsyncIterator, Iterator, List
+
+import anyio
+import pytest
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Response
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import NDJSONResponse
+from fastapi.routing import STREAM_CHUNK_SIZE, stream_response_items
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+class ItemInDB(Item):
+    secret: str = "hidden"
+
+
+app = FastAPI()
+tasks: List[str] = []
+
+
+@app.get("/items/sync", response_model=List[Item])
+def read_items_sync():
+    for i in range(1000):
+        yield ItemInDB(name=f"item{i}", price=i)
+
+
+@app.get("/items/async", response_model=List[Item])
+async def read_items_async():
+    for i in range(3):
+        yield {"name": f"item{i}", "price": i}
+
+
+@app.get("/items/async-sync-iterator", response_model=List[Item])
+async def read_items_async_sync_iterator():
+    return iter([{"name": "item0"}])
+
+
+@app.get("/items/empty", response_model=List[Item])
+async def read_items_empty():
+    return iter([])
+
+
+@app.get("/items/no-model")
+async def read_items_no_model() -> AsyncIterator[dict]:
+    for i in range(2):
+        yield {"name": f"item{i}"}
+
+
+@app.get("/items/ndjson", response_model=List[Item], response_class=NDJSONResponse)
+async def read_items_ndjson(response: Response, background_tasks: BackgroundTasks):
+    response.headers["x-items"] = "ndjson"
+    background_tasks.add_task(tasks.append, "ndjson")
+
+    async def generate() -> AsyncIterator[ItemInDB]:
+        for i in range(3):
+            yield ItemInDB(name=f"item{i}", price=i)
+
+    return generate()
+
+
+@app.get("/items/ndjson-list", response_model=List[Item], response_class=NDJSONResponse)
+def read_items_ndjson_list():
+    return [{"name": "item0"}, {"name": "item1"}]
+
+
+@app.get("/items/ndjson-dict", response_model=Item, response_class=NDJSONResponse)
+def read_item_ndjson_dict():
+    return {"name": "item0"}
+
+
+@app.get("/items/ndjson-none", response_class=NDJSONResponse)
+def read_items_ndjson_none():
+    return None
+
+
+@app.delete("/items/ndjson", status_code=204, response_class=NDJSONResponse)
+def delete_items_ndjson():
+    return None
+
+
+@app.get(
+    "/items/exclude",
+    response_model=List[Item],
+    response_model_exclude={"__all__": {"price"}},
+    status_code=201,
+)
+def read_items_exclude() -> Iterator[Item]:
+    return iter([Item(name="item0")])
+
+
+@app.get("/items/invalid", response_model=List[Item])
+async def read_items_invalid():
+    yield {"name": "item0"}
+    yield {"price": "invalid"}
+
+
+db_state = {"open": False}
+
+
+async def get_db() -> AsyncIterator[dict]:
+    db_state["open"] = True
+    try:
+        yield db_state
+    finally:
+        db_state["open"] = False
+
+
+@app.get("/items/dependency")
+async def read_items_dependency(db: dict = Depends(get_db)):
+    for i in range(2):
+        yield {"name": f"item{i}", "db_open": db["open"]}
+
+
+@app.get("/items/error")
+async def read_items_error():
+    yield {"name": "item0"}
+    raise HTTPException(status_code=404, detail="Items not found")
+
+
+client = TestClient(app)
+
+
+def test_sync_iterator():
+    response = client.get("/items/sync")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [{"name": f"item{i}", "price": i} for i in range(1000)]
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/items/async", [{"name": f"item{i}", "price": i} for i in range(3)]),
+        ("/items/async-sync-iterator", [{"name": "item0", "price": 0}]),
+        ("/items/empty", []),
+        ("/items/no-model", [{"name": "item0"}, {"name": "item1"}]),
+    ],
+)
+def test_json_array(path: str, expected: list):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected
+
+
+def test_yield_dependency_open():
+    # The items are read before the exit code of the dependencies with yield
+    response = client.get("/items/dependency")
+    assert response.json() == [
+        {"name": "item0", "db_open": True},
+        {"name": "item1", "db_open": True},
+    ]
+    assert db_state["open"] is False
+
+
+def test_error_response():
+    response = client.get("/items/error")
+    assert response.status_code == 404, response.text
+    assert response.json() == {"detail": "Items not found"}
+
+
+def test_ndjson():
+    tasks.clear()
+    response = client.get("/items/ndjson")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["x-items"] == "ndjson"
+    assert response.text == (
+        '{"name":"item0","price":0.0}\n'
+        '{"name":"item1","price":1.0}\n'
+        '{"name":"item2","price":2.0}\n'
+    )
+    assert tasks == ["ndjson"]
+
+
+def test_ndjson_list():
+    response = client.get("/items/ndjson-list")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": "item0", "price": 0},
+        {"name": "item1", "price": 0},
+    ]
+
+
+def test_ndjson_dict():
+    response = client.get("/items/ndjson-dict")
+    assert response.status_code == 200, response.text
+    assert response.text == '{"name":"item0","price":0.0}\n'
+
+
+def test_ndjson_none():
+    response = client.get("/items/ndjson-none")
+    assert response.status_code == 200, response.text
+    assert response.content == b""
+    assert response.headers["content-length"] == "0"
+
+
+def test_ndjson_no_content():
+    response = client.delete("/items/ndjson")
+    assert response.status_code == 204, response.text
+    assert response.content == b""
+    assert "content-length" not in response.headers
+
+
+def test_response_model_exclude():
+    response = client.get("/items/exclude")
+    assert response.status_code == 201, response.text
+    assert response.json() == [{"name": "item0"}]
+
+
+def test_invalid_item():
+    with pytest.raises(ResponseValidationError):
+        client.get("/items/invalid")
+
+
+def test_openapi_schema():
+    response = client.get("/openapi.json")
+    operation = response.json()["paths"]["/items/ndjson"]["get"]
+    assert list(operation["responses"]["200"]["content"]) == ["application/x-ndjson"]
+
+
+@needs_pydanticv2
+def test_dump_json():
+    app = FastAPI(response_model_dump_json=True)
+
+    @app.get("/items", response_model=List[Item])
+    def read_items():
+        return (Item(name=f"item{i}") for i in range(2))
+
+    response = TestClient(app).get("/items")
+    assert response.content == (
+        b'[{"name":"item0","price":0.0},{"name":"item1","price":0.0}]'
+    )
+
+
+def test_chunks():
+    items = ({"name": "x" * 100} for _ in range(2000))
+
+    async def collect() -> List[bytes]:
+        return [
+            chunk
+            async for chunk in stream_response_items(
+                response_content=items, ndjson=True
+            )
+        ]
+
+    chunks = anyio.run(collect)
+    assert len(chunks) > 1
+    assert all(len(chunk) < STREAM_CHUNK_SIZE + 200 for chunk in chunks)
+    assert len(b"".join(chunks).splitlines()) == 2000
@@ -0,0 +1,192 @@
+from typing import List, Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import ResponseValidationError
+from fastapi.response_validation import (
+    ResponseValidationStats,
+    SampledResponseValidation,
+    sampled,
+)
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: Optional[float] = None
+
+
+class SubItem(Item):
+    secret: str
+
+
+def get_route(app: FastAPI, path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path:
+            return route
+    raise AssertionError(f"Route not found: {path}")  # pragma: no cover
+
+
+def create_app(**kwargs) -> FastAPI:
+    app = FastAPI(**kwargs)
+
+    @app.get("/item", response_model=Item)
+    def read_item():
+        return Item(name="Portal Gun", price=42)
+
+    @app.get("/items", response_model=List[Item])
+    def read_items():
+        return [Item(name="Portal Gun"), Item(name="Plumbus")]
+
+    @app.get("/dict", response_model=Item)
+    def read_dict():
+        return {"name": "Portal Gun", "price": 42}
+
+    @app.get("/subclass", response_model=Item)
+    def read_subclass():
+        return SubItem(name="Portal Gun", secret="hidden")
+
+    @app.get("/extra", response_model=Item)
+    def read_extra():
+        return {"name": "Portal Gun", "secret": "hidden"}
+
+    @app.get("/invalid", response_model=Item)
+    async def read_invalid():
+        return {"price": "not a number"}
+
+    @app.get("/invalid-int", response_model=int)
+    async def read_invalid_int():
+        return "not a number"
+
+    return app
+
+
+def test_always():
+    app = create_app()
+    client = TestClient(app)
+    assert client.get("/item").json() == {"name": "Portal Gun", "price": 42}
+    assert client.get("/dict").json() == {"name": "Portal Gun", "price": 42}
+    assert client.get("/subclass").json() == {"name": "Portal Gun", "price": None}
+    with pytest.raises(ResponseValidationError):
+        client.get("/invalid")
+    assert get_route(app, "/item").response_validation_stats == (
+        ResponseValidationStats(validated=1, failed=0, skipped=0)
+    )
+    assert get_route(app, "/invalid").response_validation_stats == (
+        ResponseValidationStats(validated=1, failed=1, skipped=0)
+    )
+
+
+def test_type_check_only():
+    app = create_app(response_validation="type-check-only")
+    client = TestClient(app)
+    assert client.get("/item").json() == {"name": "Portal Gun", "price": 42}
+    assert client.get("/items").json() == [
+        {"name": "Portal Gun", "price": None},
+        {"name": "Plumbus", "price": None},
+    ]
+    assert client.get("/dict").json() == {"name": "Portal Gun", "price": 42}
+    # Subclasses are validated, to filter out their extra fields
+    assert client.get("/subclass").json() == {"name": "Portal Gun", "price": None}
+    with pytest.raises(ResponseValidationError):
+        client.get("/invalid")
+    assert get_route(app, "/item").response_validation_stats.skipped == 1
+    assert get_route(app, "/items").response_validation_stats.skipped == 1
+    assert get_route(app, "/dict").response_validation_stats.validated == 1
+    assert get_route(app, "/subclass").response_validation_stats.validated == 1
+    assert get_route(app, "/invalid").response_validation_stats.failed == 1
+
+
+def test_never():
+    app = create_app(response_validation="never")
+    client = TestClient(app)
+    assert client.get("/item").json() == {"name": "Portal Gun", "price": 42}
+    assert client.get("/items").json() == [
+        {"name": "Portal Gun", "price": None},
+        {"name": "Plumbus", "price": None},
+    ]
+    response = client.get("/invalid-int")
+    assert response.status_code == 200, response.text
+    assert response.json() == "not a number"
+    assert get_route(app, "/item").response_validation_stats == (
+        ResponseValidationStats(validated=0, failed=0, skipped=1)
+    )
+    assert get_route(app, "/invalid-int").response_validation_stats == (
+        ResponseValidationStats(validated=0, failed=0, skipped=1)
+    )
+
+
+def test_never_filters_response_model():
+    # Data the response model can't filter without validating it is validated
+    app = create_app(response_validation="never")
+    client = TestClient(app)
+    assert client.get("/dict").json() == {"name": "Portal Gun", "price": 42}
+    assert client.get("/extra").json() == {"name": "Portal Gun", "price": None}
+    assert client.get("/subclass").json() == {"name": "Portal Gun", "price": None}
+    with pytest.raises(ResponseValidationError):
+        client.get("/invalid")
+    assert get_route(app, "/extra").response_validation_stats == (
+        ResponseValidationStats(validated=1, failed=0, skipped=0)
+    )
+
+
+@pytest.mark.parametrize(
+    "rate,validated,skipped", [(0, 0, 10), (1, 10, 0)], ids=["none", "all"]
+)
+def test_sampled(rate: float, validated: int, skipped: int):
+    app = create_app(response_validation=sampled(rate))
+    client = TestClient(app)
+    for _ in range(10):
+        response = client.get("/item")
+        assert response.json() == {"name": "Portal Gun", "price": 42}
+    route = get_route(app, "/item")
+    assert route.response_validation_stats == ResponseValidationStats(
+        validated=validated, failed=0, skipped=skipped
+    )
+    route.response_validation_metrics.reset()
+    assert route.response_validation_stats == ResponseValidationStats(0, 0, 0)
+
+
+def test_sampled_failures(monkeypatch: pytest.MonkeyPatch):
+    app = create_app(response_validation=sampled(0.5))
+    client = TestClient(app, raise_server_exceptions=False)
+    samples = iter([0.1, 0.9, 0.3, 0.7])
+    monkeypatch.setattr("random.random", lambda: next(samples))
+    status_codes = [client.get("/invalid-int").status_code for _ in range(4)]
+    assert status_codes == [500, 200, 500, 200]
+    stats = get_route(app, "/invalid-int").response_validation_stats
+    assert stats == ResponseValidationStats(validated=2, failed=2, skipped=2)
+
+
+def test_sample_rate_range():
+    assert sampled(0.25) == SampledResponseValidation(rate=0.25)
+    with pytest.raises(ValueError):
+        sampled(1.5)
+
+
+def test_override():
+    app = FastAPI(response_validation="never")
+    router = APIRouter(response_validation="type-check-only")
+
+    @router.get("/router", response_model=int)
+    def read_router():
+        return "invalid"
+
+    @router.get("/route", response_model=int, response_validation="always")
+    def read_route():
+        return "invalid"
+
+    app.include_router(router)
+
+    @app.get("/app", response_model=int)
+    def read_app():
+        return "invalid"
+
+    client = TestClient(app)
+    assert client.get("/app").status_code == 200
+    with pytest.raises(ResponseValidationError):
+        client.get("/router")
+    with pytest.raises(ResponseValidationError):
+        client.get("/route")
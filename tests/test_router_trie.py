@@ -0,0 +1,146 @@
+import pytest
+from fastapi import APIRouter, FastAPI, WebSocket
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from starlette.routing import Host, Mount, Route
+
+
+def get_app(route_trie: bool) -> FastAPI:
+    app = FastAPI(route_trie=route_trie)
+
+    @app.get("/users/me")
+    def read_me():
+        return "me"
+
+    @app.get("/users/{user_id}")
+    def read_user(user_id: str):
+        return f"user {user_id}"
+
+    @app.post("/users/{user_id:int}")
+    def update_user(user_id: int):
+        return f"updated {user_id}"
+
+    @app.get("/files/{file_path:path}")
+    def read_file(file_path: str):
+        return f"file {file_path}"
+
+    @app.get("/reports/{year}-{month}")
+    def read_report(year: int, month: int):
+        return f"report {year}/{month}"
+
+    @app.get("/items/")
+    def read_items():
+        return "items"
+
+    @app.websocket("/ws/{room}")
+    async def websocket_room(websocket: WebSocket, room: str):
+        await websocket.accept()
+        await websocket.send_text(f"room {room}")
+        await websocket.close()
+
+    router = APIRouter(route_trie=route_trie)
+
+    @router.get("/")
+    def read_sub_root():
+        return "sub root"
+
+    @router.get("/{name}")
+    def read_sub(name: str):
+        return f"sub {name}"
+
+    app.mount("/sub", router)
+    app.router.routes.append(
+        Host(
+            "api.example.com",
+            app=Route("/host", lambda request: PlainTextResponse("host")),
+        )
+    )
+    return app
+
+
+@pytest.fixture(name="client", params=[False, True], ids=["linear", "trie"])
+def get_client(request: pytest.FixtureRequest):
+    return TestClient(get_app(route_trie=request.param))
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/users/me", "me"),
+        ("/users/rick", "user rick"),
+        ("/files/a/b/c.txt", "file a/b/c.txt"),
+        ("/files/", "file "),
+        ("/reports/2024-05", "report 2024/5"),
+        ("/items/", "items"),
+        ("/sub/", "sub root"),
+        ("/sub/morty", "sub morty"),
+    ],
+)
+def test_get(client: TestClient, path: str, expected: str):
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected
+
+
+def test_convertor_precedence(client: TestClient):
+    response = client.post("/users/42")
+    assert response.status_code == 200, response.text
+    assert response.json() == "updated 42"
+
+
+def test_method_not_allowed(client: TestClient):
+    response = client.post("/users/rick")
+    assert response.status_code == 405, response.text
+    assert response.headers["allow"] == "GET"
+
+
+def test_not_found(client: TestClient):
+    response = client.get("/users/rick/extra")
+    assert response.status_code == 404, response.text
+    response = client.get("/nothing")
+    assert response.status_code == 404, response.text
+
+
+def test_redirect_slashes(client: TestClient):
+    response = client.get("/items", follow_redirects=False)
+    assert response.status_code == 307, response.text
+    assert response.headers["location"] == "http://testserver/items/"
+
+
+def test_host(client: TestClient):
+    response = client.get("http://api.example.com/host")
+    assert response.status_code == 200, response.text
+    assert response.text == "host"
+
+
+def test_websocket(client: TestClient):
+    with client.websocket_connect("/ws/general") as websocket:
+        assert websocket.receive_text() == "room general"
+
+
+def test_routes_added_after_first_request():
+    app = FastAPI(route_trie=True)
+    client = TestClient(app)
+
+    @app.get("/first")
+    def first():
+        return "first"
+
+    assert client.get("/first").json() == "first"
+    assert client.get("/second").status_code == 404
+
+    @app.get("/second")
+    def second():
+        return "second"
+
+    assert client.get("/second").json() == "second"
+
+
+def test_candidates_keep_route_order():
+    app = get_app(route_trie=True)
+    routes = app.router._get_route_trie().get_candidates("/users/me")
+    paths = [route.path for route in routes if not isinstance(route, Host)]
+    assert paths == ["/users/me", "/users/{user_id}", "/users/{user_id:int}"]
+    assert isinstance(routes[-1], Host)
+    mount_routes = app.router._get_route_trie().get_candidates("/sub/x")
+    assert any(isinstance(route, Mount) for route in mount_routes)
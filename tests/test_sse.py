@@ -0,0 +1,171 @@
+from typing import AsyncIterator, Iterator, List, Optional
+
+import anyio
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import EventSourceResponse, ServerSentEvent
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.types import Message
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+class ItemInDB(Item):
+    secret: str = "hidden"
+
+
+class FastPingEventSourceResponse(EventSourceResponse):
+    ping_interval = 0.01
+
+
+app = FastAPI()
+
+
+@app.get("/items", response_class=EventSourceResponse)
+async def stream_items(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> AsyncIterator[Item]:
+    start = 0 if last_event_id is None else int(last_event_id) + 1
+    for i in range(start, 3):
+        yield ServerSentEvent(data=ItemInDB(name=f"item{i}"), id=str(i), event="item")
+
+
+@app.get("/items/data", response_class=EventSourceResponse)
+def stream_items_data() -> Iterator[Item]:
+    yield ItemInDB(name="item0")
+    yield {"name": "item1", "price": 1}
+
+
+@app.get("/events", response_class=EventSourceResponse)
+async def stream_events() -> AsyncIterator[ServerSentEvent]:
+    yield ServerSentEvent(comment="hello")
+    yield ServerSentEvent(data="line1\nline2", retry=1000)
+    yield ServerSentEvent(data={"secret": "not validated"})
+
+
+@app.get("/invalid", response_class=EventSourceResponse)
+async def stream_invalid() -> AsyncIterator[Item]:
+    yield {"price": "invalid"}
+
+
+@app.get("/slow", response_class=FastPingEventSourceResponse)
+async def stream_slow():
+    await anyio.sleep(0.05)
+    yield "done"
+
+
+client = TestClient(app)
+
+
+def test_events_with_response_model():
+    response = client.get("/items")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == (
+        'event: item\nid: 0\ndata: {"name":"item0","price":0.0}\n\n'
+        'event: item\nid: 1\ndata: {"name":"item1","price":0.0}\n\n'
+        'event: item\nid: 2\ndata: {"name":"item2","price":0.0}\n\n'
+    )
+
+
+def test_last_event_id():
+    response = client.get("/items", headers={"Last-Event-ID": "1"})
+    assert response.text == (
+        'event: item\nid: 2\ndata: {"name":"item2","price":0.0}\n\n'
+    )
+
+
+def test_sync_iterator_data():
+    response = client.get("/items/data")
+    assert response.text == (
+        'data: {"name":"item0","price":0.0}\n\ndata: {"name":"item1","price":1.0}\n\n'
+    )
+
+
+def test_events():
+    response = client.get("/events")
+    assert response.text == (
+        ": hello\n\n"
+        "retry: 1000\ndata: line1\ndata: line2\n\n"
+        'data: {"secret":"not validated"}\n\n'
+    )
+
+
+def test_invalid_event_data():
+    with pytest.raises(ResponseValidationError):
+        client.get("/invalid")
+
+
+def test_ping():
+    response = client.get("/slow")
+    assert response.text.startswith(": ping\n\n")
+    assert response.text.endswith("data: done\n\n")
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        ServerSentEvent(event="a\nb"),
+        ServerSentEvent(id="a\rb"),
+        ServerSentEvent(id="a\0b"),
+    ],
+)
+def test_invalid_event(event: ServerSentEvent):
+    with pytest.raises(AssertionError):
+        event.encode()
+
+
+def test_response():
+    response = EventSourceResponse(
+        iter(["plain", ServerSentEvent(data=[1, 2], id="1")]),
+        headers={"cache-control": "no-store"},
+    )
+    app = FastAPI()
+    app.get("/")(lambda: response)
+    result = TestClient(app).get("/")
+    assert result.headers["cache-control"] == "no-store"
+    assert result.text == "data: plain\n\nid: 1\ndata: [1,2]\n\n"
+
+
+def test_stops_on_disconnect():
+    produced: List[int] = []
+
+    async def events() -> AsyncIterator[int]:
+        for i in range(1000):
+            produced.append(i)
+            yield i
+            await anyio.sleep(0.01)
+
+    response = EventSourceResponse(events())
+    messages: List[Message] = []
+
+    async def receive() -> Message:
+        await anyio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def main() -> None:
+        with anyio.fail_after(1):
+            await response({"type": "http"}, receive, send)
+
+    anyio.run(main)
+    assert 0 < len(produced) < 1000
+    assert messages[0]["type"] == "http.response.start"
+
+
+def test_openapi_schema():
+    schema = client.get("/openapi.json").json()
+    content = schema["paths"]["/items"]["get"]["responses"]["200"]["content"]
+    assert content == {
+        "text/event-stream": {"schema": {"$ref": "#/components/schemas/Item"}}
+    }
+    content = schema["paths"]["/events"]["get"]["responses"]["200"]["content"]
+    assert content == {"text/event-stream": {"schema": {}}}
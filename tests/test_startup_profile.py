@@ -0,0 +1,135 @@
+import json
+import tracemalloc
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.startup_profile import StartupProfile
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+def get_limit(limit: int = 10) -> int:
+    return limit
+
+
+router = APIRouter()
+
+
+@router.post("/items/", response_model=Item)
+def create_item(item: Item, limit: int = Depends(get_limit)):
+    return item
+
+
+def create_app(**kwargs) -> FastAPI:
+    app = FastAPI(**kwargs)
+
+    @app.get("/users/{user_id}")
+    def read_user(user_id: int):
+        return {"user_id": user_id}
+
+    app.include_router(router, prefix="/api")
+    return app
+
+
+def test_no_profile():
+    app = create_app()
+    assert app.startup_profile is None
+    app.openapi()
+
+
+def test_routes():
+    app = create_app(startup_profile=True)
+    profile = app.startup_profile
+    assert isinstance(profile, StartupProfile)
+    profile.stop()
+    entries = {(e.route, e.phase): e for e in profile.get_entries()}
+    assert entries.keys() >= {
+        ("GET /users/{user_id}", "get_dependant"),
+        ("GET /users/{user_id}", "get_body_field"),
+        ("POST /api/items/", "create_model_field"),
+        ("POST /api/items/", "create_cloned_field"),
+        ("POST /api/items/", "get_dependant"),
+        ("POST /api/items/", "get_body_field"),
+        ("POST /api/items/", "compile"),
+    }
+    assert ("GET /users/{user_id}", "create_model_field") not in entries
+    for entry in entries.values():
+        assert entry.calls == 1
+        assert entry.seconds >= 0
+        assert entry.memory is not None
+    routes = {entry.route: entry for entry in profile.get_routes()}
+    assert set(routes) == {"GET /users/{user_id}", "POST /api/items/"}
+    assert routes["POST /api/items/"].phase == "total"
+    assert routes["POST /api/items/"].calls == 5
+
+
+def test_openapi():
+    app = create_app(startup_profile=StartupProfile(trace_memory=False))
+    app.openapi()
+    app.openapi()
+    (entry,) = [e for e in app.startup_profile.get_entries() if e.phase == "openapi"]
+    assert entry.route == ""
+    assert entry.calls == 1
+    assert entry.memory is None
+
+
+def test_lazy_routes():
+    app = create_app(
+        lazy_routes=True, startup_profile=StartupProfile(trace_memory=False)
+    )
+    assert app.startup_profile.get_entries() == []
+    client = TestClient(app)
+    response = client.get("/users/3")
+    assert response.json() == {"user_id": 3}
+    routes = [entry.route for entry in app.startup_profile.get_routes()]
+    assert routes == ["GET /users/{user_id}"]
+
+
+def test_stop():
+    was_tracing = tracemalloc.is_tracing()
+    profile = StartupProfile()
+    assert tracemalloc.is_tracing()
+    profile.stop()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_report():
+    profile = StartupProfile(trace_memory=False)
+    for route in ["GET /a", "GET /b", "GET /c"]:
+        with profile.measure(route, "get_dependant"):
+            with profile.measure(route, "get_body_field"):
+                pass
+    data = json.loads(profile.to_json(sort_by="route"))
+    assert [route["route"] for route in data["routes"]] == [
+        "GET /a",
+        "GET /b",
+        "GET /c",
+    ]
+    assert data["entries"][0] == {
+        "route": "GET /a",
+        "phase": "get_body_field",
+        "calls": 1,
+        "seconds": data["entries"][0]["seconds"],
+        "memory": None,
+    }
+    table = profile.format_table(sort_by="phase", limit=2).splitlines()
+    assert table[0].split() == [
+        "Route",
+        "Phase",
+        "Calls",
+        "Time",
+        "(ms)",
+        "Memory",
+        "(KiB)",
+    ]
+    assert set(table[1]) == {"-", " "}
+    assert len(table) == 4
+    assert table[2].split()[:4] == ["GET", "/a", "get_body_field", "1"]
+    assert table[2].split()[-1] == "-"
+    table = profile.format_table(by_route=True, limit=None).splitlines()
+    assert len(table) == 5
+    assert table[2].split()[2] == "total"
@@ -0,0 +1,128 @@
+import threading
+from typing import List, Union
+
+from fastapi import Body, FastAPI, Query
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from .utils import needs_pydanticv2
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/items/")
+    def create_item(item: Item, limit: int = Query(10)) -> Item:
+        return item
+
+    @app.put("/items/{item_id}")
+    def update_item(item_id: int, item: Item, limit: int = Query(10)) -> Item:
+        return item
+
+    return app
+
+
+@needs_pydanticv2
+def test_fields_share_type_adapters():
+    app = create_app()
+    create_item, update_item = [
+        route for route in app.routes if isinstance(route, APIRoute)
+    ]
+    assert create_item.body_field is not None
+    assert update_item.body_field is not None
+    assert create_item.body_field._type_adapter is update_item.body_field._type_adapter
+    assert create_item.response_field is not None
+    assert update_item.response_field is not None
+    assert (
+        create_item.response_field._type_adapter
+        is update_item.response_field._type_adapter
+    )
+    create_limit, update_limit = (
+        route.dependant.query_params[0] for route in (create_item, update_item)
+    )
+    assert create_limit._type_adapter is update_limit._type_adapter
+    client = TestClient(app)
+    response = client.put("/items/1", json={"name": "Foo", "price": 2})
+    assert response.json() == {"name": "Foo", "price": 2.0}
+    response = client.post("/items/", params={"limit": "x"}, json={"name": "Foo"})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "limit"],
+        ["body", "price"],
+    ]
+
+
+@needs_pydanticv2
+def test_different_fields():
+    from fastapi._compat import ModelField, TypeAdapterCache
+    from pydantic.fields import FieldInfo
+
+    cache = TypeAdapterCache()
+
+    def get(annotation, field_info: FieldInfo):
+        field_info.annotation = annotation
+        return cache.get(field_info)
+
+    int_adapter = get(int, Query(1))
+    assert get(int, Query(1)) is int_adapter
+    assert get(int, Query(True)) is not int_adapter
+    assert get(int, Body(1)) is not int_adapter
+    assert get(int, Query(1, gt=0)) is not int_adapter
+    union_adapter = get(Union[int, str], Query())
+    assert get(Union[str, int], Query()) is not union_adapter
+    assert get(List[int], Query([1])) is get(List[int], Query([1]))
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 7
+    assert cache.stats.size == 7
+    # Unhashable values can't be compared, each field has its own TypeAdapter
+    field_info = Query(json_schema_extra={"items": [{"a": bytearray()}]})
+    assert get(int, field_info) is not get(int, field_info)
+    assert cache.stats.uncacheable == 2
+    cache.clear()
+    assert cache.stats.size == 0
+    field = ModelField(name="limit", field_info=Query(10, annotation=int))
+    assert field.validate("3") == (3, None)
+
+
+@needs_pydanticv2
+def test_max_size():
+    from fastapi._compat import TypeAdapterCache
+
+    cache = TypeAdapterCache(max_size=2)
+    first = cache.get(Query(annotation=int))
+    cache.get(Query(annotation=str))
+    assert cache.get(Query(annotation=int)) is first
+    cache.get(Query(annotation=float))
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 2
+    # str was the least recently used
+    assert cache.get(Query(annotation=int)) is first
+    cache.get(Query(annotation=str))
+    assert cache.stats.misses == 4
+
+
+@needs_pydanticv2
+def test_threads():
+    from fastapi._compat import TypeAdapterCache
+
+    cache = TypeAdapterCache()
+    adapters = []
+
+    def get_adapters() -> None:
+        for _ in range(100):
+            adapters.append(cache.get(Query(annotation=List[Item])))
+
+    threads = [threading.Thread(target=get_adapters) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(adapter) for adapter in adapters}) == 1
+    assert cache.stats.hits + cache.stats.misses == 400
+    assert cache.stats.size == 1